@@ -0,0 +1,279 @@
+"""
+Beam Deflection by Superposition
+
+Generalizes cantilever_beam.py to cantilevers (fixed at x = 0, free at
+x = L) and simply supported beams carrying any number of point loads,
+uniformly distributed loads (UDLs, full or partial) and applied moments.
+Closed-form Macaulay expressions give the deflection per unit load at
+every position; these kernels are cached, so each load case is simply a
+matrix product of load magnitudes with the kernel, and hundreds of load
+combinations are evaluated in one broadcast operation.
+
+Units: positions in m, loads in N (UDLs in N/m, moments in N·m), EI in
+N·m²; deflections are in m, positive downward. Applied moments are
+couples, positive clockwise; the bending moment (sagging positive) then
+jumps by +C across a couple C, for either support.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+SUPPORTS = ("cantilever", "simply_supported")
+
+# =============================================================================
+# UNIT-LOAD KERNELS (EI × DEFLECTION PER UNIT LOAD)
+# =============================================================================
+
+
+def _macaulay(x, a, power):
+    """Macaulay bracket <x - a>^power (zero where x < a)."""
+    return np.where(x >= a, np.maximum(x - a, 0.0) ** power, 0.0)
+
+
+def point_load_kernel(x, positions, span, support):
+    """
+    EI × deflection at positions x for a unit downward point load.
+
+    Args:
+        x: Positions along the beam, shape (n,) (m)
+        positions: Load positions, shape (k,) (m)
+        span: Beam length (m)
+        support: "cantilever" or "simply_supported"
+
+    Returns:
+        Array of shape (n, k)
+    """
+    x = np.asarray(x, dtype=float)[:, None]
+    a = np.asarray(positions, dtype=float)[None, :]
+
+    if support == "cantilever":
+        # EI v = (3a x² - x³ + <x - a>³) / 6
+        return (3 * a * x**2 - x**3 + _macaulay(x, a, 3)) / 6
+
+    # EI v = b x (L² - b² - x²) / (6L) + <x - a>³ / 6, with b = L - a
+    b = span - a
+    return (
+        b * x * (span**2 - b**2 - x**2) / (6 * span) + _macaulay(x, a, 3) / 6
+    )
+
+
+def udl_kernel(x, starts, ends, span, support):
+    """
+    EI × deflection at positions x for a unit UDL from start to end.
+
+    Args:
+        x: Positions along the beam, shape (n,) (m)
+        starts: Start of each UDL, shape (k,) (m)
+        ends: End of each UDL, shape (k,) (m)
+        span: Beam length (m)
+        support: "cantilever" or "simply_supported"
+
+    Returns:
+        Array of shape (n, k); the point-load kernel integrated over the
+        loaded length
+    """
+    x = np.asarray(x, dtype=float)[:, None]
+    a = np.asarray(starts, dtype=float)[None, :]
+    b = np.asarray(ends, dtype=float)[None, :]
+    tail = (_macaulay(x, a, 4) - _macaulay(x, b, 4)) / 24
+
+    if support == "cantilever":
+        return x**2 * (b**2 - a**2) / 4 - x**3 * (b - a) / 6 + tail
+
+    # Integrate b x (L² - b² - x²) / (6L) over the load, with u = L - s
+    u_start, u_end = span - b, span - a
+    return (
+        x * (span**2 - x**2) * (u_end**2 - u_start**2) / 2
+        - x * (u_end**4 - u_start**4) / 4
+    ) / (6 * span) + tail
+
+
+def moment_kernel(x, positions, span, support):
+    """
+    EI × deflection at positions x for a unit applied moment.
+
+    Args:
+        x: Positions along the beam, shape (n,) (m)
+        positions: Moment positions, shape (k,) (m)
+        span: Beam length (m)
+        support: "cantilever" or "simply_supported"
+
+    Returns:
+        Array of shape (n, k), for a clockwise couple
+    """
+    x = np.asarray(x, dtype=float)[:, None]
+    a = np.asarray(positions, dtype=float)[None, :]
+
+    if support == "cantilever":
+        # Hogging moment -C on 0 ≤ x < a: EI v = C (x² - <x - a>²) / 2
+        return (x**2 - _macaulay(x, a, 2)) / 2
+
+    # Reaction -C/L at x = 0: EI v = x³/(6L) - <x - a>²/2 + c1 x
+    c1 = (span - a) ** 2 / (2 * span) - span / 6
+    return x**3 / (6 * span) - _macaulay(x, a, 2) / 2 + c1 * x
+
+
+KERNELS = {
+    "point": point_load_kernel,
+    "udl": udl_kernel,
+    "moment": moment_kernel,
+}
+
+
+@lru_cache(maxsize=64)
+def _cached_kernel(kind, support, span, x_bytes, *location_bytes):
+    """Kernel for one load type, cached on the raw bytes of its inputs."""
+    x = np.frombuffer(x_bytes)
+    locations = [np.frombuffer(value) for value in location_bytes]
+    kernel = KERNELS[kind](x, *locations, span, support)
+    kernel.setflags(write=False)
+    return kernel
+
+
+def _kernel(kind, support, span, x, *locations):
+    """Look up (or compute and cache) a unit-load kernel."""
+    return _cached_kernel(
+        kind,
+        support,
+        float(span),
+        np.ascontiguousarray(x, dtype=float).tobytes(),
+        *(
+            np.ascontiguousarray(np.ravel(value), dtype=float).tobytes()
+            for value in locations
+        ),
+    )
+
+
+# =============================================================================
+# DEFLECTION BY SUPERPOSITION
+# =============================================================================
+
+
+def beam_deflection(
+    x,
+    span,
+    flexural_rigidity,
+    support="simply_supported",
+    point_loads=None,
+    udls=None,
+    moments=None,
+):
+    """
+    Deflection of a beam for one or many load cases by superposition.
+
+    Args:
+        x: Positions along the beam, shape (n,) (m)
+        span: Beam length (m)
+        flexural_rigidity: EI (N·m²)
+        support: "cantilever" or "simply_supported"
+        point_loads: Tuple (positions (k,), magnitudes (cases, k) or (k,))
+            of downward point loads (N)
+        udls: Tuple (starts (k,), ends (k,), intensities (cases, k) or
+            (k,)) of downward UDLs (N/m)
+        moments: Tuple (positions (k,), magnitudes (cases, k) or (k,))
+            of applied couples, positive clockwise (N·m)
+
+    Returns:
+        Deflections of shape (cases, n), or (n,) when every magnitude
+        array is one-dimensional (m, positive downward)
+    """
+    if support not in SUPPORTS:
+        raise ValueError(f"Unknown support: {support!r}")
+
+    x = np.asarray(x, dtype=float)
+    ei_deflection = np.zeros((1, x.size))
+    single_case = True
+
+    for kind, loads in (
+        ("point", point_loads),
+        ("udl", udls),
+        ("moment", moments),
+    ):
+        if loads is None:
+            continue
+        *locations, magnitudes = loads
+        magnitudes = np.asarray(magnitudes, dtype=float)
+        single_case &= magnitudes.ndim == 1
+
+        # (cases, k) @ (k, n) -> (cases, n): one product for every case
+        kernel = _kernel(kind, support, span, x, *locations)
+        ei_deflection = ei_deflection + np.atleast_2d(magnitudes) @ kernel.T
+
+    deflection = ei_deflection / flexural_rigidity
+    return deflection[0] if single_case else deflection
+
+
+if __name__ == "__main__":
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Cantilever of cantilever_beam.py
+    beam_length_m = 10.0  # Length (m)
+    young_modulus_pa = 200e9  # Young's modulus (Pa)
+    second_moment_area_m4 = 8.33e-6  # Second moment of area (m⁴)
+    point_load_n = 1000.0  # Point load at free end (N)
+
+    # Simply supported beam with several loads and many load combinations
+    span_m = 12.0  # Span (m)
+    point_positions_m = np.array([3.0, 6.0, 9.0])  # Point load positions
+    udl_starts_m = np.array([0.0, 4.0])  # UDL start positions
+    udl_ends_m = np.array([12.0, 8.0])  # UDL end positions
+    moment_positions_m = np.array([12.0])  # End moment position
+    combination_count = 500  # Number of load combinations
+
+    x_positions_m = np.linspace(0, span_m, 241)
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    ei_cantilever = young_modulus_pa * second_moment_area_m4
+    tip_deflection_m = beam_deflection(
+        [beam_length_m],
+        beam_length_m,
+        ei_cantilever,
+        "cantilever",
+        point_loads=([beam_length_m], [point_load_n]),
+    )[0]
+
+    # Load combinations: random factors on dead and imposed loads
+    rng = np.random.default_rng(5)
+    point_loads_n = rng.uniform(5e3, 40e3, (combination_count, 3))
+    udl_intensities_n_per_m = rng.uniform(1e3, 10e3, (combination_count, 2))
+    end_moments_n_m = rng.uniform(-20e3, 20e3, (combination_count, 1))
+
+    start_time_s = time.perf_counter()
+    deflections_m = beam_deflection(
+        x_positions_m,
+        span_m,
+        ei_cantilever * 100,
+        point_loads=(point_positions_m, point_loads_n),
+        udls=(udl_starts_m, udl_ends_m, udl_intensities_n_per_m),
+        moments=(moment_positions_m, end_moments_n_m),
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    worst_case, worst_station = np.unravel_index(
+        np.argmax(deflections_m), deflections_m.shape
+    )
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(f"Cantilever tip deflection    : {tip_deflection_m * 1000:.2f} mm")
+    print()
+    print(
+        f"Simply supported beam, {combination_count} load combinations "
+        f"× {x_positions_m.size} positions in {elapsed_time_s * 1000:.1f} ms"
+    )
+    print(
+        f"Maximum deflection           : "
+        f"{deflections_m[worst_case, worst_station] * 1000:.2f} mm "
+        f"at x = {x_positions_m[worst_station]:.2f} m "
+        f"(combination {worst_case})"
+    )
@@ -0,0 +1,245 @@
+"""
+Shear Force and Bending Moment Diagram Generator
+
+Evaluates the "Beam Calculations" of Applied Mechanics Formulae.qmd
+(ΣF = 0, ΣM = 0, point loads giving constant shear and linear moment,
+UDLs giving linear shear and parabolic moment) for simply supported
+beams and cantilevers with thousands of loads.
+
+Instead of summing every load at every station (O(n·m) for n stations
+and m loads), the loads are sorted once (skipped when they already are)
+and running sums of P, P·a and, for UDLs, w, w·s and w·s² are formed.
+The shear and moment at a station then follow from the running sums of
+the loads to its left. For sorted stations these are found by merging
+stations and loads in one linear pass, so the cost is O(n + m) after
+the load sort; unsorted stations use a binary search each.
+
+Units: positions in m, point loads in kN (downward positive), UDLs in
+kN/m, shear in kN and bending moment in kN·m (sagging positive).
+"""
+
+import numpy as np
+
+# =============================================================================
+# RUNNING-SUM HELPERS
+# =============================================================================
+
+
+def _is_sorted(values):
+    """True if values are in non-decreasing order (one O(n) pass)."""
+    return bool(np.all(values[1:] >= values[:-1]))
+
+
+def _count_left(stations, sorted_positions):
+    """
+    Number of sorted positions at or left of each station.
+
+    Sorted stations (the usual case) are merged with the positions in one
+    linear pass: a stable sort of two already sorted runs is a single
+    timsort merge, O(n + m). Unsorted stations fall back to one binary
+    search each.
+    """
+    if not _is_sorted(stations):
+        return np.searchsorted(sorted_positions, stations, side="right")
+
+    # Loads come first in the merge, so a load at a station is counted
+    merged = np.argsort(
+        np.concatenate([sorted_positions, stations]), kind="stable"
+    )
+    station_slots = np.flatnonzero(merged >= sorted_positions.size)
+    return station_slots - np.arange(stations.size)
+
+
+def _left_sums(stations, positions, weights, powers):
+    """
+    Sums of weight · position**p over the loads at or left of each station.
+
+    Args:
+        stations: Station positions, shape (n,)
+        positions: Load positions, shape (m,)
+        weights: Load weights, shape (m,)
+        powers: Powers p to accumulate, e.g. (0, 1)
+
+    Returns:
+        List of arrays of shape (n,), one per power
+    """
+    if _is_sorted(positions):
+        sorted_positions, sorted_weights = positions, weights
+    else:
+        order = np.argsort(positions, kind="stable")
+        sorted_positions = positions[order]
+        sorted_weights = weights[order]
+    count = _count_left(stations, sorted_positions)
+
+    sums = []
+    for power in powers:
+        running = np.concatenate(
+            [[0.0], np.cumsum(sorted_weights * sorted_positions**power)]
+        )
+        sums.append(running[count])
+    return sums
+
+
+# =============================================================================
+# SHEAR FORCE AND BENDING MOMENT
+# =============================================================================
+
+
+def shear_moment_diagram(
+    stations,
+    span,
+    support="simply_supported",
+    point_loads=None,
+    udls=None,
+):
+    """
+    Shear force and bending moment diagrams with their peak values.
+
+    Args:
+        stations: Positions to evaluate, shape (n,) (m)
+        span: Beam length (m); simply supported beams rest on x = 0 and
+            x = span, cantilevers are fixed at x = 0
+        support: "simply_supported" or "cantilever"
+        point_loads: Tuple (positions (m,), loads (m,)) in m and kN
+        udls: Tuple (starts (k,), ends (k,), intensities (k,)) in m and
+            kN/m
+
+    Returns:
+        Dictionary with:
+            shear_kn, moment_kn_m: Arrays of shape (n,); at a point load
+                the value just to the right of the load is returned
+            reaction_kn: Vertical reaction at x = 0
+            end_reaction_kn: Vertical reaction at x = span (zero for a
+                cantilever)
+            fixed_end_moment_kn_m: Moment at the fixed end (zero for a
+                simply supported beam)
+            max_shear_kn, max_shear_at_m: Largest |shear| and its position
+            max_sagging_kn_m, max_sagging_at_m: Largest sagging moment
+            max_hogging_kn_m, max_hogging_at_m: Largest hogging moment
+                (reported as a negative value)
+    """
+    stations = np.asarray(stations, dtype=float)
+    empty = np.zeros(0)
+    point_positions, point_values = (
+        (empty, empty)
+        if point_loads is None
+        else (np.asarray(value, dtype=float) for value in point_loads)
+    )
+    udl_starts, udl_ends, udl_values = (
+        (empty, empty, empty)
+        if udls is None
+        else (np.asarray(value, dtype=float) for value in udls)
+    )
+
+    # Resultant of every load and its moment about x = 0
+    udl_totals = udl_values * (udl_ends - udl_starts)
+    total_load = point_values.sum() + udl_totals.sum()
+    moment_about_origin = (point_values * point_positions).sum() + (
+        udl_totals * (udl_starts + udl_ends) / 2
+    ).sum()
+
+    # Reactions from ΣF = 0 and ΣM = 0
+    if support == "simply_supported":
+        end_reaction = moment_about_origin / span
+        reaction = total_load - end_reaction
+        fixed_end_moment = 0.0
+    elif support == "cantilever":
+        end_reaction = 0.0
+        reaction = total_load
+        fixed_end_moment = -moment_about_origin
+    else:
+        raise ValueError(f"Unknown support: {support!r}")
+
+    # Point loads left of x: ΣP and ΣP·a
+    sum_p, sum_pa = _left_sums(stations, point_positions, point_values, (0, 1))
+
+    # A UDL from s to e is +w starting at s plus -w starting at e; each
+    # started UDL adds w (x - s) to the shear and w (x - s)² / 2 to the
+    # moment, i.e. running sums of w, w·s and w·s²
+    udl_edges = np.concatenate([udl_starts, udl_ends])
+    udl_weights = np.concatenate([udl_values, -udl_values])
+    sum_w, sum_ws, sum_ws2 = _left_sums(
+        stations, udl_edges, udl_weights, (0, 1, 2)
+    )
+
+    shear = reaction - sum_p - (stations * sum_w - sum_ws)
+    moment = (
+        fixed_end_moment
+        + reaction * stations
+        - (stations * sum_p - sum_pa)
+        - (stations**2 * sum_w - 2 * stations * sum_ws + sum_ws2) / 2
+    )
+
+    max_shear_index = np.argmax(np.abs(shear))
+    max_sagging_index = np.argmax(moment)
+    max_hogging_index = np.argmin(moment)
+
+    return {
+        "shear_kn": shear,
+        "moment_kn_m": moment,
+        "reaction_kn": reaction,
+        "end_reaction_kn": end_reaction,
+        "fixed_end_moment_kn_m": fixed_end_moment,
+        "max_shear_kn": shear[max_shear_index],
+        "max_shear_at_m": stations[max_shear_index],
+        "max_sagging_kn_m": max(moment[max_sagging_index], 0.0),
+        "max_sagging_at_m": stations[max_sagging_index],
+        "max_hogging_kn_m": min(moment[max_hogging_index], 0.0),
+        "max_hogging_at_m": stations[max_hogging_index],
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    runway_span_m = 60.0  # Long crane runway beam (m)
+    wheel_count = 2_000  # Number of wheel loads on the beam
+    wheel_load_range_kn = (5.0, 25.0)  # Range of wheel loads (kN)
+    self_weight_kn_per_m = 3.5  # Beam self weight (kN/m)
+    rail_clip_udl_kn_per_m = 1.2  # Rail and clips over part of the span
+    station_count = 200_001  # Stations along the beam
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    rng = np.random.default_rng(11)
+    wheel_positions_m = rng.uniform(0, runway_span_m, wheel_count)
+    wheel_loads_kn = rng.uniform(*wheel_load_range_kn, wheel_count)
+    stations_m = np.linspace(0, runway_span_m, station_count)
+
+    start_time_s = time.perf_counter()
+    diagram = shear_moment_diagram(
+        stations_m,
+        runway_span_m,
+        point_loads=(wheel_positions_m, wheel_loads_kn),
+        udls=(
+            [0.0, 10.0],
+            [runway_span_m, 50.0],
+            [self_weight_kn_per_m, rail_clip_udl_kn_per_m],
+        ),
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(
+        f"{station_count:,} stations × {wheel_count:,} wheel loads "
+        f"in {elapsed_time_s * 1000:.1f} ms"
+    )
+    print(f"Left reaction      : {diagram['reaction_kn']:,.1f} kN")
+    print(f"Right reaction     : {diagram['end_reaction_kn']:,.1f} kN")
+    print(
+        f"Maximum shear      : {diagram['max_shear_kn']:,.1f} kN "
+        f"at x = {diagram['max_shear_at_m']:.3f} m"
+    )
+    print(
+        f"Maximum moment     : {diagram['max_sagging_kn_m']:,.1f} kN·m "
+        f"at x = {diagram['max_sagging_at_m']:.3f} m"
+    )
@@ -0,0 +1,203 @@
+"""
+Chunked Bending Stress Field over Beam Length and Depth
+
+Evaluates σ = M·y/I with y measured from the neutral axis (y_bar and
+I_na as in I-beam_calc.py and section_properties.py) on a grid of
+stations along the beam × points through the depth, for many load
+cases. Broadcasting cases × stations × depth points at once needs
+gigabytes for fine grids, so the field is produced in chunks of a fixed
+byte budget and reduced as it streams past: only the running peak
+tensile and compressive stresses and their locations are kept.
+
+Units: stations in m, moments in kN·m (sagging positive), section
+dimensions in mm and stresses in MPa (tension positive). Heights y are
+measured from the bottom face, so sagging gives tension below y_bar.
+"""
+
+import numpy as np
+
+# =============================================================================
+# STREAMING STRESS FIELD
+# =============================================================================
+
+
+def iter_stress_field(
+    moments_kn_m,
+    y_bar_mm,
+    i_na_mm4,
+    depth_mm,
+    depth_points=101,
+    chunk_bytes=4 * 2**20,
+):
+    """
+    Yield the bending stress field in chunks of (case, station) rows.
+
+    Args:
+        moments_kn_m: Bending moments, shape (cases, stations) or
+            (stations,) (kN·m)
+        y_bar_mm: Neutral axis height above the bottom face (mm)
+        i_na_mm4: Second moment of area about the neutral axis (mm⁴)
+        depth_mm: Overall section depth (mm)
+        depth_points: Points through the depth, bottom to top face
+        chunk_bytes: Memory budget for one chunk of stresses
+
+    Yields:
+        Tuple (rows, stress): rows is the slice of flattened
+        (case, station) indices in the chunk and stress is an array of
+        shape (rows, depth_points) (MPa)
+    """
+    moments = np.atleast_2d(np.asarray(moments_kn_m, dtype=float)).ravel()
+    heights_mm = np.linspace(0, depth_mm, depth_points)
+
+    # MPa per kN·m at each depth point: 1 kN·m = 1e6 N·mm
+    stress_per_moment = -1e6 * (heights_mm - y_bar_mm) / i_na_mm4
+
+    rows_per_chunk = max(1, chunk_bytes // (8 * depth_points))
+    for start in range(0, moments.size, rows_per_chunk):
+        rows = slice(start, min(start + rows_per_chunk, moments.size))
+        yield rows, np.multiply.outer(moments[rows], stress_per_moment)
+
+
+def peak_stresses(
+    stations_m,
+    moments_kn_m,
+    y_bar_mm,
+    i_na_mm4,
+    depth_mm,
+    depth_points=101,
+    chunk_bytes=4 * 2**20,
+):
+    """
+    Peak tensile and compressive bending stresses with their locations.
+
+    Args:
+        stations_m: Station positions, shape (stations,) (m)
+        moments_kn_m: Bending moments, shape (cases, stations) or
+            (stations,) (kN·m)
+        y_bar_mm, i_na_mm4, depth_mm: Section properties (mm, mm⁴)
+        depth_points: Points through the depth
+        chunk_bytes: Memory budget for one chunk of stresses
+
+    Returns:
+        Dictionary with, for "tension" and "compression", the peak
+        stress in MPa (max_tension_mpa, max_compression_mpa, the latter
+        negative) and its location (*_case, *_station_m, *_height_mm)
+    """
+    stations_m = np.asarray(stations_m, dtype=float)
+    heights_mm = np.linspace(0, depth_mm, depth_points)
+
+    # Running peaks as (stress, flattened row, depth point)
+    tension = (-np.inf, 0, 0)
+    compression = (np.inf, 0, 0)
+    for rows, stress in iter_stress_field(
+        moments_kn_m, y_bar_mm, i_na_mm4, depth_mm, depth_points, chunk_bytes
+    ):
+        row, point = divmod(int(np.argmax(stress)), depth_points)
+        if stress[row, point] > tension[0]:
+            tension = (stress[row, point], rows.start + row, point)
+        row, point = divmod(int(np.argmin(stress)), depth_points)
+        if stress[row, point] < compression[0]:
+            compression = (stress[row, point], rows.start + row, point)
+
+    results = {}
+    for kind, (value, row, point) in (
+        ("tension", tension),
+        ("compression", compression),
+    ):
+        case, station = divmod(row, stations_m.size)
+        results[f"max_{kind}_mpa"] = float(value)
+        results[f"max_{kind}_case"] = case
+        results[f"max_{kind}_station_m"] = stations_m[station]
+        results[f"max_{kind}_height_mm"] = heights_mm[point]
+    return results
+
+
+if __name__ == "__main__":
+    import time
+
+    from beam_shear_moment import shear_moment_diagram
+    from section_properties import i_section_parts, section_properties
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    span_m = 12.0  # Simply supported span (m)
+    station_count = 10_001  # Stations along the beam
+    depth_points = 201  # Points through the section depth
+    case_count = 100  # Load cases
+    wheel_count = 4  # Wheel loads per case
+    wheel_load_range_kn = (20.0, 120.0)  # Range of wheel loads (kN)
+    chunk_bytes = 4 * 2**20  # Memory budget per chunk (4 MiB)
+
+    # =========================================================================
+    # SECTION (I-beam_7_9.py asymmetric girder, scaled up)
+    # =========================================================================
+
+    section = section_properties(i_section_parts(240, 25, 560, 12, 320, 35))
+    y_bar_mm = section["y_bar_mm"][0]
+    i_na_mm4 = section["i_na_mm4"][0]
+    depth_mm = section["depth_mm"][0]
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    rng = np.random.default_rng(14)
+    stations_m = np.linspace(0, span_m, station_count)
+    moments_kn_m = np.array(
+        [
+            shear_moment_diagram(
+                stations_m,
+                span_m,
+                point_loads=(
+                    rng.uniform(0, span_m, wheel_count),
+                    rng.uniform(*wheel_load_range_kn, wheel_count),
+                ),
+            )["moment_kn_m"]
+            for _ in range(case_count)
+        ]
+    )
+
+    start_time_s = time.perf_counter()
+    peaks = peak_stresses(
+        stations_m,
+        moments_kn_m,
+        y_bar_mm,
+        i_na_mm4,
+        depth_mm,
+        depth_points,
+        chunk_bytes,
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    # Check: the peaks lie on the extreme fibres, σ = M y / I
+    max_moment_kn_m = moments_kn_m.max()
+    bottom_fibre_mpa = max_moment_kn_m * 1e6 * y_bar_mm / i_na_mm4
+    top_fibre_mpa = -max_moment_kn_m * 1e6 * (depth_mm - y_bar_mm) / i_na_mm4
+    full_field_bytes = moments_kn_m.size * depth_points * 8
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(
+        f"{case_count} cases × {station_count:,} stations × "
+        f"{depth_points} depth points in {elapsed_time_s:.2f} s"
+    )
+    print(
+        f"Memory: {chunk_bytes / 2**20:.0f} MiB chunks instead of "
+        f"{full_field_bytes / 2**30:.1f} GiB for the full field"
+    )
+    print(f"Neutral axis y_bar: {y_bar_mm:.1f} mm of {depth_mm:.0f} mm")
+    for kind in ("tension", "compression"):
+        print(
+            f"Peak {kind:<11}: {peaks[f'max_{kind}_mpa']:8.1f} MPa "
+            f"(case {peaks[f'max_{kind}_case']}, "
+            f"x = {peaks[f'max_{kind}_station_m']:.3f} m, "
+            f"y = {peaks[f'max_{kind}_height_mm']:.1f} mm)"
+        )
+    print(
+        f"Extreme fibre check: {bottom_fibre_mpa:.1f} MPa bottom, "
+        f"{top_fibre_mpa:.1f} MPa top"
+    )
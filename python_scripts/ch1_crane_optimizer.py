@@ -0,0 +1,234 @@
+"""
+Crane Geometry Optimizer - Adaptive Coarse-to-Fine Search
+
+Searches post height, jib length and tie length together, within user
+bounds, for the minimum total force, minimum jib force and minimum tie
+force configurations. Each level evaluates a small grid around each of
+the best few points found so far (using the batch solver in
+ch1_crane_force_solver.py) and then shrinks those search boxes, so
+millimetre resolution is reached in some tens of thousands of
+evaluations instead of a dense 3-D grid.
+"""
+
+import numpy as np
+
+from ch1_crane_force_solver import calculate_forces
+
+# =============================================================================
+# OBJECTIVES
+# =============================================================================
+
+OBJECTIVES = {
+    "total": lambda f_jib, f_tie: f_jib + f_tie,
+    "jib": lambda f_jib, f_tie: f_jib,
+    "tie": lambda f_jib, f_tie: f_tie,
+}
+
+# =============================================================================
+# OPTIMIZER FUNCTIONS
+# =============================================================================
+
+
+def optimize_geometry(
+    bounds,
+    load,
+    objective="total",
+    tolerance=1e-3,
+    points_per_axis=11,
+    min_angle_deg=0.0,
+    min_reach=0.0,
+    keep_best=8,
+    max_levels=100,
+):
+    """
+    Find the geometry that minimizes one force objective.
+
+    Args:
+        bounds: ((post_min, post_max), (jib_min, jib_max),
+                 (tie_min, tie_max)) in metres
+        load: Applied load force (kN)
+        objective: "total", "jib" or "tie"
+        tolerance: Final grid spacing on every axis (m)
+        points_per_axis: Grid points per axis at each refinement level
+        min_angle_deg: Smallest internal angle allowed (degrees), used to
+            reject sliver triangles that are not buildable
+        min_reach: Smallest horizontal reach of the jib tip from the
+            post (m), measured as jib · sin(angle between jib and post)
+        keep_best: Best points refined at each level, so the search can
+            follow several valleys of the objective at once
+        max_levels: Safety limit on the number of refinement levels
+
+    Returns:
+        Dictionary with the optimal post, jib and tie lengths, the member
+        forces and angles there, and the number of force evaluations
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective: {objective!r}")
+    if points_per_axis < 3:
+        raise ValueError("points_per_axis must be at least 3")
+
+    bounds = np.asarray(bounds, dtype=float)
+    lower_bounds, upper_bounds = bounds[:, 0], bounds[:, 1]
+    boxes = [(lower_bounds.copy(), upper_bounds.copy())]
+    score_function = OBJECTIVES[objective]
+    evaluations = 0
+    best_point, best_score = None, np.inf
+
+    for _ in range(max_levels):
+        # Build the grid of every box for this level (one axis per member)
+        points = []
+        for low, high in boxes:
+            axes = [
+                np.linspace(lo, hi, points_per_axis)
+                for lo, hi in zip(low, high)
+            ]
+            grid = np.meshgrid(*axes, indexing="ij")
+            points.append(np.stack([axis.ravel() for axis in grid], axis=1))
+        points = np.concatenate(points)
+        post, jib, tie = points.T
+        f_jib, f_tie, a_post, a_tie, a_jib, valid = calculate_forces(
+            post, jib, tie, load
+        )
+        evaluations += len(points)
+
+        # Reject invalid, sliver and short-reach triangles before scoring
+        min_angle = np.minimum(np.minimum(a_post, a_tie), a_jib)
+        reach = jib * np.sin(np.radians(a_tie))
+        feasible = valid & (min_angle >= min_angle_deg) & (reach >= min_reach)
+        score = np.where(feasible, score_function(f_jib, f_tie), np.inf)
+
+        # Keep the best distinct points: a single incumbent can lose the
+        # optimum when it runs along a constraint boundary
+        order = np.argsort(score, kind="stable")
+        order = order[np.isfinite(score[order])]
+        _, first = np.unique(points[order], axis=0, return_index=True)
+        survivors = order[np.sort(first)][:keep_best]
+        if survivors.size == 0:
+            if best_point is None:
+                raise ValueError(
+                    "No feasible geometry found within the bounds"
+                )
+            break
+        if score[survivors[0]] < best_score:
+            best_point, best_score = points[survivors[0]], score[survivors[0]]
+
+        # Stop once the grid spacing has reached the requested tolerance
+        spacing = np.max(
+            [(high - low) / (points_per_axis - 1) for low, high in boxes],
+            axis=0,
+        )
+        if np.all(spacing <= tolerance):
+            break
+
+        # Shrink a box to two grid cells either side of every survivor
+        half_width = 2 * spacing
+        boxes = [
+            (
+                np.maximum(points[index] - half_width, lower_bounds),
+                np.minimum(points[index] + half_width, upper_bounds),
+            )
+            for index in survivors
+        ]
+
+    f_jib, f_tie, a_post, a_tie, a_jib, _ = calculate_forces(*best_point, load)
+
+    return {
+        "post_m": best_point[0],
+        "jib_m": best_point[1],
+        "tie_m": best_point[2],
+        "force_in_jib_kn": float(f_jib),
+        "force_in_tie_kn": float(f_tie),
+        "total_force_kn": float(f_jib + f_tie),
+        "angle_at_post_deg": float(a_post),
+        "angle_at_tie_deg": float(a_tie),
+        "angle_at_jib_deg": float(a_jib),
+        "reach_m": float(best_point[1] * np.sin(np.radians(a_tie))),
+        "evaluations": evaluations,
+    }
+
+
+def optimize_all(bounds, load, **options):
+    """
+    Run optimize_geometry for the total, jib and tie force objectives.
+
+    Args:
+        bounds: Search bounds, as for optimize_geometry
+        load: Applied load force (kN)
+        **options: Passed through to optimize_geometry
+
+    Returns:
+        Dictionary of results keyed by objective name
+    """
+    return {
+        objective: optimize_geometry(bounds, load, objective, **options)
+        for objective in OBJECTIVES
+    }
+
+
+if __name__ == "__main__":
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    post_bounds_m = (6.0, 10.0)  # Post height range (m)
+    jib_bounds_m = (10.0, 16.0)  # Jib length range (m)
+    tie_bounds_m = (5.0, 20.0)  # Tie length range (m)
+    load_force_kn = 20.0  # Applied vertical load (kN)
+    tolerance_m = 0.001  # Required resolution (m)
+    min_angle_deg = 20.0  # Smallest buildable internal angle (degrees)
+    min_reach_m = 9.0  # Required horizontal reach of the jib tip (m)
+    check_spacing_m = 0.05  # Dense brute-force grid for the check (m)
+
+    # =========================================================================
+    # OPTIMIZATION
+    # =========================================================================
+
+    results = optimize_all(
+        (post_bounds_m, jib_bounds_m, tie_bounds_m),
+        load_force_kn,
+        tolerance=tolerance_m,
+        min_angle_deg=min_angle_deg,
+        min_reach=min_reach_m,
+    )
+
+    # Check: every objective on a dense grid over the whole box; the
+    # search should match or beat the best grid point
+    post, jib, tie = np.meshgrid(
+        *(
+            np.arange(lo, hi + check_spacing_m / 2, check_spacing_m)
+            for lo, hi in (post_bounds_m, jib_bounds_m, tie_bounds_m)
+        ),
+        indexing="ij",
+    )
+    f_jib, f_tie, a_post, a_tie, a_jib, valid = calculate_forces(
+        post, jib, tie, load_force_kn
+    )
+    feasible = (
+        valid
+        & (np.minimum(np.minimum(a_post, a_tie), a_jib) >= min_angle_deg)
+        & (jib * np.sin(np.radians(a_tie)) >= min_reach_m)
+    )
+    dense_best_kn = {
+        objective: np.where(feasible, score(f_jib, f_tie), np.inf).min()
+        for objective, score in OBJECTIVES.items()
+    }
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    for objective, result in results.items():
+        print(f"Minimum {objective} force configuration:")
+        print(f"  Post length: {result['post_m']:.3f} m")
+        print(f"  Jib length : {result['jib_m']:.3f} m")
+        print(f"  Tie length : {result['tie_m']:.3f} m")
+        print(f"  Jib force  : {result['force_in_jib_kn']:.3f} kN")
+        print(f"  Tie force  : {result['force_in_tie_kn']:.3f} kN")
+        print(f"  Total      : {result['total_force_kn']:.3f} kN")
+        print(f"  Jib angle  : {result['angle_at_jib_deg']:.2f}°")
+        print(f"  Reach      : {result['reach_m']:.3f} m")
+        print(f"  Evaluations: {result['evaluations']:,}")
+        print(
+            f"  Dense grid ({post.size:,} points, "
+            f"{check_spacing_m} m): {dense_best_kn[objective]:.3f} kN\n"
+        )
@@ -0,0 +1,214 @@
+"""
+Crane Design-Space Sweep - Multi-Core with Memory-Mapped Output
+
+Sweeps every combination of post, jib, tie and load values through the
+batch force solver in ch1_crane_force_solver.py. The parameter hypercube
+is split into chunks of flat indices that are solved in a process pool;
+each worker writes its rows straight into a shared memory-mapped .npy
+file, so results are never pickled back to the parent and the sweep size
+is limited by disk rather than RAM.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ch1_crane_force_solver import calculate_forces
+
+# Output columns, in order, for every point of the sweep
+RESULT_COLUMNS = (
+    "force_in_jib_kn",
+    "force_in_tie_kn",
+    "angle_at_post_deg",
+    "angle_at_tie_deg",
+    "angle_at_jib_deg",
+)
+
+# =============================================================================
+# SWEEP FUNCTIONS
+# =============================================================================
+
+
+def _solve_chunk(output_path, axes, start, stop):
+    """
+    Solve one chunk of flat sweep indices and write it to the output file.
+
+    Args:
+        output_path: Path of the memory-mapped .npy results file
+        axes: Tuple of 1-D arrays (posts, jibs, ties, loads)
+        start: First flat index of the chunk
+        stop: One past the last flat index of the chunk
+
+    Returns:
+        Number of valid geometries in the chunk
+    """
+    grid_shape = tuple(len(axis) for axis in axes)
+    indices = np.unravel_index(np.arange(start, stop), grid_shape)
+    post, jib, tie, load = (axis[index] for axis, index in zip(axes, indices))
+
+    *results, valid = calculate_forces(post, jib, tie, load)
+
+    output = np.load(output_path, mmap_mode="r+")
+    output[start:stop] = np.stack(results, axis=1)
+    output.flush()
+    del output
+
+    return int(valid.sum())
+
+
+def run_sweep(
+    output_path,
+    posts,
+    jibs,
+    ties,
+    loads,
+    chunk_size=200_000,
+    workers=None,
+    dtype=np.float32,
+):
+    """
+    Solve the full post × jib × tie × load hypercube in a process pool.
+
+    Args:
+        output_path: Path of the .npy file to create for the results
+        posts: 1-D array of post lengths (m)
+        jibs: 1-D array of jib lengths (m)
+        ties: 1-D array of tie lengths (m)
+        loads: 1-D array of applied loads (kN)
+        chunk_size: Number of sweep points solved per task; each point
+            needs about 160 bytes of float64 temporaries in a worker, so
+            the default keeps a worker near 32 MB
+        workers: Number of worker processes (default: all CPUs)
+        dtype: Floating point type of the stored results
+
+    Returns:
+        Number of valid geometries in the sweep. The results file holds
+        one row per point (C order over the four axes) with the columns
+        listed in RESULT_COLUMNS; invalid triangles are NaN.
+    """
+    axes = tuple(
+        np.asarray(axis, dtype=float).ravel()
+        for axis in (posts, jibs, ties, loads)
+    )
+    total_points = int(np.prod([len(axis) for axis in axes]))
+
+    # Create the shared output file up front; workers reopen it in r+ mode
+    output = np.lib.format.open_memmap(
+        output_path,
+        mode="w+",
+        dtype=dtype,
+        shape=(total_points, len(RESULT_COLUMNS)),
+    )
+    del output
+
+    starts = range(0, total_points, chunk_size)
+    stops = [min(start + chunk_size, total_points) for start in starts]
+    workers = workers or os.cpu_count()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        valid_counts = executor.map(
+            _solve_chunk,
+            [output_path] * len(stops),
+            [axes] * len(stops),
+            starts,
+            stops,
+        )
+        return sum(valid_counts)
+
+
+def load_sweep(output_path, posts, jibs, ties, loads):
+    """
+    Open a finished sweep as a read-only grid without loading it into RAM.
+
+    Args:
+        output_path: Path of the .npy results file
+        posts, jibs, ties, loads: The axes used for the sweep
+
+    Returns:
+        Memory-mapped array of shape
+        (n_posts, n_jibs, n_ties, n_loads, len(RESULT_COLUMNS))
+    """
+    grid_shape = tuple(len(axis) for axis in (posts, jibs, ties, loads))
+    results = np.load(output_path, mmap_mode="r")
+    return results.reshape(grid_shape + (len(RESULT_COLUMNS),))
+
+
+def sweep_minimum(output_path, columns=(0, 1), chunk_size=1_000_000):
+    """
+    Smallest sum of result columns, read from the file chunk by chunk.
+
+    Args:
+        output_path: Path of the .npy results file
+        columns: Result columns summed per point, e.g. (0, 1) for the
+            total member force (see RESULT_COLUMNS)
+        chunk_size: Rows read into memory at a time
+
+    Returns:
+        (value, flat_index): the minimum (ignoring invalid NaN rows) and
+        its flat sweep index, (NaN, -1) if every row is invalid
+    """
+    results = np.load(output_path, mmap_mode="r")
+    best_value, best_index = np.inf, -1
+    for start in range(0, len(results), chunk_size):
+        rows = np.asarray(results[start : start + chunk_size, list(columns)])
+        values = rows.sum(axis=1, dtype=float)
+        if np.all(np.isnan(values)):
+            continue
+        index = int(np.nanargmin(values))
+        if values[index] < best_value:
+            best_value, best_index = values[index], start + index
+    del results
+    if best_index < 0:
+        return np.nan, -1
+    return best_value, best_index
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    post_lengths_m = np.linspace(6, 10, 41)  # Post heights (m)
+    jib_lengths_m = np.linspace(10, 16, 61)  # Jib lengths (m)
+    tie_lengths_m = np.linspace(5, 20, 151)  # Tie lengths (m)
+    loads_kn = np.linspace(10, 40, 31)  # Applied loads (kN)
+
+    # =========================================================================
+    # SWEEP
+    # =========================================================================
+
+    results_path = os.path.join(tempfile.gettempdir(), "crane_sweep.npy")
+
+    start_time_s = time.perf_counter()
+    valid_points = run_sweep(
+        results_path, post_lengths_m, jib_lengths_m, tie_lengths_m, loads_kn
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    # Stream the results file rather than loading the whole grid
+    grid_shape = tuple(
+        len(axis)
+        for axis in (post_lengths_m, jib_lengths_m, tie_lengths_m, loads_kn)
+    )
+    min_total_kn, best_index = sweep_minimum(results_path)
+    best = np.unravel_index(best_index, grid_shape)
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(f"Sweep points   : {int(np.prod(grid_shape)):,}")
+    print(f"Valid points   : {valid_points:,}")
+    print(f"Elapsed time   : {elapsed_time_s:.2f} s")
+    print(f"Results file   : {results_path}")
+    print(
+        f"Minimum total  : {min_total_kn:.3f} kN at "
+        f"post {post_lengths_m[best[0]]:.2f} m, "
+        f"jib {jib_lengths_m[best[1]]:.2f} m, "
+        f"tie {tie_lengths_m[best[2]]:.2f} m, "
+        f"load {loads_kn[best[3]]:.1f} kN"
+    )
@@ -0,0 +1,202 @@
+"""
+Lift Plan Solver - N Slings, Batch Evaluation
+
+Generalizes the two-sling law-of-sines scripts (ch1_sling_equilateral.py,
+ch1_rope_tension.py) to any number of slings meeting at one crane hook.
+For every load case the load is first allowed to tilt until its centre
+of gravity hangs directly below the hook, then the sling tensions are
+found from equilibrium of forces at the hook. Thousands of load cases
+(for example different hook offsets) are solved in one vectorized call.
+"""
+
+import numpy as np
+
+# =============================================================================
+# GEOMETRY HELPERS
+# =============================================================================
+
+
+def _hanging_rotation(cog_offset):
+    """
+    Rotation matrices that turn each hook-to-CoG vector straight down.
+
+    Args:
+        cog_offset: Array (cases, 3) of vectors from hook to CoG
+
+    Returns:
+        Tuple (rotation, tilt_deg) with rotation of shape (cases, 3, 3)
+        (smallest rotation, Rodrigues' formula) and the tilt angle
+    """
+    offset_length = np.linalg.norm(cog_offset, axis=-1, keepdims=True)
+    if np.any(offset_length == 0):
+        raise ValueError("The CoG cannot be at the hook")
+    a = cog_offset / offset_length
+    b = np.array([0.0, 0.0, -1.0])
+
+    axis = np.cross(a, b)
+    sin_angle = np.linalg.norm(axis, axis=-1)
+    cos_angle = a @ b
+
+    # Straight above the hook the 180° turn has no unique axis
+    if np.any((sin_angle <= 1e-12) & (cos_angle < 0)):
+        raise ValueError("The CoG cannot be directly above the hook")
+
+    # Skew-symmetric cross-product matrix [k]x for each case
+    skew = np.zeros(a.shape[:-1] + (3, 3))
+    skew[..., 0, 1], skew[..., 0, 2] = -axis[..., 2], axis[..., 1]
+    skew[..., 1, 0], skew[..., 1, 2] = axis[..., 2], -axis[..., 0]
+    skew[..., 2, 0], skew[..., 2, 1] = -axis[..., 1], axis[..., 0]
+
+    # R = I + [k]x + [k]x² (1 - cos) / sin²; no rotation when already hanging
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = np.where(
+            sin_angle > 1e-12, (1 - cos_angle) / sin_angle**2, 0.0
+        )
+    rotation = np.eye(3) + skew + (skew @ skew) * factor[..., None, None]
+    tilt_deg = np.degrees(np.arctan2(sin_angle, cos_angle))
+
+    return rotation, tilt_deg
+
+
+# =============================================================================
+# LIFT PLAN SOLVER
+# =============================================================================
+
+
+def solve_lift(attachments, cog, hook, load):
+    """
+    Solve sling tensions and angles for a batch of lift cases.
+
+    Args:
+        attachments: Sling attachment points on the load, shape (N, 3) or
+            (cases, N, 3), in metres with z vertically up
+        cog: Centre of gravity of the load, shape (3,) or (cases, 3)
+        hook: Crane hook position, shape (3,) or (cases, 3)
+        load: Weight of the load (kN), scalar or shape (cases,)
+
+    With N = 2 (in the plane of the CoG) or N = 3 slings the tensions are
+    statically determinate. With N > 3 the system is indeterminate and the
+    minimum-norm tension distribution is returned, which shares the load
+    equally between symmetric slings.
+
+    Returns:
+        Dictionary of arrays:
+            tension_kn: Sling tensions, shape (cases, N); negative values
+                mean the sling would go slack
+            angle_to_horizontal_deg: Sling angles, shape (cases, N)
+            sling_length_m: Sling lengths, shape (cases, N)
+            tilt_deg: Tilt of the load needed to hang CoG below the hook
+            residual_kn: Out-of-balance force left by the solution (zero
+                for a determinate, consistent case)
+            slack: True where any sling is in compression
+    """
+    attachments = np.asarray(attachments, dtype=float)
+    hook = np.asarray(hook, dtype=float)
+    cog = np.asarray(cog, dtype=float)
+    cases = np.broadcast_shapes(
+        attachments.shape[:-2],
+        cog.shape[:-1],
+        hook.shape[:-1],
+        np.shape(load),
+    )
+    attachments = np.broadcast_to(attachments, cases + attachments.shape[-2:])
+    cog = np.broadcast_to(cog, cases + (3,))
+    hook = np.broadcast_to(hook, cases + (3,))
+    load = np.broadcast_to(np.asarray(load, dtype=float), cases)
+
+    # Tilt the load about the hook so that the CoG hangs directly below it
+    rotation, tilt_deg = _hanging_rotation(cog - hook)
+    relative = (attachments - hook[..., None, :]) @ np.swapaxes(
+        rotation, -1, -2
+    )
+
+    # Unit vectors from each attachment point up to the hook
+    sling_vectors = -relative
+    sling_length_m = np.linalg.norm(sling_vectors, axis=-1)
+    unit_vectors = sling_vectors / sling_length_m[..., None]
+
+    # Equilibrium at the hook: Σ T_i u_i = W ẑ (three equations, N unknowns)
+    direction_matrix = np.swapaxes(unit_vectors, -1, -2)
+    weight_vector = np.zeros(cases + (3,))
+    weight_vector[..., 2] = load
+    inverse_matrix = np.linalg.pinv(direction_matrix)
+    tension_kn = np.einsum("...ij,...j->...i", inverse_matrix, weight_vector)
+
+    residual = (
+        np.einsum("...ij,...j->...i", direction_matrix, tension_kn)
+        - weight_vector
+    )
+    angle_to_horizontal_deg = np.degrees(np.arcsin(unit_vectors[..., 2]))
+
+    return {
+        "tension_kn": tension_kn,
+        "angle_to_horizontal_deg": angle_to_horizontal_deg,
+        "sling_length_m": sling_length_m,
+        "tilt_deg": tilt_deg,
+        "residual_kn": np.linalg.norm(residual, axis=-1),
+        "slack": np.any(tension_kn < 0, axis=-1),
+    }
+
+
+if __name__ == "__main__":
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Two slings forming an equilateral triangle (ch1_sling_equilateral.py)
+    vertical_load_kn = 30.0  # Total vertical load (kN)
+    two_sling_points_m = [[-1.0, 0.0, 0.0], [1.0, 0.0, 0.0]]
+    two_sling_hook_m = [0.0, 0.0, np.sqrt(3.0)]
+
+    # Four-leg lift of a 12 m × 4 m module with an off-centre CoG
+    module_weight_kn = 400.0  # Module weight (kN)
+    four_leg_points_m = [
+        [-6.0, -2.0, 0.0],
+        [6.0, -2.0, 0.0],
+        [6.0, 2.0, 0.0],
+        [-6.0, 2.0, 0.0],
+    ]
+    module_cog_m = [0.8, 0.3, -0.5]
+    hook_height_m = 8.0  # Hook height above the lifting points (m)
+    hook_offsets_m = np.linspace(-1.0, 1.0, 2001)  # Hook offsets along x
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    two_sling = solve_lift(
+        two_sling_points_m,
+        [0.0, 0.0, -0.5],
+        two_sling_hook_m,
+        vertical_load_kn,
+    )
+
+    hooks_m = np.zeros((hook_offsets_m.size, 3))
+    hooks_m[:, 0] = module_cog_m[0] + hook_offsets_m
+    hooks_m[:, 1] = module_cog_m[1]
+    hooks_m[:, 2] = hook_height_m
+    four_leg = solve_lift(
+        four_leg_points_m, module_cog_m, hooks_m, module_weight_kn
+    )
+    worst_case = np.argmax(four_leg["tension_kn"].max(axis=1))
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print("Two-sling lift:")
+    print(f"  Tension in each sling : {two_sling['tension_kn'][0]:.4f} kN")
+    print(
+        f"  Sling angle           : "
+        f"{two_sling['angle_to_horizontal_deg'][0]:.2f}°"
+    )
+    print()
+    print(f"Four-leg lift, {hook_offsets_m.size:,} hook positions:")
+    print(f"  Worst hook offset     : {hook_offsets_m[worst_case]:+.3f} m")
+    print(
+        f"  Load tilt             : "
+        f"{four_leg['tilt_deg'][worst_case]:.2f}°"
+    )
+    for leg, tension in enumerate(four_leg["tension_kn"][worst_case], 1):
+        print(f"  Leg {leg} tension         : {tension:.2f} kN")
+    print(f"  Cases with slack legs : {four_leg['slack'].sum()}")
@@ -0,0 +1,251 @@
+"""
+Sparse Planar Truss Solver (Method of Joints)
+
+Extends the three-member jib-tie-post triangle to pin-jointed plane
+trusses of any size. The two equilibrium equations at every joint are
+assembled into one sparse matrix whose unknowns are the member forces
+and support reactions. The matrix is factorized once with a sparse LU
+decomposition and reused for as many load cases as required, so only
+the load vectors change between solves.
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+# =============================================================================
+# ASSEMBLY
+# =============================================================================
+
+
+def assemble_equilibrium_matrix(nodes, members, supports):
+    """
+    Assemble the method-of-joints equilibrium matrix.
+
+    Args:
+        nodes: Joint coordinates, shape (n, 2), in metres
+        members: Joint index pairs for each member, shape (m, 2)
+        supports: Restrained directions, shape (r, 2), each row being
+            (joint index, direction) with direction 0 = x and 1 = y
+
+    Returns:
+        Sparse CSC matrix of shape (2n, m + r). Row 2i + d is equilibrium
+        of joint i in direction d; columns are the member forces (tension
+        positive) followed by the support reactions.
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    members = np.asarray(members, dtype=int)
+    supports = np.asarray(supports, dtype=int).reshape(-1, 2)
+    member_count = len(members)
+
+    # Direction cosines from the first joint towards the second joint
+    start, end = members[:, 0], members[:, 1]
+    member_vectors = nodes[end] - nodes[start]
+    member_lengths = np.linalg.norm(member_vectors, axis=1)
+    if np.any(member_lengths == 0):
+        raise ValueError("Truss has a member of zero length")
+    cosines = member_vectors / member_lengths[:, None]
+
+    # A member in tension pulls each end joint towards the other end
+    member_index = np.arange(member_count)
+    rows = np.concatenate([2 * start, 2 * start + 1, 2 * end, 2 * end + 1])
+    columns = np.tile(member_index, 4)
+    values = np.concatenate(
+        [cosines[:, 0], cosines[:, 1], -cosines[:, 0], -cosines[:, 1]]
+    )
+
+    # Each reaction acts directly on its joint in its direction
+    reaction_rows = 2 * supports[:, 0] + supports[:, 1]
+    reaction_columns = member_count + np.arange(len(supports))
+
+    matrix = sparse.coo_matrix(
+        (
+            np.concatenate([values, np.ones(len(supports))]),
+            (
+                np.concatenate([rows, reaction_rows]),
+                np.concatenate([columns, reaction_columns]),
+            ),
+        ),
+        shape=(2 * len(nodes), member_count + len(supports)),
+    )
+
+    return matrix.tocsc()
+
+
+# =============================================================================
+# SOLVER
+# =============================================================================
+
+
+def factorize_truss(nodes, members, supports):
+    """
+    Factorize a statically determinate truss for repeated load cases.
+
+    Args:
+        nodes: Joint coordinates, shape (n, 2), in metres
+        members: Joint index pairs for each member, shape (m, 2)
+        supports: Restrained directions, shape (r, 2)
+
+    Returns:
+        Function solve(loads) where loads has shape (n, 2) or
+        (cases, n, 2) in kN. It returns a tuple (member_forces,
+        reactions) of shape (m,) and (r,), or (cases, m) and (cases, r);
+        member forces are positive in tension.
+    """
+    matrix = assemble_equilibrium_matrix(nodes, members, supports)
+    equation_count, unknown_count = matrix.shape
+    member_count = len(members)
+
+    if equation_count != unknown_count:
+        raise ValueError(
+            f"Truss is not statically determinate: {equation_count} "
+            f"equations for {unknown_count} unknowns (m + r must equal 2n)"
+        )
+
+    try:
+        factorization = splu(matrix)
+    except RuntimeError as error:
+        raise ValueError("Truss is a mechanism (singular matrix)") from error
+
+    def solve(loads):
+        loads = np.asarray(loads, dtype=float)
+        single_case = loads.ndim == 2
+
+        # Σ F + R + P = 0 at every joint, so solve A x = -P
+        load_vectors = -loads.reshape(-1, equation_count).T
+        unknowns = factorization.solve(np.ascontiguousarray(load_vectors)).T
+
+        member_forces = unknowns[:, :member_count]
+        reactions = unknowns[:, member_count:]
+        if single_case:
+            return member_forces[0], reactions[0]
+        return member_forces, reactions
+
+    return solve
+
+
+def pratt_truss(panel_count, panel_length, depth):
+    """
+    Build a simply supported Pratt truss (lattice boom or gantry girder).
+
+    Args:
+        panel_count: Number of panels
+        panel_length: Length of each panel (m)
+        depth: Depth between chord centre lines (m)
+
+    Returns:
+        Tuple (nodes, members, supports). Bottom chord joints are numbered
+        0..panel_count, top chord joints follow; the left end is pinned
+        and the right end is on a roller.
+    """
+    bottom = np.arange(panel_count + 1)
+    top = bottom + panel_count + 1
+    x_positions = bottom * panel_length
+
+    nodes = np.concatenate(
+        [
+            np.column_stack([x_positions, np.zeros_like(x_positions)]),
+            np.column_stack([x_positions, np.full_like(x_positions, depth)]),
+        ]
+    )
+
+    # Diagonals slope down towards mid-span, as in a Pratt truss
+    left_half = bottom[:-1] < panel_count / 2
+    diagonals = np.where(
+        left_half[:, None],
+        np.column_stack([top[:-1], bottom[1:]]),
+        np.column_stack([bottom[:-1], top[1:]]),
+    )
+
+    members = np.concatenate(
+        [
+            np.column_stack([bottom[:-1], bottom[1:]]),  # Bottom chord
+            np.column_stack([top[:-1], top[1:]]),  # Top chord
+            np.column_stack([bottom, top]),  # Verticals
+            diagonals,
+        ]
+    )
+    supports = np.array([[0, 0], [0, 1], [panel_count, 1]])
+
+    return nodes, members, supports
+
+
+if __name__ == "__main__":
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Jib-tie-post crane of example_jibs.py solved as a truss
+    post_length_m = 8.0  # Length of post (m)
+    jib_length_m = 13.0  # Length of jib (m)
+    tie_length_m = 9.0  # Length of tie (m)
+    load_kn = 20.0  # Vertical load at jib tip (kN)
+
+    # Large lattice girder
+    panel_count = 25_000  # Number of panels (4n + 1 members)
+    panel_length_m = 2.0  # Panel length (m)
+    girder_depth_m = 3.0  # Girder depth (m)
+    panel_load_kn = 10.0  # Load at every bottom chord joint (kN)
+    load_case_count = 10  # Load cases solved with one factorization
+
+    # =========================================================================
+    # JIB CRANE AS A TRUSS
+    # =========================================================================
+
+    # Angle between jib and post from the law of cosines
+    angle_at_base_rad = np.arccos(
+        (jib_length_m**2 + post_length_m**2 - tie_length_m**2)
+        / (2 * jib_length_m * post_length_m)
+    )
+    crane_nodes = [
+        [0.0, 0.0],  # Foot of post and jib
+        [0.0, post_length_m],  # Head of post
+        [
+            jib_length_m * np.sin(angle_at_base_rad),
+            jib_length_m * np.cos(angle_at_base_rad),
+        ],  # Jib tip
+    ]
+    crane_members = [[0, 2], [1, 2]]  # Jib, tie
+    crane_supports = [[0, 0], [0, 1], [1, 0], [1, 1]]
+    crane_solve = factorize_truss(crane_nodes, crane_members, crane_supports)
+    crane_forces, _ = crane_solve([[0.0, 0.0], [0.0, 0.0], [0.0, -load_kn]])
+
+    # =========================================================================
+    # LATTICE GIRDER WITH MANY LOAD CASES
+    # =========================================================================
+
+    nodes, members, supports = pratt_truss(
+        panel_count, panel_length_m, girder_depth_m
+    )
+
+    start_time_s = time.perf_counter()
+    solve = factorize_truss(nodes, members, supports)
+    factor_time_s = time.perf_counter() - start_time_s
+
+    # Each load case scales the bottom chord loads by a different factor
+    loads = np.zeros((load_case_count, len(nodes), 2))
+    load_factors = np.linspace(0.5, 1.5, load_case_count)
+    loads[:, : panel_count + 1, 1] = -panel_load_kn * load_factors[:, None]
+
+    start_time_s = time.perf_counter()
+    member_forces, reactions = solve(loads)
+    solve_time_s = time.perf_counter() - start_time_s
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print("Jib crane as a truss:")
+    print(f"  Force in jib (F_J): {-crane_forces[0]:.4f} kN (compression)")
+    print(f"  Force in tie (F_T): {crane_forces[1]:.4f} kN (tension)")
+    print()
+    print(f"Pratt girder with {len(members):,} members:")
+    print(f"  Factorization time : {factor_time_s:.3f} s")
+    print(
+        f"  Solve time         : {solve_time_s:.3f} s "
+        f"({load_case_count} load cases)"
+    )
+    print(f"  Applied load       : {-loads[-1, :, 1].sum():,.0f} kN")
+    print(f"  Sum of reactions   : {reactions[-1].sum():,.0f} kN")
@@ -0,0 +1,318 @@
+"""
+Time-Domain Crane Hoisting Simulation with an Elastic Rope
+
+Extends the static cable tension of ch2_cable_tension.py (T = m(g + a))
+to a hoist rope that stretches. The winch hauls the rope in along a
+trapezoidal speed profile (accelerate, run at full speed, decelerate);
+the load rests on the ground until the rope tension exceeds its weight,
+so any slack taken up at speed gives a snatch load well above m(g + a).
+
+The rope tension is carried by the jib and tie of example_jibs3.py, so
+their forces follow from the law of sines as in
+ch1_crane_force_solver.py. Thousands of hoisting scenarios are advanced
+together, one array element each, with a fixed-step semi-implicit Euler
+integrator, and the peak dynamic amplification factor (DAF = peak
+tension / static weight) of each is reported.
+
+Units: mass in t, forces in kN (t·m/s² = kN), lengths in m and time in s.
+"""
+
+import numpy as np
+
+GRAVITY_M_PER_S2 = 9.81
+
+# =============================================================================
+# HOIST PROFILE
+# =============================================================================
+
+
+def hoist_speed(time_s, max_speed, acceleration, deceleration, duration):
+    """
+    Trapezoidal winch speed profile.
+
+    Args:
+        time_s: Time(s) (s)
+        max_speed: Full hoisting speed (m/s)
+        acceleration: Winch acceleration up to full speed (m/s²)
+        deceleration: Winch deceleration to rest (m/s²)
+        duration: Time at which the winch is back at rest (s)
+
+    All arguments are broadcast together.
+
+    Returns:
+        Rope haul-in speed(s) (m/s)
+    """
+    speeding_up = acceleration * time_s
+    slowing_down = deceleration * (duration - time_s)
+    return np.clip(np.minimum(speeding_up, slowing_down), 0.0, max_speed)
+
+
+# =============================================================================
+# ENSEMBLE SIMULATION
+# =============================================================================
+
+
+def simulate_hoisting(
+    mass_t,
+    rope_axial_stiffness_kn,
+    rope_length_m,
+    max_speed_m_per_s,
+    acceleration_m_per_s2,
+    deceleration_m_per_s2=None,
+    hoist_time_s=10.0,
+    slack_m=0.0,
+    damping_ratio=0.02,
+    force_ratios=(1.0, 1.0),
+    time_step_s=None,
+    duration_s=None,
+    history_every=0,
+    min_free_length_m=1.0,
+):
+    """
+    Simulate an ensemble of hoisting scenarios with an elastic rope.
+
+    Args:
+        mass_t: Hoisted mass(es) (t)
+        rope_axial_stiffness_kn: EA of the hoist rope(s) (kN)
+        rope_length_m: Rope length from winch to load at the start (m)
+        max_speed_m_per_s: Full hoisting speed(s) (m/s)
+        acceleration_m_per_s2: Winch acceleration(s) (m/s²)
+        deceleration_m_per_s2: Winch deceleration(s), defaults to the
+            acceleration (m/s²)
+        hoist_time_s: Time at which the winch is back at rest (s)
+        slack_m: Slack in the rope before it starts to lift (m)
+        damping_ratio: Rope damping as a fraction of critical
+        force_ratios: (jib, tie) force per kN of rope tension, e.g. from
+            calculate_forces(post, jib, tie, 1.0)
+        time_step_s: Integration step; defaults to 1/40 of the shortest
+            natural period of the ensemble
+        duration_s: Simulated time, defaults to hoist_time_s plus two
+            seconds to let the load settle
+        history_every: Keep the tension every n steps (0 for none)
+        min_free_length_m: Shortest rope that may be left paid out at
+            the end of the hoist (m)
+
+    Every scenario argument is broadcast to one shape (scenarios,).
+
+    Returns:
+        Dictionary with arrays of shape (scenarios,):
+            static_tension_kn: m g
+            peak_tension_kn, peak_time_s: Largest rope tension and when
+            daf: Dynamic amplification factor peak / static
+            lift_off_time_s: Time the load leaves the ground (NaN if not)
+            peak_jib_force_kn, peak_tie_force_kn: Peak member forces
+        plus time_s and tension_kn (steps, scenarios) if history_every
+    """
+    if deceleration_m_per_s2 is None:
+        deceleration_m_per_s2 = acceleration_m_per_s2
+    (
+        mass,
+        rope_ea,
+        rope_length,
+        max_speed,
+        acceleration,
+        deceleration,
+        hoist_time,
+        slack,
+        damping_ratio,
+    ) = (
+        np.ravel(value).astype(float)
+        for value in np.broadcast_arrays(
+            mass_t,
+            rope_axial_stiffness_kn,
+            rope_length_m,
+            max_speed_m_per_s,
+            acceleration_m_per_s2,
+            deceleration_m_per_s2,
+            hoist_time_s,
+            slack_m,
+            damping_ratio,
+        )
+    )
+    weight = mass * GRAVITY_M_PER_S2
+
+    # Rope hauled in by the full trapezoidal (or triangular) profile: the
+    # rope stiffness EA / (L - hauled) must stay finite throughout
+    peak_speed = np.minimum(
+        max_speed,
+        acceleration
+        * deceleration
+        * hoist_time
+        / (acceleration + deceleration),
+    )
+    total_haul = peak_speed * hoist_time - peak_speed**2 * (
+        1 / (2 * acceleration) + 1 / (2 * deceleration)
+    )
+    if np.any(total_haul >= rope_length - min_free_length_m):
+        raise ValueError(
+            "The hoist hauls in more rope than is paid out; increase "
+            "rope_length_m or reduce the hoist speed or time"
+        )
+
+    if time_step_s is None:
+        shortest_period = 2 * np.pi * np.sqrt(mass * rope_length / rope_ea)
+        time_step_s = shortest_period.min() / 40
+    if duration_s is None:
+        duration_s = hoist_time.max() + 2.0
+    step_count = int(np.ceil(duration_s / time_step_s))
+
+    # State: rope hauled in, load height above ground and load velocity
+    hauled = np.zeros_like(mass)
+    height = np.zeros_like(mass)
+    velocity = np.zeros_like(mass)
+    previous_stretch = -slack
+
+    peak_tension = np.zeros_like(mass)
+    peak_time = np.zeros_like(mass)
+    lift_off_time = np.full_like(mass, np.nan)
+    history = []
+
+    for step in range(1, step_count + 1):
+        time_s = step * time_step_s
+        hauled += time_step_s * hoist_speed(
+            time_s, max_speed, acceleration, deceleration, hoist_time
+        )
+
+        # Rope tension: stiffness EA / L of the rope still paid out, plus
+        # damping, only while the rope is taut
+        stretch = hauled - height - slack
+        stretch_rate = (stretch - previous_stretch) / time_step_s
+        previous_stretch = stretch
+        stiffness = rope_ea / (rope_length - hauled)
+        damping = 2 * damping_ratio * np.sqrt(stiffness * mass)
+        tension = np.where(
+            stretch > 0,
+            np.maximum(stiffness * stretch + damping * stretch_rate, 0.0),
+            0.0,
+        )
+
+        # Semi-implicit Euler: velocity first, then position; the ground
+        # stops the load from moving down through it
+        velocity += time_step_s * (tension / mass - GRAVITY_M_PER_S2)
+        height += time_step_s * velocity
+        on_ground = height <= 0
+        height[on_ground] = 0.0
+        velocity[on_ground] = np.maximum(velocity[on_ground], 0.0)
+
+        lifted = np.isnan(lift_off_time) & (height > 0)
+        lift_off_time[lifted] = time_s
+        higher = tension > peak_tension
+        peak_tension[higher] = tension[higher]
+        peak_time[higher] = time_s
+        if history_every and step % history_every == 0:
+            history.append(tension.copy())
+
+    jib_ratio, tie_ratio = force_ratios
+    results = {
+        "static_tension_kn": weight,
+        "peak_tension_kn": peak_tension,
+        "peak_time_s": peak_time,
+        "daf": peak_tension / weight,
+        "lift_off_time_s": lift_off_time,
+        "peak_jib_force_kn": jib_ratio * peak_tension,
+        "peak_tie_force_kn": tie_ratio * peak_tension,
+    }
+    if history_every:
+        results["time_s"] = (
+            np.arange(1, len(history) + 1) * history_every * time_step_s
+        )
+        results["tension_kn"] = np.array(history)
+    return results
+
+
+if __name__ == "__main__":
+    import time
+
+    from ch1_crane_force_solver import calculate_forces
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Crane geometry of example_jibs3.py
+    post_length_m = 8.0  # Vertical post (m)
+    jib_length_m = 13.0  # Jib (m)
+    tie_length_m = 9.0  # Tie (m)
+
+    # Single lift: the 20 kN load of example_jibs3.py
+    load_mass_t = 20.0 / GRAVITY_M_PER_S2  # Hoisted mass (t)
+    rope_axial_stiffness_kn = 8_000.0  # EA of the hoist rope (kN)
+    rope_length_m = 30.0  # Rope paid out at the start (m)
+    hoist_speed_m_per_s = 0.5  # Full hoisting speed (m/s)
+    hoist_acceleration_m_per_s2 = 0.5  # Winch acceleration (m/s²)
+
+    scenario_count = 5_000  # Ensemble of hoisting scenarios
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    force_in_jib, force_in_tie, *_ = calculate_forces(
+        post_length_m, jib_length_m, tie_length_m, 1.0
+    )
+    force_ratios = (float(force_in_jib), float(force_in_tie))
+
+    # Snatch check: slack taken up at full speed gives, for an undamped
+    # rope, T_peak = m g + v √(k m) with k = EA / L (first peak only,
+    # before the shortening rope has stiffened noticeably)
+    snatch = simulate_hoisting(
+        load_mass_t,
+        rope_axial_stiffness_kn,
+        rope_length_m,
+        hoist_speed_m_per_s,
+        1e3,
+        hoist_acceleration_m_per_s2,
+        slack_m=0.2,
+        damping_ratio=0.0,
+        hoist_time_s=4.0,
+        duration_s=1.0,
+    )
+    snatch_stiffness = rope_axial_stiffness_kn / (rope_length_m - 0.2)
+    snatch_exact_kn = load_mass_t * GRAVITY_M_PER_S2 + hoist_speed_m_per_s * (
+        np.sqrt(snatch_stiffness * load_mass_t)
+    )
+
+    # Ensemble: masses, ropes, speeds, accelerations and slack varied
+    rng = np.random.default_rng(17)
+    start_time_s = time.perf_counter()
+    ensemble = simulate_hoisting(
+        rng.uniform(0.5, 2.5, scenario_count),
+        rng.uniform(4e3, 12e3, scenario_count),
+        rng.uniform(15.0, 40.0, scenario_count),
+        rng.uniform(0.2, 1.0, scenario_count),
+        rng.uniform(0.2, 2.0, scenario_count),
+        hoist_time_s=8.0,
+        slack_m=rng.choice([0.0, 0.05, 0.2], scenario_count),
+        force_ratios=force_ratios,
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    worst = np.argmax(ensemble["daf"])
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(
+        f"Jib and tie force per kN of rope tension: "
+        f"{force_ratios[0]:.3f}, {force_ratios[1]:.3f}"
+    )
+    print(
+        f"Snatch lift: peak tension {snatch['peak_tension_kn'][0]:.2f} kN "
+        f"(m g + v √(k m) = {snatch_exact_kn:.2f} kN), "
+        f"DAF {snatch['daf'][0]:.2f}"
+    )
+    print()
+    print(f"{scenario_count:,} scenarios simulated in {elapsed_time_s:.2f} s")
+    print(
+        f"DAF: median {np.median(ensemble['daf']):.2f}, "
+        f"95th percentile {np.percentile(ensemble['daf'], 95):.2f}, "
+        f"max {ensemble['daf'][worst]:.2f}"
+    )
+    print(
+        f"Worst scenario: peak tension "
+        f"{ensemble['peak_tension_kn'][worst]:.1f} kN, "
+        f"jib {ensemble['peak_jib_force_kn'][worst]:.1f} kN, "
+        f"tie {ensemble['peak_tie_force_kn'][worst]:.1f} kN "
+        f"(static {ensemble['static_tension_kn'][worst]:.1f} kN)"
+    )
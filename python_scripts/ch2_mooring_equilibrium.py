@@ -0,0 +1,461 @@
+"""
+Moored Ship Line Tension Equilibrium Solver
+
+Extends ch2_mooring_drum_torque.py from a single drum and line to a
+berthed ship held by many elastic mooring lines. The ship moves in the
+horizontal plane (surge x, sway y and yaw ψ about midships); each line
+runs from a fairlead fixed to the ship to a bollard on the quay and
+carries T = EA (ℓ - L0) / L0 when stretched and nothing when slack.
+
+Wind and current loads are balanced by the line forces with a Newton
+iteration using the analytic stiffness (Jacobian) of the lines. All
+environmental load cases are iterated together as one batch of 3 × 3
+linear systems, so a full wind/current rose is solved at once.
+
+Units: positions in m, forces in kN, moments in kN·m, yaw in rad (deg
+in the results). Ship axes: x forward, y to port, origin at midships.
+"""
+
+import numpy as np
+
+AIR_DENSITY_KG_PER_M3 = 1.225
+SEAWATER_DENSITY_KG_PER_M3 = 1025.0
+
+# =============================================================================
+# ENVIRONMENTAL LOADS
+# =============================================================================
+
+
+def environmental_load(
+    speed_m_per_s,
+    direction_deg,
+    frontal_area_m2,
+    lateral_area_m2,
+    density_kg_per_m3,
+    force_coefficient=1.0,
+    centre_of_pressure_x_m=0.0,
+):
+    """
+    Surge, sway and yaw loads of wind or current on the ship.
+
+    F = ½ ρ C A V² resolved along the ship axes, with the lateral load
+    acting at a distance centre_of_pressure_x_m forward of midships.
+
+    Args:
+        speed_m_per_s: Wind or current speed(s) (m/s)
+        direction_deg: Direction(s) the flow is heading, measured
+            anticlockwise from the bow (0 = from astern to ahead)
+        frontal_area_m2: Projected area normal to the ship axis (m²)
+        lateral_area_m2: Projected side area (m²)
+        density_kg_per_m3: Air or water density (kg/m³)
+        force_coefficient: Drag coefficient C
+        centre_of_pressure_x_m: Lever of the lateral load (m)
+
+    Returns:
+        Array of shape (..., 3) with (Fx kN, Fy kN, Mz kN·m)
+    """
+    direction_rad = np.radians(direction_deg)
+    dynamic_pressure_kpa = (
+        0.5 * density_kg_per_m3 * np.asarray(speed_m_per_s) ** 2 / 1e3
+    )
+    force_x = (
+        dynamic_pressure_kpa
+        * force_coefficient
+        * frontal_area_m2
+        * np.cos(direction_rad)
+    )
+    force_y = (
+        dynamic_pressure_kpa
+        * force_coefficient
+        * lateral_area_m2
+        * np.sin(direction_rad)
+    )
+    return np.stack(
+        np.broadcast_arrays(
+            force_x, force_y, force_y * centre_of_pressure_x_m
+        ),
+        axis=-1,
+    )
+
+
+# =============================================================================
+# LINE FORCES AND STIFFNESS
+# =============================================================================
+
+
+def line_forces(state, fairleads, bollards, axial_stiffness, unstretched):
+    """
+    Line tensions, resultant load on the ship and its Jacobian.
+
+    Args:
+        state: Ship positions (x, y, ψ), shape (cases, 3) (m, m, rad)
+        fairleads: Fairleads in ship axes, shape (lines, 2) (m)
+        bollards: Bollards in berth axes, shape (lines, 2) (m)
+        axial_stiffness: EA of each line, shape (lines,) (kN)
+        unstretched: Unstretched length L0 of each line (m)
+
+    Returns:
+        Tuple (tension (cases, lines), load (cases, 3),
+        jacobian (cases, 3, 3)) with load = (Fx, Fy, Mz) on the ship and
+        jacobian = d load / d state
+    """
+    cos, sin = np.cos(state[:, 2]), np.sin(state[:, 2])
+
+    # Fairlead arms r = R(ψ) f and line vectors d = bollard - fairlead
+    arm = np.stack(
+        [
+            cos[:, None] * fairleads[:, 0] - sin[:, None] * fairleads[:, 1],
+            sin[:, None] * fairleads[:, 0] + cos[:, None] * fairleads[:, 1],
+        ],
+        axis=-1,
+    )
+    line = bollards - state[:, None, :2] - arm
+    length = np.linalg.norm(line, axis=-1)
+    unit = line / length[..., None]
+
+    spring = axial_stiffness / unstretched
+    tension = np.maximum(spring * (length - unstretched), 0.0)
+    taut = tension > 0
+    force = tension[..., None] * unit
+    moment = arm[..., 0] * force[..., 1] - arm[..., 1] * force[..., 0]
+    load = np.concatenate(
+        [force.sum(axis=1), moment.sum(axis=1, keepdims=True)], axis=-1
+    )
+
+    # dF/dd = k u uᵀ + T (I - u uᵀ) / ℓ for a taut line, zero if slack;
+    # the fairlead moves by dp/dq = [I | r⊥] with r⊥ = (-r_y, r_x)
+    outer = unit[..., :, None] * unit[..., None, :]
+    stiffness = np.where(
+        taut[..., None, None],
+        spring[:, None, None] * outer
+        + (tension / length)[..., None, None] * (np.eye(2) - outer),
+        0.0,
+    )
+    arm_perp = np.stack([-arm[..., 1], arm[..., 0]], axis=-1)
+    fairlead_motion = np.concatenate(
+        [np.broadcast_to(np.eye(2), arm.shape + (2,)), arm_perp[..., None]],
+        axis=-1,
+    )
+    force_gradient = -stiffness @ fairlead_motion  # (cases, lines, 2, 3)
+    moment_gradient = (
+        arm[..., 0, None] * force_gradient[..., 1, :]
+        - arm[..., 1, None] * force_gradient[..., 0, :]
+    )
+    # The arm itself turns with ψ: d(r × F)/dψ gains r⊥ × F = -r · F
+    moment_gradient[..., 2] -= (arm * force).sum(axis=-1)
+
+    jacobian = np.concatenate(
+        [
+            force_gradient.sum(axis=1),
+            moment_gradient.sum(axis=1)[:, None, :],
+        ],
+        axis=1,
+    )
+    return tension, load, jacobian
+
+
+def fender_forces(state, points, face_y, stiffness):
+    """
+    Fender reactions, resultant load on the ship and its Jacobian.
+
+    Fenders are compression-only springs on the quay face y = face_y;
+    a hull point pressed past the face is pushed back in +y.
+
+    Args:
+        state: Ship positions (x, y, ψ), shape (cases, 3) (m, m, rad)
+        points: Hull contact points in ship axes, shape (fenders, 2) (m)
+        face_y: Berth y of the fender face (m)
+        stiffness: Fender stiffness, scalar or (fenders,) (kN/m)
+
+    Returns:
+        Tuple (reaction (cases, fenders), load (cases, 3),
+        jacobian (cases, 3, 3)), as for line_forces
+    """
+    cos, sin = np.cos(state[:, 2]), np.sin(state[:, 2])
+    arm_x = cos[:, None] * points[:, 0] - sin[:, None] * points[:, 1]
+    arm_y = sin[:, None] * points[:, 0] + cos[:, None] * points[:, 1]
+
+    compression = face_y - state[:, 1, None] - arm_y
+    in_contact = compression > 0
+    reaction = np.where(in_contact, stiffness * compression, 0.0)
+    contact_stiffness = np.where(in_contact, stiffness, 0.0)
+
+    load = np.stack(
+        [
+            np.zeros(len(state)),
+            reaction.sum(axis=1),
+            (arm_x * reaction).sum(axis=1),
+        ],
+        axis=-1,
+    )
+
+    # dR/dq = -k (0, 1, r_x); the arm r_x turns with ψ by -r_y
+    jacobian = np.zeros((len(state), 3, 3))
+    jacobian[:, 1, 1] = -contact_stiffness.sum(axis=1)
+    jacobian[:, 1, 2] = jacobian[:, 2, 1] = -(contact_stiffness * arm_x).sum(
+        axis=1
+    )
+    jacobian[:, 2, 2] = -(
+        contact_stiffness * arm_x**2 + arm_y * reaction
+    ).sum(axis=1)
+    return reaction, load, jacobian
+
+
+# =============================================================================
+# EQUILIBRIUM SOLVER
+# =============================================================================
+
+
+def solve_mooring(
+    fairleads,
+    bollards,
+    axial_stiffness,
+    environmental_loads,
+    pretension_kn=0.0,
+    fenders=None,
+    tolerance_kn=1e-6,
+    max_iterations=50,
+    max_step=(1.0, 1.0, 0.01),
+    max_halvings=10,
+):
+    """
+    Static equilibrium of a moored ship for many load cases at once.
+
+    Args:
+        fairleads: Fairleads in ship axes, shape (lines, 2) (m)
+        bollards: Bollards in berth axes with the ship at rest at the
+            origin, shape (lines, 2) (m)
+        axial_stiffness: EA of each line, scalar or (lines,) (kN)
+        environmental_loads: (Fx, Fy, Mz) on the ship, shape (3,) or
+            (cases, 3), e.g. sums of environmental_load results
+        pretension_kn: Line tension with the ship at rest (kN)
+        fenders: Optional tuple (hull points (fenders, 2), face_y,
+            stiffness) passed to fender_forces; without fenders, loads
+            pushing the ship onto the quay have no equilibrium
+        tolerance_kn: Convergence limit on the out-of-balance load
+        max_iterations: Newton iteration limit
+        max_step: Largest change of (x, y, ψ) per iteration, which keeps
+            the iteration stable while lines go slack
+        max_halvings: Largest number of step halvings per iteration
+
+    Returns:
+        Dictionary with:
+            surge_m, sway_m, yaw_deg: Ship offsets, shape (cases,)
+            tension_kn: Line tensions, shape (cases, lines)
+            slack: True where a line carries no load
+            fender_reaction_kn: Fender reactions, shape (cases, fenders)
+            residual_kn: Out-of-balance load, shape (cases,)
+            converged: True where residual_kn ≤ tolerance_kn
+            iterations: Newton iterations used
+    """
+    fairleads = np.asarray(fairleads, dtype=float)
+    bollards = np.asarray(bollards, dtype=float)
+    line_count = len(fairleads)
+    axial_stiffness = np.broadcast_to(
+        np.asarray(axial_stiffness, dtype=float), line_count
+    )
+    loads = np.atleast_2d(np.asarray(environmental_loads, dtype=float))
+    single_case = np.ndim(environmental_loads) == 1
+    if fenders is None:
+        fenders = (np.zeros((0, 2)), 0.0, 0.0)
+    fender_points = np.asarray(fenders[0], dtype=float).reshape(-1, 2)
+
+    # Unstretched lengths giving the pretension with the ship at rest
+    rest_length = np.linalg.norm(bollards - fairleads, axis=1)
+    unstretched = rest_length / (1 + pretension_kn / axial_stiffness)
+
+    def out_of_balance(state):
+        tension, line_load, line_jacobian = line_forces(
+            state, fairleads, bollards, axial_stiffness, unstretched
+        )
+        reaction, fender_load, fender_jacobian = fender_forces(
+            state, fender_points, *fenders[1:]
+        )
+        return (
+            tension,
+            reaction,
+            line_load + fender_load,
+            line_jacobian + fender_jacobian,
+        )
+
+    # Newton iteration on the cases that have not yet converged, with the
+    # step halved where it does not reduce the out-of-balance load (the
+    # stiffness jumps as lines go slack and fenders touch)
+    state = np.zeros((loads.shape[0], 3))
+    max_step = np.asarray(max_step, dtype=float)
+    active = np.arange(loads.shape[0])
+    *_, load, jacobian = out_of_balance(state)
+    residual = load + loads
+    for iteration in range(1, max_iterations + 1):
+        residual_norm = np.linalg.norm(residual, axis=1)
+        unbalanced = residual_norm > tolerance_kn
+        active = active[unbalanced]
+        if active.size == 0:
+            break
+        residual = residual[unbalanced]
+        residual_norm = residual_norm[unbalanced]
+        jacobian = jacobian[unbalanced]
+
+        try:
+            step = -np.linalg.solve(jacobian, residual[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            step = -np.einsum("cij,cj->ci", np.linalg.pinv(jacobian), residual)
+
+        # Scale each step so no component exceeds its limit
+        step *= np.minimum(
+            1.0, (max_step / np.maximum(np.abs(step), 1e-12)).min(axis=1)
+        )[:, None]
+
+        trial = state[active] + step
+        *_, load, jacobian = out_of_balance(trial)
+        residual = load + loads[active]
+        for _ in range(max_halvings):
+            worse = np.linalg.norm(residual, axis=1) >= residual_norm
+            if not worse.any():
+                break
+            step[worse] /= 2
+            trial[worse] = state[active[worse]] + step[worse]
+            *_, load[worse], jacobian[worse] = out_of_balance(trial[worse])
+            residual[worse] = load[worse] + loads[active[worse]]
+        state[active] = trial
+
+    tension, reaction, load, _ = out_of_balance(state)
+    residual_norm = np.linalg.norm(load + loads, axis=1)
+
+    results = {
+        "surge_m": state[:, 0],
+        "sway_m": state[:, 1],
+        "yaw_deg": np.degrees(state[:, 2]),
+        "tension_kn": tension,
+        "slack": tension <= 0,
+        "fender_reaction_kn": reaction,
+        "residual_kn": residual_norm,
+        "converged": residual_norm <= tolerance_kn,
+        "iterations": iteration,
+    }
+    if single_case:
+        results = {
+            name: value if name == "iterations" else value[0]
+            for name, value in results.items()
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Tanker berthed starboard side to; quay edge at y = -25 m
+    ship_length_m = 200.0  # Length between perpendiculars (m)
+    frontal_wind_area_m2 = 800.0  # Projected frontal area above water
+    lateral_wind_area_m2 = 3_000.0  # Projected side area above water
+    frontal_current_area_m2 = 400.0  # Projected frontal area below water
+    lateral_current_area_m2 = 2_400.0  # Projected side area below water
+
+    # Head, breast and spring lines forward and aft (fairlead, bollard)
+    fairleads_m = np.array(
+        [
+            [98.0, -6.0],  # Head line
+            [96.0, -8.0],  # Head line
+            [80.0, -15.0],  # Forward breast line
+            [60.0, -16.0],  # Forward spring line
+            [-60.0, -16.0],  # Aft spring line
+            [-80.0, -15.0],  # Aft breast line
+            [-96.0, -8.0],  # Stern line
+            [-98.0, -6.0],  # Stern line
+        ]
+    )
+    bollards_m = np.array(
+        [
+            [150.0, -25.0],
+            [145.0, -25.0],
+            [85.0, -25.0],
+            [10.0, -25.0],
+            [-10.0, -25.0],
+            [-85.0, -25.0],
+            [-145.0, -25.0],
+            [-150.0, -25.0],
+        ]
+    )
+    line_axial_stiffness_kn = 12_000.0  # EA of each line (kN)
+    pretension_kn = 50.0  # Line pretension at rest (kN)
+
+    # Fenders along the starboard side, face touching the hull at rest
+    fender_points_m = np.column_stack(
+        [np.linspace(-60, 60, 5), np.full(5, -16.0)]
+    )
+    fender_face_y_m = -16.0  # Fender face in berth axes (m)
+    fender_stiffness_kn_per_m = 5_000.0  # Stiffness of each fender
+
+    # Wind/current rose: speed × direction for both
+    wind_speeds_m_per_s = np.linspace(5, 30, 11)
+    wind_directions_deg = np.arange(0, 360, 10)
+    current_speeds_m_per_s = np.array([0.5, 1.0, 1.5])
+    current_directions_deg = np.arange(0, 360, 30)
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    wind = environmental_load(
+        wind_speeds_m_per_s[:, None],
+        wind_directions_deg[None, :],
+        frontal_wind_area_m2,
+        lateral_wind_area_m2,
+        AIR_DENSITY_KG_PER_M3,
+        centre_of_pressure_x_m=-0.1 * ship_length_m,
+    ).reshape(-1, 3)
+    current = environmental_load(
+        current_speeds_m_per_s[:, None],
+        current_directions_deg[None, :],
+        frontal_current_area_m2,
+        lateral_current_area_m2,
+        SEAWATER_DENSITY_KG_PER_M3,
+        force_coefficient=0.6,
+    ).reshape(-1, 3)
+    loads = (wind[:, None, :] + current[None, :, :]).reshape(-1, 3)
+
+    start_time_s = time.perf_counter()
+    mooring = solve_mooring(
+        fairleads_m,
+        bollards_m,
+        line_axial_stiffness_kn,
+        loads,
+        pretension_kn,
+        (fender_points_m, fender_face_y_m, fender_stiffness_kn_per_m),
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    worst_case = np.argmax(mooring["tension_kn"].max(axis=1))
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(
+        f"{len(loads):,} wind/current cases solved in "
+        f"{elapsed_time_s * 1000:.1f} ms "
+        f"({mooring['iterations']} Newton iterations)"
+    )
+    print(
+        f"Converged: {mooring['converged'].sum():,} of {len(loads):,}, "
+        f"largest residual {mooring['residual_kn'].max():.2e} kN"
+    )
+    print(f"Largest surge offset : {np.abs(mooring['surge_m']).max():.2f} m")
+    print(f"Largest sway offset  : {np.abs(mooring['sway_m']).max():.2f} m")
+    print(f"Largest yaw          : {np.abs(mooring['yaw_deg']).max():.2f}°")
+    print()
+    print(
+        f"Worst case: load ({loads[worst_case, 0]:,.0f} kN, "
+        f"{loads[worst_case, 1]:,.0f} kN, "
+        f"{loads[worst_case, 2]:,.0f} kN·m)"
+    )
+    for index, tension in enumerate(mooring["tension_kn"][worst_case]):
+        print(f"  Line {index + 1}: {tension:8.1f} kN")
+    print(
+        f"  Fenders: {mooring['fender_reaction_kn'][worst_case].sum():,.1f}"
+        f" kN in total"
+    )
@@ -0,0 +1,426 @@
+"""
+Compartment Flooding Scenario Engine for Bulkhead Loads
+
+Generalises example_fe2.py (oil on one side of a bulkhead, water on the
+other) and the dock gate net thrust of ch3_hydrostatic_dock_gate.py to
+a grid of compartments. Every bulkhead between two neighbouring
+compartments carries the difference of the two hydrostatic thrusts,
+
+    F = ρ_a g w h_a² / 2 - ρ_b g w h_b² / 2
+
+with its centre of pressure from the difference of the moments about
+the bulkhead foot, as in the gate_thrust kernel of
+ch3_hydrostatic_kernel.py. The scenarios combine the loading conditions
+(fill heights and densities of every compartment) with damage cases, in
+which every combination of up to k compartments (itertools.combinations)
+floods with seawater to a given level. Each scenario is one row of
+(scenarios, compartments) arrays, so every bulkhead of every scenario is
+one gate_thrust call. Each bulkhead has a height, and a level above its
+top loads only the bulkhead below it (a trapezoidal pressure). For very
+large scenario sets the governing case of every bulkhead is found in row
+chunks spread over a process pool, each chunk reduced in its worker so
+only the governing values travel back.
+
+Units: heights and widths in m (fill heights above the common
+compartment floor), densities in kg/m³, forces in N and moments in N·m.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ch3_hydrostatic_kernel import SEAWATER_DENSITY_KG_PER_M3, gate_thrust
+
+# =============================================================================
+# COMPARTMENT GRID
+# =============================================================================
+
+
+def compartment_grid(compartment_lengths_m, compartment_breadths_m):
+    """
+    Bulkheads between the compartments of a rectangular grid.
+
+    Compartments are numbered row by row: row i (along the length) and
+    column j (across the breadth) is compartment i × columns + j.
+
+    Args:
+        compartment_lengths_m: Length of each row of compartments (m)
+        compartment_breadths_m: Breadth of each column of compartments (m)
+
+    Returns:
+        (bulkheads, widths_m): compartment pairs (a, b) of shape
+        (bulkheads, 2), transverse bulkheads first, and the width of
+        each bulkhead (m)
+    """
+    lengths = np.asarray(compartment_lengths_m, dtype=float)
+    breadths = np.asarray(compartment_breadths_m, dtype=float)
+    rows, columns = lengths.size, breadths.size
+    index = np.arange(rows * columns).reshape(rows, columns)
+
+    # Transverse bulkheads between rows span a column's breadth;
+    # longitudinal ones between columns span a row's length
+    transverse = np.stack([index[:-1].ravel(), index[1:].ravel()], axis=1)
+    longitudinal = np.stack(
+        [index[:, :-1].ravel(), index[:, 1:].ravel()], axis=1
+    )
+    widths = np.concatenate(
+        [
+            np.tile(breadths, rows - 1),
+            np.repeat(lengths, columns - 1),
+        ]
+    )
+    return np.concatenate([transverse, longitudinal]), widths
+
+
+# =============================================================================
+# SCENARIOS
+# =============================================================================
+
+
+def damage_cases(compartment_count, max_damaged, min_damaged=1):
+    """
+    Every combination of damaged compartments.
+
+    Args:
+        compartment_count: Number of compartments
+        max_damaged: Largest number of compartments damaged together
+        min_damaged: Smallest number (0 includes the intact case)
+
+    Returns:
+        Boolean array (cases, compartments), True where flooded
+    """
+    combinations = [
+        damaged
+        for count in range(min_damaged, max_damaged + 1)
+        for damaged in itertools.combinations(range(compartment_count), count)
+    ]
+    flooded = np.zeros((len(combinations), compartment_count), dtype=bool)
+    for case, damaged in enumerate(combinations):
+        flooded[case, list(damaged)] = True
+    return flooded
+
+
+def flooding_scenarios(
+    fill_heights_m,
+    fill_densities_kg_per_m3,
+    flooded,
+    flood_levels_m,
+    seawater_density_kg_per_m3=SEAWATER_DENSITY_KG_PER_M3,
+):
+    """
+    Fill heights and densities of every compartment in every scenario.
+
+    Args:
+        fill_heights_m: Intact fill heights (conditions, compartments)
+        fill_densities_kg_per_m3: Intact densities, same shape (kg/m³)
+        flooded: Damage cases (cases, compartments), from damage_cases
+        flood_levels_m: Seawater levels in the damaged compartments (m)
+        seawater_density_kg_per_m3: Floodwater density (kg/m³)
+
+    Returns:
+        (heights_m, densities_kg_per_m3): arrays (scenarios,
+        compartments) with the scenarios in C order over (conditions,
+        flood levels, damage cases)
+    """
+    heights = np.atleast_2d(np.asarray(fill_heights_m, dtype=float))
+    densities = np.broadcast_to(fill_densities_kg_per_m3, heights.shape)
+    levels = np.atleast_1d(np.asarray(flood_levels_m, dtype=float))
+    compartment_count = heights.shape[1]
+
+    shape = (len(heights), levels.size, len(flooded), compartment_count)
+    scenario_heights = np.where(
+        flooded, levels[:, None, None], heights[:, None, None, :]
+    )
+    scenario_densities = np.where(
+        flooded, seawater_density_kg_per_m3, densities[:, None, None, :]
+    )
+    return (
+        np.broadcast_to(scenario_heights, shape).reshape(
+            -1, compartment_count
+        ),
+        np.broadcast_to(scenario_densities, shape).reshape(
+            -1, compartment_count
+        ),
+    )
+
+
+# =============================================================================
+# BULKHEAD LOADS
+# =============================================================================
+
+
+def bulkhead_loads(
+    bulkheads,
+    widths_m,
+    bulkhead_heights_m,
+    heights_m,
+    densities_kg_per_m3,
+):
+    """
+    Net thrust and centre of pressure on every bulkhead in every scenario.
+
+    Args:
+        bulkheads: Compartment pairs (a, b), from compartment_grid
+        widths_m: Bulkhead widths (m)
+        bulkhead_heights_m: Bulkhead height(s) above the floor; a fill or
+            flood level above the top loads only the bulkhead below it
+            (trapezoidal pressure) (m)
+        heights_m: Fill heights (scenarios, compartments), e.g. from
+            flooding_scenarios (m)
+        densities_kg_per_m3: Densities (scenarios, compartments)
+
+    Returns:
+        Dictionary of (scenarios, bulkheads) arrays, as gate_thrust:
+        net_thrust_n (positive from side a towards side b),
+        overturning_moment_n_m about the bulkhead foot and
+        centre_of_pressure_m above it, plus the thrust of each side
+    """
+    bulkheads = np.asarray(bulkheads)
+    heights_m = np.asarray(heights_m, dtype=float)
+    densities_kg_per_m3 = np.broadcast_to(densities_kg_per_m3, heights_m.shape)
+    side_a, side_b = bulkheads[:, 0], bulkheads[:, 1]
+    return gate_thrust(
+        heights_m[:, side_a],
+        heights_m[:, side_b],
+        np.asarray(widths_m, dtype=float),
+        densities_kg_per_m3[:, side_a],
+        densities_kg_per_m3[:, side_b],
+        gate_height_m=np.asarray(bulkhead_heights_m, dtype=float),
+    )
+
+
+def _governing_chunk(
+    first_scenario,
+    bulkheads,
+    widths_m,
+    bulkhead_heights_m,
+    heights_m,
+    densities_kg_per_m3,
+):
+    """
+    Worst scenario of every bulkhead within one block of scenario rows.
+
+    The block is reduced where it is computed, so a process pool worker
+    sends back three (bulkheads,) arrays rather than the full loads.
+
+    Returns:
+        Dictionary as governing_scenarios, with scenario numbers offset
+        by first_scenario
+    """
+    loads = bulkhead_loads(
+        bulkheads, widths_m, bulkhead_heights_m, heights_m, densities_kg_per_m3
+    )
+    scenario = np.argmax(np.abs(loads["net_thrust_n"]), axis=0)
+    bulkhead = np.arange(scenario.size)
+    return {
+        "scenario": first_scenario + scenario,
+        "net_thrust_n": loads["net_thrust_n"][scenario, bulkhead],
+        "centre_of_pressure_m": loads["centre_of_pressure_m"][
+            scenario, bulkhead
+        ],
+    }
+
+
+def governing_scenarios(
+    bulkheads,
+    widths_m,
+    bulkhead_heights_m,
+    heights_m,
+    densities_kg_per_m3,
+    chunk_size=200_000,
+    workers=None,
+):
+    """
+    Worst scenario for every bulkhead, either way round.
+
+    Scenario sets larger than chunk_size are split into row chunks that
+    are solved and reduced in a process pool; smaller sets are done in
+    this process.
+
+    Args:
+        bulkheads, widths_m, bulkhead_heights_m, heights_m,
+        densities_kg_per_m3: As for bulkhead_loads
+        chunk_size: Scenarios per process pool task
+        workers: Number of worker processes (default: all CPUs)
+
+    Returns:
+        Dictionary of (bulkheads,) arrays: scenario, net_thrust_n and
+        centre_of_pressure_m of the largest |net thrust|
+    """
+    heights_m = np.asarray(heights_m, dtype=float)
+    densities_kg_per_m3 = np.broadcast_to(densities_kg_per_m3, heights_m.shape)
+    scenario_count = len(heights_m)
+    if scenario_count <= chunk_size:
+        return _governing_chunk(
+            0,
+            bulkheads,
+            widths_m,
+            bulkhead_heights_m,
+            heights_m,
+            densities_kg_per_m3,
+        )
+
+    starts = range(0, scenario_count, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        chunks = list(
+            pool.map(
+                _governing_chunk,
+                starts,
+                itertools.repeat(bulkheads),
+                itertools.repeat(widths_m),
+                itertools.repeat(bulkhead_heights_m),
+                (heights_m[start : start + chunk_size] for start in starts),
+                (
+                    densities_kg_per_m3[start : start + chunk_size]
+                    for start in starts
+                ),
+            )
+        )
+
+    # The worst chunk of each bulkhead (the first one on a tie)
+    thrust = np.stack([chunk["net_thrust_n"] for chunk in chunks])
+    worst = np.argmax(np.abs(thrust), axis=0)
+    bulkhead = np.arange(worst.size)
+    return {
+        key: np.stack([chunk[key] for chunk in chunks])[worst, bulkhead]
+        for key in chunks[0]
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Bulkhead of example_fe2.py: 2 m wide, 4 m of oil against 6 m of water
+    bulkhead_width_m = 2.0
+    oil_depth_m = 4.0
+    water_depth_m = 6.0
+    oil_density_kg_per_m3 = 850.0
+    water_density_kg_per_m3 = 1000.0
+
+    # Double-bottom and wing tank grid: 6 rows along the ship, 3 across
+    compartment_lengths_m = [12.0, 15.0, 15.0, 15.0, 15.0, 12.0]
+    compartment_breadths_m = [6.0, 10.0, 6.0]
+    compartment_height_m = 8.0
+    max_damaged = 3  # Compartments flooded together
+    condition_count = 25  # Loading conditions (fuel, ballast, cargo oil)
+    flood_levels_m = np.linspace(2.0, 12.0, 11)  # Damage waterlines (m)
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    single = bulkhead_loads(
+        [[0, 1]],
+        [bulkhead_width_m],
+        water_depth_m,
+        [[water_depth_m, oil_depth_m]],
+        [[water_density_kg_per_m3, oil_density_kg_per_m3]],
+    )
+
+    # Check: seawater 12 m deep against an empty compartment, on a
+    # bulkhead 8 m high: F = ρ g w (h H - H² / 2) per metre width
+    overtopped = bulkhead_loads(
+        [[0, 1]],
+        1.0,
+        compartment_height_m,
+        [[flood_levels_m[-1], 0.0]],
+        SEAWATER_DENSITY_KG_PER_M3,
+    )
+    overtopped_exact_n = (
+        SEAWATER_DENSITY_KG_PER_M3
+        * 9.81
+        * (
+            flood_levels_m[-1] * compartment_height_m
+            - compartment_height_m**2 / 2
+        )
+    )
+
+    bulkheads, widths_m = compartment_grid(
+        compartment_lengths_m, compartment_breadths_m
+    )
+    compartment_count = len(compartment_lengths_m) * len(
+        compartment_breadths_m
+    )
+    rng = np.random.default_rng(25)
+    fill_heights_m = rng.uniform(
+        0.0, compartment_height_m, (condition_count, compartment_count)
+    )
+    fill_densities = rng.choice(
+        [850.0, 920.0, 1025.0], (condition_count, compartment_count)
+    )
+    flooded = damage_cases(compartment_count, max_damaged)
+    heights_m, densities = flooding_scenarios(
+        fill_heights_m, fill_densities, flooded, flood_levels_m
+    )
+
+    start_time_s = time.perf_counter()
+    loads = bulkhead_loads(
+        bulkheads, widths_m, compartment_height_m, heights_m, densities
+    )
+    batched_time_s = time.perf_counter() - start_time_s
+
+    start_time_s = time.perf_counter()
+    worst = governing_scenarios(
+        bulkheads,
+        widths_m,
+        compartment_height_m,
+        heights_m,
+        densities,
+        chunk_size=50_000,
+    )
+    pooled_time_s = time.perf_counter() - start_time_s
+    pool_matches = np.array_equal(
+        worst["scenario"], np.argmax(np.abs(loads["net_thrust_n"]), axis=0)
+    )
+
+    worst_bulkhead = np.argmax(np.abs(worst["net_thrust_n"]))
+    condition, level, case = np.unravel_index(
+        worst["scenario"][worst_bulkhead],
+        (condition_count, flood_levels_m.size, len(flooded)),
+    )
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print("Bulkhead of example_fe2.py (water side a, oil side b):")
+    print(
+        f"  Net thrust         : {single['net_thrust_n'][0, 0]:,.0f} N "
+        f"towards the oil side"
+    )
+    print(
+        f"  Centre of pressure : "
+        f"{single['centre_of_pressure_m'][0, 0]:.3f} m above the floor"
+    )
+    print(
+        f"Overtopped {compartment_height_m:.0f} m bulkhead, "
+        f"{flood_levels_m[-1]:.0f} m head: "
+        f"{overtopped['net_thrust_n'][0, 0]:,.0f} N per m "
+        f"(ρ g (h H - H²/2) = {overtopped_exact_n:,.0f} N) at "
+        f"{overtopped['centre_of_pressure_m'][0, 0]:.3f} m"
+    )
+    print()
+    print(
+        f"{compartment_count} compartments, {len(bulkheads)} bulkheads, "
+        f"{len(flooded):,} damage cases, {len(heights_m):,} scenarios"
+    )
+    print(f"  Full loads in one batch   : {batched_time_s * 1000:.0f} ms")
+    print(
+        f"  Governing cases, pooled   : {pooled_time_s * 1000:.0f} ms on "
+        f"{os.cpu_count()} CPU(s), same as the full loads: {pool_matches}"
+    )
+    a, b = bulkheads[worst_bulkhead]
+    print(
+        f"  Worst bulkhead {a}-{b}: "
+        f"{worst['net_thrust_n'][worst_bulkhead] / 1e6:.2f} MN at "
+        f"{worst['centre_of_pressure_m'][worst_bulkhead]:.2f} m, "
+        f"condition {condition}, flood level "
+        f"{flood_levels_m[level]:.0f} m, flooded "
+        f"{np.flatnonzero(flooded[case]).tolist()}"
+    )
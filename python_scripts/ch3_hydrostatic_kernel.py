@@ -0,0 +1,187 @@
+"""
+Hydrostatic Thrust and Centre of Pressure Kernel for Gates
+
+One array version of the F = ρ · g · h_c · A calculation repeated in
+ch3_hydrostatic_gate_thrust.py, ch3_hydrostatic_dock_gate.py and
+ch3_hydrostatic_load.py. For a vertical rectangular gate with water on
+both sides, each side gives
+
+    F = ρ g w h² / 2    acting h / 3 above the sill
+    M = ρ g w h³ / 6    about the sill
+
+or, when the head h is above the top of a gate of height H, the
+trapezoidal load on the gate below its top. The net thrust, overturning
+moment and centre of pressure of the resultant follow from the
+difference. Depths, densities and widths are broadcast against each
+other, so every gate can be evaluated for every tide state in one call.
+
+Units: depths and widths in m, densities in kg/m³, forces in N and
+moments in N·m.
+"""
+
+import numpy as np
+
+GRAVITY_M_PER_S2 = 9.81
+SEAWATER_DENSITY_KG_PER_M3 = 1025.0
+
+# =============================================================================
+# HYDROSTATIC KERNEL
+# =============================================================================
+
+
+def gate_thrust(
+    upstream_depth_m,
+    downstream_depth_m,
+    gate_width_m,
+    upstream_density_kg_per_m3=SEAWATER_DENSITY_KG_PER_M3,
+    downstream_density_kg_per_m3=None,
+    gravity_m_per_s2=GRAVITY_M_PER_S2,
+    gate_height_m=None,
+):
+    """
+    Net hydrostatic thrust on vertical gates for arrays of water levels.
+
+    Args:
+        upstream_depth_m: Water depth(s) above the sill, upstream (m)
+        downstream_depth_m: Water depth(s) above the sill, downstream (m)
+        gate_width_m: Gate width(s) (m)
+        upstream_density_kg_per_m3: Upstream density (kg/m³)
+        downstream_density_kg_per_m3: Downstream density, defaults to
+            the upstream density (kg/m³)
+        gravity_m_per_s2: Acceleration due to gravity (m/s²)
+        gate_height_m: Height(s) of the gate or bulkhead above the sill;
+            a head above the top loads only the gate below it, giving
+            a trapezoidal pressure (default: no top)
+
+    All arguments are broadcast against each other. Negative depths are
+    treated as a dry side.
+
+    Returns:
+        Dictionary of arrays:
+            upstream_force_n, downstream_force_n: Thrust of each side
+            net_thrust_n: Upstream minus downstream thrust
+            overturning_moment_n_m: Net moment about the sill
+            centre_of_pressure_m: Height of the net thrust above the
+                sill (NaN where the net thrust is zero)
+    """
+    if downstream_density_kg_per_m3 is None:
+        downstream_density_kg_per_m3 = upstream_density_kg_per_m3
+
+    upstream = np.maximum(np.asarray(upstream_depth_m, dtype=float), 0.0)
+    downstream = np.maximum(np.asarray(downstream_depth_m, dtype=float), 0.0)
+
+    # ρ g w of each side: force per unit h²/2 and moment per unit h³/6
+    upstream_weight = (
+        upstream_density_kg_per_m3 * gravity_m_per_s2 * gate_width_m
+    )
+    downstream_weight = (
+        downstream_density_kg_per_m3 * gravity_m_per_s2 * gate_width_m
+    )
+
+    def side_loads(weight, head):
+        # ∫ ρ g w (h - z) dz and ∫ ρ g w (h - z) z dz over the wetted
+        # height d = min(h, H): h² / 2 and h³ / 6 when d = h
+        if gate_height_m is None:
+            return weight * head**2 / 2, weight * head**3 / 6
+        wetted = np.minimum(head, gate_height_m)
+        force = weight * (head * wetted - wetted**2 / 2)
+        moment = weight * (head * wetted**2 / 2 - wetted**3 / 3)
+        return force, moment
+
+    upstream_force, upstream_moment = side_loads(upstream_weight, upstream)
+    downstream_force, downstream_moment = side_loads(
+        downstream_weight, downstream
+    )
+    net_thrust = upstream_force - downstream_force
+    moment = upstream_moment - downstream_moment
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centre_of_pressure = np.where(
+            net_thrust != 0, moment / net_thrust, np.nan
+        )
+
+    return {
+        "upstream_force_n": upstream_force,
+        "downstream_force_n": downstream_force,
+        "net_thrust_n": net_thrust,
+        "overturning_moment_n_m": moment,
+        "centre_of_pressure_m": centre_of_pressure,
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Dock gate of ch3_hydrostatic_dock_gate.py
+    gate_width_m = 12.0  # Width of dock gate (m)
+    water_depth_deep_side_m = 9.0  # Water depth on deeper side (m)
+    water_depth_shallow_side_m = 4.5  # Water depth on shallower side (m)
+
+    # Every gate of a port for every 10-minute tide state of a year
+    gate_count = 40  # Number of dock gates
+    tide_state_count = 365 * 24 * 6  # 10-minute tide states in a year
+    mean_sea_level_m = 6.0  # Mean tide depth above the sills (m)
+    tidal_amplitude_m = 3.5  # M2 tide amplitude (m)
+    m2_period_h = 12.42  # M2 tidal period (h)
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    dock_gate = gate_thrust(
+        water_depth_deep_side_m, water_depth_shallow_side_m, gate_width_m
+    )
+
+    # Impounded dock level of each gate against the tide outside
+    rng = np.random.default_rng(18)
+    gate_widths_m = rng.uniform(10.0, 30.0, gate_count)
+    dock_levels_m = rng.uniform(7.0, 10.0, gate_count)
+    sill_offsets_m = rng.uniform(-1.0, 1.0, gate_count)
+    time_h = np.arange(tide_state_count) / 6
+    tide_m = mean_sea_level_m + tidal_amplitude_m * np.sin(
+        2 * np.pi * time_h / m2_period_h
+    )
+
+    start_time_s = time.perf_counter()
+    port = gate_thrust(
+        dock_levels_m[:, None] + sill_offsets_m[:, None],
+        tide_m[None, :] + sill_offsets_m[:, None],
+        gate_widths_m[:, None],
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print("Dock gate of ch3_hydrostatic_dock_gate.py:")
+    print(f"  Net thrust         : {dock_gate['net_thrust_n']:,.0f} N")
+    print(
+        f"  Centre of pressure : "
+        f"{dock_gate['centre_of_pressure_m']:.3f} m above the sill"
+    )
+    print(
+        f"  Overturning moment : "
+        f"{dock_gate['overturning_moment_n_m'] / 1e6:.3f} MN·m"
+    )
+    print()
+    print(
+        f"{gate_count} gates × {tide_state_count:,} tide states in "
+        f"{elapsed_time_s * 1000:.1f} ms"
+    )
+    print(
+        f"  Largest net thrust  : "
+        f"{port['net_thrust_n'].max() / 1e6:.2f} MN"
+    )
+    print(
+        f"  Largest reverse head: "
+        f"{-port['net_thrust_n'].min() / 1e6:.2f} MN"
+    )
+    print(
+        f"  Largest overturning : "
+        f"{np.abs(port['overturning_moment_n_m']).max() / 1e6:.2f} MN·m"
+    )
@@ -0,0 +1,319 @@
+"""
+Polygonal Immersed Surface Thrust and Centre of Pressure
+
+Generalizes the rectangles of ch3_hydrostatic_load.py (area = depth ×
+width, h_c = depth / 2) to any plane surface bounded by polygons, with
+holes, set vertically or inclined at θ to the horizontal. Hatch covers,
+irregular bulkheads and the circles, semicircles, triangles and
+trapezoids of the book's images are all handled by the same formulas.
+
+The surface is drawn in its own plane with x across and y up the
+slope. Below the free surface, Green's theorem turns every area integral
+into a sum over the polygon edges,
+
+    A = ∮ x dy,  ∫x dA = ∮ x²/2 dy,  ∫y dA = ∮ x y dy,
+    ∫y² dA = ∮ x y² dy,  ∫x y dA = ∮ x² y / 2 dy,
+
+and clipping each edge at the free surface y_s is all that is needed:
+the cut along the surface has dy = 0 and adds nothing. With x linear
+in y along an edge, each clipped edge integral is an exact polynomial
+in y_s (degree 4 at most) between the edge's lowest and highest
+vertex, so the wetted moments are one piecewise polynomial in y_s with
+breaks at the vertex heights. It is built once, by cumulative sums
+over the sorted breaks, and any number of immersion levels are then
+evaluated with a binary search each. The thrust and centre of pressure
+follow from
+
+    F = ρ g sin θ ∫(y_s - y) dA,
+    centre at ∫(y_s - y)² dA / ∫(y_s - y) dA below the surface,
+
+measured along the slope.
+
+Units: coordinates and levels in m, densities in kg/m³, forces in N.
+"""
+
+import numpy as np
+
+GRAVITY_M_PER_S2 = 9.81
+
+# Wetted moments in the order of the piecewise polynomial coefficients
+MOMENTS = ("area", "x_moment", "y_moment", "yy_moment", "xy_moment")
+
+# =============================================================================
+# SHAPES
+# =============================================================================
+
+
+def circle_polygon(centre_x, centre_y, radius, vertex_count=360):
+    """Regular polygon approximating a circle, counter-clockwise."""
+    angle = np.linspace(0, 2 * np.pi, vertex_count, endpoint=False)
+    return np.column_stack(
+        [centre_x + radius * np.cos(angle), centre_y + radius * np.sin(angle)]
+    )
+
+
+def _edges(outline, holes):
+    """
+    Edge start and end points, oriented so holes subtract.
+
+    Returns:
+        Tuple (start, end) of arrays of shape (edges, 2)
+    """
+    starts, ends = [], []
+    for ring, is_hole in [(outline, False)] + [(hole, True) for hole in holes]:
+        ring = np.asarray(ring, dtype=float)
+        following = np.roll(ring, -1, axis=0)
+        signed_area = np.sum(
+            ring[:, 0] * following[:, 1] - following[:, 0] * ring[:, 1]
+        )
+        # Outline counter-clockwise (positive), holes clockwise
+        if (signed_area > 0) == is_hole:
+            ring, following = following[::-1], ring[::-1]
+        starts.append(ring)
+        ends.append(following)
+    return np.concatenate(starts), np.concatenate(ends)
+
+
+# =============================================================================
+# WETTED MOMENTS AND THRUST
+# =============================================================================
+
+
+def _antiderivatives(intercept, slope):
+    """
+    Polynomial coefficients of ∫ f dy along edges x = a + b y.
+
+    Returns:
+        Array of shape (edges, moments, 5) holding the coefficients of
+        y⁰ … y⁴ for every integrand of MOMENTS
+    """
+    a, b = intercept, slope
+    coefficients = np.zeros(a.shape + (len(MOMENTS), 5))
+    coefficients[:, 0, 1:3] = np.column_stack([a, b / 2])  # ∮ x dy
+    coefficients[:, 1, 1:4] = np.column_stack(
+        [a**2 / 2, a * b / 2, b**2 / 6]
+    )  # ∮ x²/2 dy
+    coefficients[:, 2, 2:4] = np.column_stack([a / 2, b / 3])  # ∮ x y dy
+    coefficients[:, 3, 3:5] = np.column_stack([a / 3, b / 4])  # ∮ x y² dy
+    coefficients[:, 4, 2:5] = np.column_stack(
+        [a**2 / 4, a * b / 3, b**2 / 8]
+    )  # ∮ x² y / 2 dy
+    return coefficients
+
+
+def _evaluate(coefficients, y):
+    """Evaluate polynomials of degree 4 (Horner) at y, last axis power."""
+    value = coefficients[..., 4]
+    for power in range(3, -1, -1):
+        value = value * y + coefficients[..., power]
+    return value
+
+
+def wetted_moments(outline, surface_y, holes=()):
+    """
+    Moments of the part of a polygon below y = surface_y.
+
+    Args:
+        outline: Outer boundary vertices, shape (n, 2), either winding
+        surface_y: Free-surface position(s) in the plane, shape (levels,)
+        holes: Sequence of hole boundaries, each shape (m, 2)
+
+    Returns:
+        Dictionary of arrays of shape (levels,): area, x_moment (∫x dA),
+        y_moment (∫y dA), yy_moment (∫y² dA) and xy_moment (∫xy dA)
+    """
+    start, end = _edges(outline, holes)
+    surface_y = np.asarray(surface_y, dtype=float)
+
+    # Horizontal edges have dy = 0 and never contribute
+    sloped = start[:, 1] != end[:, 1]
+    start, end = start[sloped], end[sloped]
+    slope = (end[:, 0] - start[:, 0]) / (end[:, 1] - start[:, 1])
+    intercept = start[:, 0] - slope * start[:, 1]
+    antiderivative = _antiderivatives(intercept, slope)
+
+    # An edge from y0 to y1 clipped at y_s adds s (G(y_s) - G(low)) for
+    # low < y_s < high and s (G(high) - G(low)) above, with s = +1 for
+    # an edge running up and -1 for one running down
+    low = np.minimum(start[:, 1], end[:, 1])
+    high = np.maximum(start[:, 1], end[:, 1])
+    direction = np.sign(end[:, 1] - start[:, 1])[:, None, None]
+    opening = direction * antiderivative
+    closing = -opening.copy()
+    opening[..., 0] -= _evaluate(opening, low[:, None])
+    closing[..., 0] -= _evaluate(closing, high[:, None])
+
+    # Piecewise polynomial: cumulative sum of the changes at each break
+    breaks = np.concatenate([low, high])
+    order = np.argsort(breaks, kind="stable")
+    pieces = np.cumsum(np.concatenate([opening, closing])[order], axis=0)
+    piece = np.searchsorted(breaks[order], surface_y, side="right") - 1
+
+    values = np.where(
+        (piece >= 0)[..., None],
+        _evaluate(pieces[np.maximum(piece, 0)], surface_y[..., None]),
+        0.0,
+    )
+    return {name: values[..., index] for index, name in enumerate(MOMENTS)}
+
+
+def polygon_thrust(
+    outline,
+    surface_levels_m,
+    holes=(),
+    inclination_deg=90.0,
+    density_kg_per_m3=1000.0,
+    gravity_m_per_s2=GRAVITY_M_PER_S2,
+):
+    """
+    Hydrostatic thrust on a plane polygonal surface at many levels.
+
+    Args:
+        outline: Outer boundary vertices (x across, y up the slope),
+            shape (n, 2) (m)
+        surface_levels_m: Free-surface height(s) above y = 0, measured
+            vertically, shape (levels,) (m)
+        holes: Sequence of hole boundaries, each shape (m, 2) (m)
+        inclination_deg: Angle θ of the plane to the horizontal
+            (90 for a vertical surface)
+        density_kg_per_m3: Fluid density (kg/m³)
+        gravity_m_per_s2: Acceleration due to gravity (m/s²)
+
+    Returns:
+        Dictionary of arrays of shape (levels,):
+            wetted_area_m2: Area below the free surface
+            centroid_x_m, centroid_y_m: Centroid of the wetted area
+            centroid_depth_m: Vertical depth h_c of that centroid
+            second_moment_m4: I_c of the wetted area about a horizontal
+                axis through its centroid, in the plane
+            thrust_n: F = ρ g h_c A
+            centre_of_pressure_x_m, centre_of_pressure_y_m: Centre of
+                pressure in the plane (NaN when dry)
+            centre_of_pressure_depth_m: Its vertical depth
+    """
+    sin = np.sin(np.radians(inclination_deg))
+    surface_y = np.asarray(surface_levels_m, dtype=float) / sin
+    moments = wetted_moments(outline, surface_y, holes)
+
+    area = moments["area"]
+    below_moment = surface_y * area - moments["y_moment"]  # ∫(y_s - y) dA
+    below_second = (
+        surface_y**2 * area
+        - 2 * surface_y * moments["y_moment"]
+        + moments["yy_moment"]
+    )  # ∫(y_s - y)² dA
+    below_x_moment = surface_y * moments["x_moment"] - moments["xy_moment"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wet = area > 0
+        centroid_x = np.where(wet, moments["x_moment"] / area, np.nan)
+        centroid_y = np.where(wet, moments["y_moment"] / area, np.nan)
+        second_moment = np.where(
+            wet, below_second - below_moment**2 / area, 0.0
+        )
+        pressure_x = np.where(wet, below_x_moment / below_moment, np.nan)
+        pressure_y = np.where(
+            wet, surface_y - below_second / below_moment, np.nan
+        )
+
+    return {
+        "wetted_area_m2": area,
+        "centroid_x_m": centroid_x,
+        "centroid_y_m": centroid_y,
+        "centroid_depth_m": (surface_y - centroid_y) * sin,
+        "second_moment_m4": second_moment,
+        "thrust_n": density_kg_per_m3 * gravity_m_per_s2 * sin * below_moment,
+        "centre_of_pressure_x_m": pressure_x,
+        "centre_of_pressure_y_m": pressure_y,
+        "centre_of_pressure_depth_m": (surface_y - pressure_y) * sin,
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Bulkhead of ch3_hydrostatic_load.py
+    bulkhead_width_m = 7.0  # Width (m)
+    water_depth_m = 6.0  # Water depth (m)
+
+    # Circular hatch, centre 3 m below the surface
+    hatch_radius_m = 0.6  # Radius (m)
+    hatch_centre_depth_m = 3.0  # Depth of the centre (m)
+
+    # Inclined hatch cover: 4 m × 3 m trapezoid with a 1 m access hole,
+    # on a 40° slope, flooded from dry to 6 m above its foot
+    trapezoid = np.array([[0.0, 0.0], [4.0, 0.0], [3.5, 3.0], [0.5, 3.0]])
+    access_hole = circle_polygon(2.0, 1.5, 0.5)
+    inclination_deg = 40.0
+    surface_levels_m = np.linspace(0.0, 6.0, 100_001)
+
+    # =========================================================================
+    # CHECKS AGAINST THE RECTANGLE AND CIRCLE FORMULAS
+    # =========================================================================
+
+    bulkhead = np.array(
+        [
+            [0.0, 0.0],
+            [bulkhead_width_m, 0.0],
+            [bulkhead_width_m, water_depth_m],
+            [0.0, water_depth_m],
+        ]
+    )
+    bulkhead_thrust = polygon_thrust(bulkhead, [water_depth_m])
+
+    hatch = polygon_thrust(
+        circle_polygon(0.0, 0.0, hatch_radius_m, 3_600),
+        [hatch_centre_depth_m],
+    )
+    hatch_exact_depth_m = hatch_centre_depth_m + (
+        np.pi * hatch_radius_m**4 / 4
+    ) / (np.pi * hatch_radius_m**2 * hatch_centre_depth_m)
+
+    # =========================================================================
+    # INCLINED HATCH COVER WITH A HOLE, MANY LEVELS
+    # =========================================================================
+
+    start_time_s = time.perf_counter()
+    cover = polygon_thrust(
+        trapezoid,
+        surface_levels_m,
+        holes=[access_hole],
+        inclination_deg=inclination_deg,
+        density_kg_per_m3=1025.0,
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print("Bulkhead of ch3_hydrostatic_load.py:")
+    print(
+        f"  Thrust {bulkhead_thrust['thrust_n'][0] / 1e3:,.1f} kN at "
+        f"{bulkhead_thrust['centre_of_pressure_depth_m'][0]:.3f} m depth "
+        f"(2/3 of the depth = {2 * water_depth_m / 3:.3f} m)"
+    )
+    print("Circular hatch:")
+    print(
+        f"  Centre of pressure depth "
+        f"{hatch['centre_of_pressure_depth_m'][0]:.5f} m "
+        f"(h_c + I_c / (A h_c) = {hatch_exact_depth_m:.5f} m)"
+    )
+    print()
+    print(
+        f"Inclined hatch cover, {surface_levels_m.size:,} levels in "
+        f"{elapsed_time_s * 1000:.1f} ms"
+    )
+    for level_m in (1.0, 2.0, 6.0):
+        index = np.searchsorted(surface_levels_m, level_m)
+        print(
+            f"  Level {level_m:.1f} m: wetted area "
+            f"{cover['wetted_area_m2'][index]:.3f} m², thrust "
+            f"{cover['thrust_n'][index] / 1e3:,.1f} kN, centre of "
+            f"pressure {cover['centre_of_pressure_depth_m'][index]:.3f} m "
+            f"deep"
+        )
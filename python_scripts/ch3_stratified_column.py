@@ -0,0 +1,251 @@
+"""
+N-Layer Stratified Fluid Column Solver
+
+Generalises ch3_layered_fluids.py (oil over seawater) to any number of
+immiscible layers in any number of tanks. Building a column adds up the
+layer pressures ρ g h once, so the pressure at every interface is a
+prefix sum; the pressure at any depth is then the pressure at the
+interface above it plus ρ g (d - D) of the layer it lies in, and finding
+that layer is a binary search (np.searchsorted), O(log n) per query.
+
+Tanks with fewer layers are padded with zero-thickness layers. Each tank's
+interface depths are shifted by a per-tank offset so the interfaces of
+all tanks form one sorted array, and a batch of (tank, depth) queries is
+one searchsorted call. After a gauge update, only the column is rebuilt.
+
+Units: depths and thicknesses in m (depths measured down from the free
+surface), densities in kg/m³ and pressures in kPa.
+"""
+
+import numpy as np
+
+GRAVITY_M_PER_S2 = 9.81
+
+# =============================================================================
+# COLUMN BUILD (PREFIX SUMS)
+# =============================================================================
+
+
+def stratified_column(
+    layer_thicknesses_m,
+    layer_densities_kg_per_m3,
+    surface_pressure_kpa=0.0,
+    gravity_m_per_s2=GRAVITY_M_PER_S2,
+):
+    """
+    Interface depths and pressures of stratified fluid columns.
+
+    Args:
+        layer_thicknesses_m: Layer thicknesses from the top down, one
+            sequence per tank (ragged lists allowed) or a single
+            sequence for one tank (m)
+        layer_densities_kg_per_m3: Matching layer densities (kg/m³)
+        surface_pressure_kpa: Pressure on the free surface, 0 for gauge
+            or atmospheric for absolute pressures, per tank (kPa)
+        gravity_m_per_s2: Acceleration due to gravity (m/s²)
+
+    Returns:
+        Dictionary with, for tanks × (max layers + 1) interfaces:
+            interface_depth_m: Depth of every interface (padded at the
+                bottom depth)
+            interface_pressure_kpa: Pressure at every interface
+            density_kg_per_m3: Density of the layer below each interface
+                (padded with the bottom layer's density)
+            bottom_depth_m, bottom_pressure_kpa: Per tank
+            layer_count: Real layers per tank
+            search_depth_m: Offset interface depths of all tanks as one
+                sorted array, used by column_pressure
+            tank_offset_m: Offset added to each tank's depths
+            gravity_m_per_s2: Gravity used, for the in-layer pressures
+    """
+    if np.ndim(layer_thicknesses_m[0]) == 0:
+        layer_thicknesses_m = [layer_thicknesses_m]
+        layer_densities_kg_per_m3 = [layer_densities_kg_per_m3]
+    layer_count = np.array([len(layers) for layers in layer_thicknesses_m])
+    if np.any(layer_count == 0):
+        raise ValueError("Every tank needs at least one layer")
+    if any(
+        len(thicknesses) != len(densities)
+        for thicknesses, densities in zip(
+            layer_thicknesses_m, layer_densities_kg_per_m3
+        )
+    ):
+        raise ValueError("Each layer needs one thickness and one density")
+
+    # Pad the ragged tanks into (tanks, layers) arrays
+    tank_count, width = layer_count.size, layer_count.max()
+    filled = np.arange(width) < layer_count[:, None]
+    thickness = np.zeros((tank_count, width))
+    density = np.zeros((tank_count, width))
+    thickness[filled] = np.concatenate(layer_thicknesses_m)
+    density[filled] = np.concatenate(layer_densities_kg_per_m3)
+    if np.any(thickness < 0):
+        raise ValueError("Layer thicknesses cannot be negative")
+    bottom_density = density[np.arange(tank_count), layer_count - 1]
+    density = np.where(filled, density, bottom_density[:, None])
+
+    # Prefix sums of thickness and of ρ g h give depths and pressures
+    start = np.zeros((tank_count, 1))
+    interface_depth = np.hstack([start, np.cumsum(thickness, axis=1)])
+    layer_pressure = density * gravity_m_per_s2 * thickness / 1000
+    interface_pressure = np.asarray(surface_pressure_kpa, dtype=float)[
+        ..., None
+    ] + np.hstack([start, np.cumsum(layer_pressure, axis=1)])
+    interface_pressure = np.broadcast_to(
+        interface_pressure, interface_depth.shape
+    )
+
+    # Stack the tanks end to end, each shifted past the one before it
+    spacing = interface_depth[:, -1].max() + 1.0
+    tank_offset = spacing * np.arange(tank_count)
+    search_depth = (interface_depth + tank_offset[:, None]).ravel()
+
+    return {
+        "interface_depth_m": interface_depth,
+        "interface_pressure_kpa": interface_pressure,
+        "density_kg_per_m3": np.hstack([density, bottom_density[:, None]]),
+        "bottom_depth_m": interface_depth[:, -1],
+        "bottom_pressure_kpa": interface_pressure[:, -1],
+        "layer_count": layer_count,
+        "search_depth_m": search_depth,
+        "tank_offset_m": tank_offset,
+        "gravity_m_per_s2": gravity_m_per_s2,
+    }
+
+
+# =============================================================================
+# PRESSURE QUERIES (BINARY SEARCH)
+# =============================================================================
+
+
+def column_pressure(column, depths_m, tanks=None):
+    """
+    Pressure at arbitrary depths in stratified columns.
+
+    Args:
+        column: Result of stratified_column
+        depths_m: Query depth(s) below the free surface (m)
+        tanks: Tank index of each query, broadcast with depths_m; if
+            None, every depth is queried in every tank and the result
+            has a leading tanks axis
+
+    Returns:
+        Pressures (kPa) with the broadcast shape of the queries; NaN
+        above the free surface or below the bottom of the tank
+    """
+    depth = np.asarray(depths_m, dtype=float)
+    tank_count = column["tank_offset_m"].size
+    if tanks is None:
+        tanks = np.arange(tank_count).reshape((-1,) + (1,) * depth.ndim)
+    depth, tanks = np.broadcast_arrays(depth, np.asarray(tanks))
+    if np.any((tanks < 0) | (tanks >= tank_count)):
+        raise ValueError("Tank index out of range")
+
+    # One search over the offset interfaces of every tank; the last
+    # interface at or above the query is the top of its layer
+    interfaces = column["interface_depth_m"].shape[1]
+    flat = np.searchsorted(
+        column["search_depth_m"],
+        depth + column["tank_offset_m"][tanks],
+        side="right",
+    )
+    layer = np.clip(flat - 1 - tanks * interfaces, 0, interfaces - 1)
+
+    top_depth = column["interface_depth_m"][tanks, layer]
+    pressure = column["interface_pressure_kpa"][tanks, layer] + (
+        column["density_kg_per_m3"][tanks, layer]
+        * column["gravity_m_per_s2"]
+        * (depth - top_depth)
+        / 1000
+    )
+    outside = (depth < 0) | (depth > column["bottom_depth_m"][tanks])
+    return np.where(outside, np.nan, pressure)
+
+
+if __name__ == "__main__":
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Tank of ch3_layered_fluids.py: 10 m of oil over 4 m of seawater
+    oil_density_kg_per_m3 = 850.0
+    oil_layer_height_m = 10.0
+    seawater_density_kg_per_m3 = 1020.0
+    seawater_layer_height_m = 4.0
+    atmospheric_pressure_kpa = 101.3
+
+    # Slop and settling tanks: 2 to 6 layers of oil, emulsion, water and
+    # sludge, each tank re-gauged and queried at many depths
+    tank_count = 500
+    queries_per_update = 200_000
+    layer_densities_kg_per_m3 = np.array([820.0, 870.0, 950.0, 1025.0, 1300])
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    single = stratified_column(
+        [oil_layer_height_m, seawater_layer_height_m],
+        [oil_density_kg_per_m3, seawater_density_kg_per_m3],
+        atmospheric_pressure_kpa,
+    )
+    interface_kpa = column_pressure(single, oil_layer_height_m)[0]
+
+    rng = np.random.default_rng(22)
+    thicknesses, densities = [], []
+    for _ in range(tank_count):
+        count = rng.integers(2, 7)
+        thicknesses.append(rng.uniform(0.05, 4.0, count))
+        densities.append(np.sort(rng.choice(layer_densities_kg_per_m3, count)))
+
+    start_time_s = time.perf_counter()
+    fleet = stratified_column(thicknesses, densities)
+    build_time_s = time.perf_counter() - start_time_s
+
+    query_tanks = rng.integers(0, tank_count, queries_per_update)
+    query_depths_m = rng.uniform(0, 1, queries_per_update) * (
+        fleet["bottom_depth_m"][query_tanks]
+    )
+    start_time_s = time.perf_counter()
+    pressures_kpa = column_pressure(fleet, query_depths_m, query_tanks)
+    query_time_s = time.perf_counter() - start_time_s
+
+    # Brute-force check: walk down the layers of a few queries
+    largest_error_kpa = 0.0
+    for query in range(200):
+        tank, depth = query_tanks[query], query_depths_m[query]
+        pressure, top = 0.0, 0.0
+        for thickness, density in zip(thicknesses[tank], densities[tank]):
+            wetted = np.clip(depth - top, 0.0, thickness)
+            pressure += density * GRAVITY_M_PER_S2 * wetted / 1000
+            top += thickness
+        largest_error_kpa = max(
+            largest_error_kpa, abs(pressure - pressures_kpa[query])
+        )
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print("Tank of ch3_layered_fluids.py (absolute pressures):")
+    print(f"  At the oil/seawater interface : {interface_kpa:.4f} kPa")
+    print(
+        f"  At the bottom                 : "
+        f"{single['bottom_pressure_kpa'][0]:.4f} kPa"
+    )
+    print()
+    print(
+        f"{tank_count} tanks, {fleet['layer_count'].sum():,} layers: "
+        f"column built in {build_time_s * 1000:.2f} ms"
+    )
+    print(
+        f"{queries_per_update:,} pressure queries in "
+        f"{query_time_s * 1000:.1f} ms"
+    )
+    print(f"Largest error against a layer walk: {largest_error_kpa:.2e} kPa")
+    print(
+        f"Highest bottom pressure: {fleet['bottom_pressure_kpa'].max():.2f} "
+        f"kPa in tank {np.argmax(fleet['bottom_pressure_kpa'])}"
+    )
@@ -0,0 +1,392 @@
+"""
+Tank Calibration and Gauging Table Generator
+
+Precomputes, for every tank of a fleet, the tables a tank monitoring
+system needs to turn a sounding into contents and structural loads, as
+in ch3_oil_tank.py but for every sounding at once:
+
+    sounding → volume, mass, bottom pressure, bottom plate force and
+               end plate force
+
+Each tank is a prism of length L with a cross-section of width b(z) at
+height z above the bottom (rectangular, horizontal cylinder or any
+width table). For a sounding s, with the liquid up a sounding pipe once
+s passes the tank top H,
+
+    V = L ∫ b dz                      (0 to min(s, H))
+    F_end = ρ g ∫ b (s - z) dz        (0 to min(s, H))
+    F_bottom = ρ g s L b(0)
+
+The integrals are cumulative sums on a fine sub-grid. The tables of a
+fleet share one uniform sounding step and are stored as a single float32
+array (tanks, quantities, soundings) with the step beside it, so a
+lookup is an index s / step and a linear interpolation: O(1) for each
+reading, with no geometry recomputed.
+
+Units: lengths in m, densities in kg/m³, volumes in m³, masses in t,
+pressures in kPa and forces in kN.
+"""
+
+import numpy as np
+
+GRAVITY_M_PER_S2 = 9.81
+QUANTITIES = (
+    "volume_m3",
+    "mass_t",
+    "bottom_pressure_kpa",
+    "bottom_force_kn",
+    "end_plate_force_kn",
+)
+
+# =============================================================================
+# TANK CROSS-SECTIONS
+# =============================================================================
+
+
+def rectangular_section(width_m):
+    """
+    Width function of a rectangular cross-section.
+
+    Args:
+        width_m: Tank width (m)
+
+    Returns:
+        Function of height z (m) giving the section width (m)
+    """
+    return lambda z: np.full_like(z, width_m, dtype=float)
+
+
+def circular_section(diameter_m):
+    """
+    Width function of a horizontal cylindrical tank.
+
+    Args:
+        diameter_m: Tank diameter (m)
+
+    Returns:
+        Function of height z (m) giving the chord width (m)
+    """
+    return lambda z: 2 * np.sqrt(np.clip(z * (diameter_m - z), 0.0, None))
+
+
+def tabulated_section(heights_m, widths_m):
+    """
+    Width function interpolated from a width table (hoppers, chamfers).
+
+    Args:
+        heights_m: Increasing heights above the tank bottom (m)
+        widths_m: Section width at each height (m)
+
+    Returns:
+        Function of height z (m) giving the section width (m)
+    """
+    return lambda z: np.interp(z, heights_m, widths_m)
+
+
+# =============================================================================
+# TABLE GENERATION
+# =============================================================================
+
+
+def gauging_table(
+    length_m,
+    section,
+    height_m,
+    density_kg_per_m3,
+    max_sounding_m=None,
+    step_m=0.01,
+    subdivisions=16,
+    gravity_m_per_s2=GRAVITY_M_PER_S2,
+):
+    """
+    Gauging table of one prismatic tank.
+
+    Args:
+        length_m: Tank length (m)
+        section: Width function b(z), e.g. from rectangular_section
+        height_m: Tank height H (m)
+        density_kg_per_m3: Liquid density (kg/m³)
+        max_sounding_m: Highest sounding, above H for a sounding pipe;
+            defaults to H (m)
+        step_m: Sounding step of the table (m)
+        subdivisions: Integration points per table step
+        gravity_m_per_s2: Acceleration due to gravity (m/s²)
+
+    Returns:
+        float32 array (quantities, soundings) in QUANTITIES order, for
+        soundings 0, step_m, 2 step_m, ... up to max_sounding_m
+    """
+    if max_sounding_m is None:
+        max_sounding_m = height_m
+    if step_m <= 0 or max_sounding_m <= 0:
+        raise ValueError("The step and the highest sounding must be > 0")
+    sounding = step_m * np.arange(int(np.ceil(max_sounding_m / step_m)) + 1)
+
+    # Cumulative ∫ b dz and ∫ z b dz on a fine grid (trapezoidal rule)
+    fine_count = int(np.ceil(height_m / step_m)) * subdivisions
+    z = np.linspace(0.0, height_m, fine_count + 1)
+    b = section(z)
+    dz = np.diff(z)
+    area = np.concatenate([[0.0], np.cumsum(dz * (b[1:] + b[:-1]) / 2)])
+    first_moment = np.concatenate(
+        [[0.0], np.cumsum(dz * (z[1:] * b[1:] + z[:-1] * b[:-1]) / 2)]
+    )
+
+    wetted = np.minimum(sounding, height_m)
+    wetted_area = np.interp(wetted, z, area)
+    wetted_moment = np.interp(wetted, z, first_moment)
+    unit_weight = density_kg_per_m3 * gravity_m_per_s2 / 1000
+
+    volume = length_m * wetted_area
+    bottom_pressure = unit_weight * sounding
+    table = np.stack(
+        [
+            volume,
+            density_kg_per_m3 * volume / 1000,
+            bottom_pressure,
+            bottom_pressure * length_m * section(np.zeros(1))[0],
+            unit_weight * (sounding * wetted_area - wetted_moment),
+        ]
+    )
+    return table.astype(np.float32)
+
+
+def fleet_tables(tanks, step_m=0.01):
+    """
+    Gauging tables of a fleet of tanks, padded to one array.
+
+    Args:
+        tanks: Sequence of dictionaries of gauging_table arguments
+            (length_m, section, height_m, density_kg_per_m3 and
+            optionally max_sounding_m)
+        step_m: Sounding step, the same for every tank (m)
+
+    Returns:
+        (tables, max_sounding_m): float32 array (tanks, quantities,
+        soundings), padded with each tank's last row, and the highest
+        sounding of each tank (m)
+    """
+    tables = [gauging_table(step_m=step_m, **tank) for tank in tanks]
+    sounding_count = max(table.shape[1] for table in tables)
+    fleet = np.empty(
+        (len(tables), len(QUANTITIES), sounding_count), dtype=np.float32
+    )
+    for index, table in enumerate(tables):
+        fleet[index, :, : table.shape[1]] = table
+        fleet[index, :, table.shape[1] :] = table[:, -1:]
+    max_sounding = np.array(
+        [step_m * (table.shape[1] - 1) for table in tables]
+    )
+    return fleet, max_sounding
+
+
+def save_tables(path, tables, step_m, max_sounding_m):
+    """Store fleet tables with their step and limits in one .npz file."""
+    np.savez(
+        path,
+        tables=tables,
+        step_m=step_m,
+        max_sounding_m=max_sounding_m,
+        quantities=np.array(QUANTITIES),
+    )
+
+
+def load_tables(path):
+    """Read fleet tables written by save_tables."""
+    with np.load(path) as stored:
+        return (
+            stored["tables"],
+            float(stored["step_m"]),
+            stored["max_sounding_m"],
+        )
+
+
+# =============================================================================
+# LOOKUP
+# =============================================================================
+
+
+def gauge_lookup(tables, step_m, tanks, soundings_m, max_sounding_m=None):
+    """
+    Interpolated contents and loads for arrays of soundings.
+
+    Args:
+        tables: Fleet tables (tanks, quantities, soundings)
+        step_m: Sounding step of the tables (m)
+        tanks: Tank index of each reading
+        soundings_m: Sounding of each reading, broadcast with tanks (m)
+        max_sounding_m: Highest sounding of each tank; readings outside
+            0 to this limit give NaN (default: clipped to the table)
+
+    Missing soundings (NaN) give NaN without affecting the other
+    readings, as in the tide pipeline of ch3_tide_gate_pipeline.py.
+
+    Returns:
+        Dictionary of float64 arrays, one per entry of QUANTITIES
+    """
+    tanks, sounding = np.broadcast_arrays(
+        np.asarray(tanks), np.asarray(soundings_m, dtype=float)
+    )
+    last = tables.shape[2] - 1
+
+    # Missing readings (NaN, e.g. sensor dropouts) and, with limits,
+    # out-of-range ones give NaN; only the rest index the tables
+    valid = np.isfinite(sounding)
+    if max_sounding_m is not None:
+        valid &= (sounding >= 0) & (
+            sounding <= np.asarray(max_sounding_m)[tanks]
+        )
+    values = np.full(sounding.shape + (tables.shape[1],), np.nan)
+
+    # Index and fraction of the sounding step: O(1) per reading
+    position = np.clip(sounding[valid] / step_m, 0.0, last)
+    index = np.minimum(position.astype(np.intp), last - 1)
+    fraction = (position - index)[:, None]
+    lower = tables[tanks[valid], :, index].astype(float)
+    upper = tables[tanks[valid], :, index + 1].astype(float)
+    values[valid] = lower + fraction * (upper - lower)
+    return {name: values[..., k] for k, name in enumerate(QUANTITIES)}
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Oil tank of ch3_oil_tank.py: 10 m × 4 m × 6 m, oil 5 m up the
+    # sounding pipe (sounding 11 m)
+    tank_length_m = 10.0
+    tank_width_m = 4.0
+    tank_height_m = 6.0
+    sounding_pipe_height_m = 5.0
+    oil_density_kg_per_m3 = 900.0
+
+    # Fleet: rectangular, cylindrical and hopper-bottomed tanks
+    fleet_size = 60
+    readings_per_second = 100_000
+    step_m = 0.005
+
+    # =========================================================================
+    # TABLES
+    # =========================================================================
+
+    rng = np.random.default_rng(23)
+    tanks = [
+        {
+            "length_m": tank_length_m,
+            "section": rectangular_section(tank_width_m),
+            "height_m": tank_height_m,
+            "density_kg_per_m3": oil_density_kg_per_m3,
+            "max_sounding_m": tank_height_m + sounding_pipe_height_m,
+        }
+    ]
+    for index in range(1, fleet_size):
+        height = rng.uniform(3.0, 12.0)
+        section = (
+            rectangular_section(rng.uniform(2.0, 10.0)),
+            circular_section(height),
+            tabulated_section([0.0, 1.0, height], [1.0, 6.0, 6.0]),
+        )[index % 3]
+        tanks.append(
+            {
+                "length_m": rng.uniform(5.0, 25.0),
+                "section": section,
+                "height_m": height,
+                "density_kg_per_m3": rng.uniform(800.0, 1025.0),
+                "max_sounding_m": height + rng.uniform(0.0, 3.0),
+            }
+        )
+
+    start_time_s = time.perf_counter()
+    tables, max_sounding_m = fleet_tables(tanks, step_m)
+    build_time_s = time.perf_counter() - start_time_s
+
+    table_dir = tempfile.mkdtemp(prefix="gauging_tables_")
+    table_path = os.path.join(table_dir, "fleet.npz")
+    save_tables(table_path, tables, step_m, max_sounding_m)
+    file_size_kb = os.path.getsize(table_path) / 1024
+    tables, step_m, max_sounding_m = load_tables(table_path)
+    os.remove(table_path)
+    os.rmdir(table_dir)
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    oil_tank = gauge_lookup(
+        tables, step_m, 0, tank_height_m + sounding_pipe_height_m
+    )
+    end_plate_exact_kn = (
+        oil_density_kg_per_m3
+        * GRAVITY_M_PER_S2
+        * (sounding_pipe_height_m + tank_height_m / 2)
+        * tank_width_m
+        * tank_height_m
+        / 1000
+    )
+    bottom_exact_kn = (
+        oil_density_kg_per_m3
+        * GRAVITY_M_PER_S2
+        * (tank_height_m + sounding_pipe_height_m)
+        * tank_length_m
+        * tank_width_m
+        / 1000
+    )
+
+    # Half-full cylinder check: V = L π D² / 8
+    cylinder = 1
+    half_full = gauge_lookup(
+        tables, step_m, cylinder, tanks[cylinder]["height_m"] / 2
+    )
+    half_full_exact_m3 = (
+        tanks[cylinder]["length_m"] * np.pi * tanks[cylinder]["height_m"] ** 2
+    ) / 8
+
+    # One second of readings across the fleet
+    reading_tanks = rng.integers(0, fleet_size, readings_per_second)
+    soundings_m = rng.uniform(0, 1, readings_per_second) * (
+        max_sounding_m[reading_tanks]
+    )
+    soundings_m[rng.choice(readings_per_second, 100, replace=False)] = np.nan
+    start_time_s = time.perf_counter()
+    readings = gauge_lookup(
+        tables, step_m, reading_tanks, soundings_m, max_sounding_m
+    )
+    lookup_time_s = time.perf_counter() - start_time_s
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print("Oil tank of ch3_oil_tank.py at an 11 m sounding:")
+    print(
+        f"  End plate load : {oil_tank['end_plate_force_kn']:,.1f} kN "
+        f"(ρ g h_c A = {end_plate_exact_kn:,.1f} kN)"
+    )
+    print(
+        f"  Bottom load    : {oil_tank['bottom_force_kn']:,.1f} kN "
+        f"(ρ g h A = {bottom_exact_kn:,.1f} kN)"
+    )
+    print(
+        f"  Contents       : {oil_tank['volume_m3']:.1f} m³, "
+        f"{oil_tank['mass_t']:.1f} t"
+    )
+    print(
+        f"Half-full cylinder: {half_full['volume_m3']:.3f} m³ "
+        f"(L π D² / 8 = {half_full_exact_m3:.3f} m³)"
+    )
+    print()
+    print(
+        f"{fleet_size} tanks tabulated in {build_time_s * 1000:.1f} ms, "
+        f"{file_size_kb:,.0f} kB on disk"
+    )
+    print(
+        f"{readings_per_second:,} readings converted in "
+        f"{lookup_time_s * 1000:.1f} ms "
+        f"({np.isnan(readings['volume_m3']).sum()} dropouts), highest "
+        f"bottom pressure {np.nanmax(readings['bottom_pressure_kpa']):.1f} kPa"
+    )
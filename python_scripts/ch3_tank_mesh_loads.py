@@ -0,0 +1,513 @@
+"""
+Mesh-Based Hydrostatic Wall Loading for Arbitrary Tank Geometry
+
+The tank scripts of chapter 3 (ch3_oil_tank.py, ch3_layered_fluids.py)
+load flat rectangular plates. Real tanks have sloped hoppers and curved
+bilges, so here the tank surface is a triangulated mesh read from an
+STL file (ASCII or binary) or an OBJ file, and every facet is loaded by
+the pressure p = ρ g (h - z) of a fill level h, zero above it.
+
+Each facet cut by the fill level is split along the cut into a
+triangle and a quadrilateral, and with the head h - z taken as linear
+over the whole facet the wetted part is either the bottom triangle or
+the facet less the top triangle. Over any triangle the integrals of a
+linear p are exact:
+
+    ∫ p dA = A (p1 + p2 + p3) / 3
+    ∫ p r dA = A (Σ p_i r_i + Σ p_i Σ r_i) / 12
+
+The fluid pushes each facet along its outward normal n (vertices
+anticlockwise seen from outside), so dF = p n dA and the moment about a
+point O is M = (∫ p (r - O) dA) × n. The level-independent facet data
+(normals, sorted vertices, vertex sums) are prepared once per mesh, so
+for each fill level the whole facets take a few array operations and
+only the thin band of cut facets is clipped. Facet loads are summed into
+panels (STL solids or OBJ groups) for the structural checks.
+
+Units: coordinates in m (z upward), densities in kg/m³, pressures in Pa,
+forces in N and moments in N·m.
+"""
+
+import numpy as np
+
+GRAVITY_M_PER_S2 = 9.81
+
+# Binary STL: 80-byte header, uint32 facet count, then 50-byte records
+STL_RECORD = np.dtype(
+    [
+        ("normal", "<f4", (3,)),
+        ("vertices", "<f4", (3, 3)),
+        ("attribute", "<u2"),
+    ]
+)
+
+# =============================================================================
+# MESH READERS
+# =============================================================================
+
+
+def read_stl(path):
+    """
+    Read an ASCII or binary STL file.
+
+    Args:
+        path: STL file; each solid of an ASCII file becomes a panel
+
+    Returns:
+        (triangles, panels, panel_names): vertices (facets, 3, 3) in m,
+        panel index of each facet and the panel names
+    """
+    with open(path, "rb") as mesh:
+        data = mesh.read()
+
+    # A binary file is exactly as long as its facet count says
+    if len(data) >= 84:
+        count = int(np.frombuffer(data, "<u4", 1, 80)[0])
+        if len(data) == 84 + count * STL_RECORD.itemsize:
+            records = np.frombuffer(data, STL_RECORD, count, 84)
+            triangles = records["vertices"].astype(float)
+            return triangles, np.zeros(count, dtype=np.intp), ["solid"]
+
+    tokens = np.array(data.decode("ascii", errors="replace").split())
+    vertex = np.flatnonzero(tokens == "vertex")
+    if vertex.size == 0 or vertex.size % 3:
+        raise ValueError(f"{path} is not a valid STL file")
+    coordinates = tokens[vertex[:, None] + np.arange(1, 4)].astype(float)
+    triangles = coordinates.reshape(-1, 3, 3)
+
+    solid = np.flatnonzero(tokens == "solid")
+    names = [
+        (
+            tokens[start + 1]
+            if start + 1 < tokens.size and tokens[start + 1] != "facet"
+            else f"solid_{index}"
+        )
+        for index, start in enumerate(solid)
+    ]
+    panels = np.searchsorted(solid, vertex[::3]) - 1
+    return triangles, np.maximum(panels, 0), names or ["solid"]
+
+
+def read_obj(path):
+    """
+    Read a Wavefront OBJ file, with its groups (g or o) as panels.
+
+    Polygon faces are split into triangles as fans about their first
+    vertex; texture and normal indices are ignored.
+
+    Args:
+        path: OBJ file
+
+    Returns:
+        (triangles, panels, panel_names), as for read_stl
+    """
+    vertices, faces, panels, names = [], [], [], []
+    panel = None
+    with open(path) as mesh:
+        for line in mesh:
+            fields = line.split()
+            if not fields:
+                continue
+            if fields[0] == "v":
+                vertices.append([float(value) for value in fields[1:4]])
+            elif fields[0] in ("g", "o"):
+                name = " ".join(fields[1:]) or "default"
+                if name not in names:
+                    names.append(name)
+                panel = names.index(name)
+            elif fields[0] == "f":
+                corners = [int(field.split("/")[0]) for field in fields[1:]]
+                corners = [
+                    corner - 1 if corner > 0 else len(vertices) + corner
+                    for corner in corners
+                ]
+                if panel is None:
+                    names.append("default")
+                    panel = len(names) - 1
+                for second, third in zip(corners[1:-1], corners[2:]):
+                    faces.append([corners[0], second, third])
+                    panels.append(panel)
+
+    if not faces:
+        raise ValueError(f"{path} has no faces")
+    triangles = np.array(vertices)[np.array(faces)]
+    return triangles, np.array(panels, dtype=np.intp), names
+
+
+# =============================================================================
+# FACET AND PANEL LOADS
+# =============================================================================
+
+
+def mesh_geometry(triangles):
+    """
+    Fill-level independent facet data, computed once per mesh.
+
+    Args:
+        triangles: Facet vertices (facets, 3, 3), anticlockwise seen
+            from outside the tank (m)
+
+    Returns:
+        Dictionary with area_m2 (facets,), normal (facets, 3), vertices
+        (3, facets, 3) sorted from the lowest up, and the sums Σ z_i,
+        Σ r_i and Σ z_i r_i + Σ z_i Σ r_i of each facet's vertices
+    """
+    triangles = np.asarray(triangles, dtype=float)
+    area_vector = 0.5 * np.cross(
+        triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    )
+    area = np.linalg.norm(area_vector, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal = np.where(area[:, None] > 0, area_vector / area[:, None], 0)
+    order = np.argsort(triangles[:, :, 2], axis=1)
+    vertices = np.take_along_axis(triangles, order[:, :, None], axis=1)
+
+    heights = vertices[:, :, 2]
+    corner_sum = vertices.sum(axis=1)
+    height_sum = heights.sum(axis=1)
+    return {
+        "area_m2": area,
+        "normal": normal,
+        "vertices": np.ascontiguousarray(np.moveaxis(vertices, 1, 0)),
+        "heights": np.ascontiguousarray(heights.T),
+        "height_sum": height_sum,
+        "corner_sum": corner_sum,
+        "moment_offset": np.einsum("fv,fvk->fk", heights, vertices)
+        + height_sum[:, None] * corner_sum,
+    }
+
+
+def _linear_integrals(area, corners, heads):
+    """∫ h dA and ∫ h r dA over triangles for a linear head h."""
+    head_sum = heads[0] + heads[1] + heads[2]
+    first_moment = (
+        heads[0, :, None] * corners[0]
+        + heads[1, :, None] * corners[1]
+        + heads[2, :, None] * corners[2]
+        + head_sum[:, None] * (corners[0] + corners[1] + corners[2])
+    )
+    return area * head_sum / 3, area[:, None] * first_moment / 12
+
+
+def facet_loads(
+    mesh,
+    fill_level_m,
+    density_kg_per_m3=1000.0,
+    moment_point=(0.0, 0.0, 0.0),
+    gravity_m_per_s2=GRAVITY_M_PER_S2,
+):
+    """
+    Hydrostatic pressure, force and moment on every facet of a mesh.
+
+    Args:
+        mesh: Result of mesh_geometry, or facet vertices (facets, 3, 3)
+            anticlockwise seen from outside the tank (m)
+        fill_level_m: Level h of the free surface (m)
+        density_kg_per_m3: Fluid density (kg/m³)
+        moment_point: Point O for the moments (m)
+        gravity_m_per_s2: Acceleration due to gravity (m/s²)
+
+    Returns:
+        Dictionary of per-facet arrays:
+            wetted_area_m2: Area below the fill level
+            mean_pressure_pa: Average pressure on the wetted area
+            force_n: Force of the fluid on the facet (facets, 3)
+            moment_n_m: Its moment about moment_point (facets, 3)
+            centre_of_pressure_m: Where it acts (facets, 3), NaN if dry
+    """
+    if not isinstance(mesh, dict):
+        mesh = mesh_geometry(mesh)
+    area, normal = mesh["area_m2"], mesh["normal"]
+    wet_count = (mesh["heights"] <= fill_level_m).sum(axis=0)
+
+    # Whole facets, with the head h - z_i at the vertices: from the
+    # stored vertex sums, ∫ h dA = A (3h - Σ z_i) / 3 and
+    # ∫ h r dA = A (4h Σ r_i - Σ z_i r_i - Σ z_i Σ r_i) / 12
+    whole = wet_count >= 2
+    head = np.where(whole, area * (3 * fill_level_m - mesh["height_sum"]), 0)
+    first_moment = np.where(
+        whole[:, None],
+        area[:, None]
+        * (4 * fill_level_m * mesh["corner_sum"] - mesh["moment_offset"]),
+        0.0,
+    )
+    head /= 3
+    first_moment /= 12
+    wetted_area = np.where(whole, area, 0.0)
+
+    # Facets cut by the surface, split along the cut into a triangle and
+    # a quadrilateral: the wetted part is the bottom triangle (one wet
+    # vertex) or the whole facet less the top triangle (two), taking the
+    # head as linear and negative above the surface
+    cut = np.flatnonzero((wet_count == 1) | (wet_count == 2))
+    low, middle, high = mesh["vertices"][:, cut]
+    heads = fill_level_m - mesh["heights"][:, cut]
+
+    def fraction(wet, dry):
+        rise = heads[wet] - heads[dry]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.clip(np.where(rise > 0, heads[wet] / rise, 0.0), 0, 1)
+
+    low_middle, low_high, middle_high = (
+        fraction(0, 1),
+        fraction(0, 2),
+        fraction(1, 2),
+    )
+    one = wet_count[cut] == 1
+    tip = np.where(one[:, None], low, high)
+    along_middle = np.where(
+        one[:, None],
+        low + low_middle[:, None] * (middle - low),
+        middle + middle_high[:, None] * (high - middle),
+    )
+    along_long = low + low_high[:, None] * (high - low)
+    sub_area = area[cut] * np.where(
+        one, low_middle * low_high, (1 - middle_high) * (1 - low_high)
+    )
+    sub_heads = np.stack(
+        [
+            np.where(one, heads[0], heads[2]),
+            fill_level_m - along_middle[:, 2],
+            fill_level_m - along_long[:, 2],
+        ]
+    )
+    sub_head, sub_moment = _linear_integrals(
+        sub_area, (tip, along_middle, along_long), sub_heads
+    )
+    sign = np.where(one, 1.0, -1.0)
+    head[cut] += sign * sub_head
+    first_moment[cut] += sign[:, None] * sub_moment
+    wetted_area[cut] += sign * sub_area
+
+    unit_weight = density_kg_per_m3 * gravity_m_per_s2
+    force = unit_weight * head
+    first_moment *= unit_weight
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_pressure = np.where(wetted_area > 0, force / wetted_area, 0.0)
+        centre = np.where(
+            force[:, None] > 0, first_moment / force[:, None], np.nan
+        )
+    lever = first_moment - force[:, None] * np.asarray(moment_point)
+    return {
+        "wetted_area_m2": wetted_area,
+        "mean_pressure_pa": mean_pressure,
+        "force_n": force[:, None] * normal,
+        "moment_n_m": np.cross(lever, normal),
+        "centre_of_pressure_m": centre,
+    }
+
+
+def panel_loads(loads, panels, panel_count=None):
+    """
+    Sum facet loads into panel loads.
+
+    Args:
+        loads: Result of facet_loads
+        panels: Panel index of each facet
+        panel_count: Number of panels (default: largest index + 1)
+
+    Returns:
+        Dictionary with wetted_area_m2 (panels,), force_n (panels, 3)
+        and moment_n_m (panels, 3)
+    """
+    if panel_count is None:
+        panel_count = panels.max() + 1
+
+    def total(values):
+        return np.bincount(panels, values, minlength=panel_count)
+
+    return {
+        "wetted_area_m2": total(loads["wetted_area_m2"]),
+        "force_n": np.stack(
+            [total(loads["force_n"][:, k]) for k in range(3)], axis=1
+        ),
+        "moment_n_m": np.stack(
+            [total(loads["moment_n_m"][:, k]) for k in range(3)], axis=1
+        ),
+    }
+
+
+if __name__ == "__main__":
+    import os
+    import shutil
+    import tempfile
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Box tank of ch3_oil_tank.py, closed, with oil 4 m deep
+    tank_length_m = 10.0
+    tank_width_m = 4.0
+    tank_height_m = 6.0
+    oil_density_kg_per_m3 = 900.0
+    oil_level_m = 4.0
+
+    # Spherical tank meshed with about a million facets
+    sphere_radius_m = 5.0
+    sphere_divisions = 707  # Latitude and longitude bands
+    sphere_fill_levels_m = (-2.5, 0.0, 2.5)  # Centre of the sphere at 0
+
+    # =========================================================================
+    # MESH FILES
+    # =========================================================================
+
+    # Box faces as quadrilaterals, anticlockwise seen from outside
+    corners = np.array(
+        [
+            [x, y, z]
+            for z in (0.0, tank_height_m)
+            for y in (0.0, tank_width_m)
+            for x in (0.0, tank_length_m)
+        ]
+    )
+    box_faces = {
+        "bottom": [0, 2, 3, 1],
+        "top": [4, 5, 7, 6],
+        "end_aft": [0, 4, 6, 2],
+        "end_fore": [1, 3, 7, 5],
+        "side_port": [2, 6, 7, 3],
+        "side_starboard": [0, 1, 5, 4],
+    }
+
+    # Sphere: latitude-longitude grid split into triangles
+    polar = np.linspace(0.0, np.pi, sphere_divisions + 1)
+    azimuth = np.linspace(0.0, 2 * np.pi, sphere_divisions + 1)
+    polar, azimuth = np.meshgrid(polar, azimuth, indexing="ij")
+    grid = sphere_radius_m * np.stack(
+        [
+            np.sin(polar) * np.cos(azimuth),
+            np.sin(polar) * np.sin(azimuth),
+            np.cos(polar),
+        ],
+        axis=-1,
+    )
+    a, b = grid[:-1, :-1], grid[1:, :-1]
+    c, d = grid[1:, 1:], grid[:-1, 1:]
+    sphere = np.concatenate(
+        [
+            np.stack([a, b, c], axis=2).reshape(-1, 3, 3),
+            np.stack([a, c, d], axis=2).reshape(-1, 3, 3),
+        ]
+    )
+    sphere = sphere[
+        np.linalg.norm(
+            np.cross(sphere[:, 1] - sphere[:, 0], sphere[:, 2] - sphere[:, 0]),
+            axis=1,
+        )
+        > 0
+    ]
+
+    mesh_dir = tempfile.mkdtemp(prefix="tank_meshes_")
+    obj_path = os.path.join(mesh_dir, "box.obj")
+    ascii_path = os.path.join(mesh_dir, "box.stl")
+    binary_path = os.path.join(mesh_dir, "sphere.stl")
+
+    with open(obj_path, "w") as mesh:
+        mesh.writelines(f"v {x} {y} {z}\n" for x, y, z in corners)
+        for name, face in box_faces.items():
+            mesh.write(f"g {name}\nf " + " ".join(str(i + 1) for i in face))
+            mesh.write("\n")
+
+    with open(ascii_path, "w") as mesh:
+        for name, face in box_faces.items():
+            mesh.write(f"solid {name}\n")
+            for fan in ((0, 1, 2), (0, 2, 3)):
+                mesh.write("facet normal 0 0 0\nouter loop\n")
+                for corner in fan:
+                    x, y, z = corners[face[corner]]
+                    mesh.write(f"vertex {x} {y} {z}\n")
+                mesh.write("endloop\nendfacet\n")
+            mesh.write(f"endsolid {name}\n")
+
+    records = np.zeros(len(sphere), dtype=STL_RECORD)
+    records["vertices"] = sphere
+    with open(binary_path, "wb") as mesh:
+        mesh.write(b"sphere".ljust(80))
+        np.array([len(sphere)], dtype="<u4").tofile(mesh)
+        records.tofile(mesh)
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    obj_box = read_obj(obj_path)
+    stl_box = read_stl(ascii_path)
+    start_time_s = time.perf_counter()
+    sphere_mesh = mesh_geometry(read_stl(binary_path)[0])
+    read_time_s = time.perf_counter() - start_time_s
+    shutil.rmtree(mesh_dir)
+
+    box_panels = {}
+    for label, (triangles, panels, names) in (
+        ("OBJ", obj_box),
+        ("ASCII STL", stl_box),
+    ):
+        loads = facet_loads(
+            triangles, oil_level_m, oil_density_kg_per_m3, (0, 0, 0)
+        )
+        box_panels[label] = (
+            names,
+            panel_loads(loads, panels, len(names)),
+            loads["force_n"].sum(axis=0),
+        )
+
+    oil_weight_n = (
+        oil_density_kg_per_m3
+        * GRAVITY_M_PER_S2
+        * tank_length_m
+        * tank_width_m
+        * oil_level_m
+    )
+    end_plate_exact_n = (
+        oil_density_kg_per_m3 * GRAVITY_M_PER_S2 * oil_level_m**2 / 2
+    ) * tank_width_m
+
+    sphere_results = []
+    for level in sphere_fill_levels_m:
+        start_time_s = time.perf_counter()
+        loads = facet_loads(sphere_mesh, level)
+        elapsed_time_s = time.perf_counter() - start_time_s
+        depth = level + sphere_radius_m
+        cap_volume_m3 = np.pi * depth**2 * (3 * sphere_radius_m - depth) / 3
+        sphere_results.append(
+            (
+                level,
+                loads["force_n"].sum(axis=0)[2],
+                -1000 * GRAVITY_M_PER_S2 * cap_volume_m3,
+                elapsed_time_s,
+            )
+        )
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(f"Closed box tank, {oil_level_m:.0f} m of oil:")
+    for label, (names, panels, net_force_n) in box_panels.items():
+        print(f"  {label}:")
+        for name, force in zip(names, panels["force_n"]):
+            print(
+                f"    {name:<15}: "
+                + ", ".join(f"{value / 1e3:9.1f}" for value in force)
+                + " kN"
+            )
+        print(
+            f"    Net force      : {net_force_n[2] / 1e3:,.1f} kN "
+            f"(oil weight {-oil_weight_n / 1e3:,.1f} kN)"
+        )
+    print(
+        f"  End plate exact: ρ g h² b / 2 = {end_plate_exact_n / 1e3:.1f} kN"
+    )
+    print()
+    print(
+        f"Spherical tank, {len(sphere_mesh['area_m2']):,} facets read from "
+        f"binary STL and prepared in {read_time_s * 1000:.0f} ms:"
+    )
+    for level, net_force_n, exact_n, elapsed_time_s in sphere_results:
+        print(
+            f"  Level {level:+.1f} m: net force {net_force_n / 1e3:,.2f} kN "
+            f"(ρ g V_cap = {exact_n / 1e3:,.2f} kN) in "
+            f"{elapsed_time_s * 1000:.0f} ms"
+        )
@@ -0,0 +1,305 @@
+"""
+Streaming Tide-Record Pipeline for Dock Gate Loads
+
+Runs the dock gate thrust of ch3_hydrostatic_dock_gate.py over
+multi-year water-level logs. The logs are read in fixed-size chunks,
+from CSV text or from raw binary / .npy files (memory mapped), so the
+memory used stays the same however long the record is. Each chunk goes
+through the gate_thrust kernel of ch3_hydrostatic_kernel.py and is
+reduced straight away to:
+
+    - the rolling maximum net thrust over a trailing window (e.g. the
+      last 24 hours), carried across chunk boundaries and reported at a
+      fixed interval (e.g. hourly),
+    - the number of samples above each thrust threshold,
+    - a histogram of net thrust on fixed bin edges,
+    - the overall peak with its centre of pressure.
+
+Missing samples (NaN) are skipped. Water levels are depths above the
+gate sill in m; forces are in N.
+"""
+
+import itertools
+
+import numpy as np
+from scipy.ndimage import maximum_filter1d
+
+from ch3_hydrostatic_kernel import SEAWATER_DENSITY_KG_PER_M3, gate_thrust
+
+# =============================================================================
+# CHUNKED READERS
+# =============================================================================
+
+
+def iter_csv_levels(
+    path, columns=(1, 2), chunk_size=500_000, delimiter=",", skip_header=1
+):
+    """
+    Read water levels from a CSV log in chunks of rows.
+
+    Args:
+        path: CSV file, one sample per row
+        columns: Column indices of the (upstream, downstream) levels
+        chunk_size: Rows per chunk
+        delimiter: Field delimiter
+        skip_header: Header lines to skip
+
+    Yields:
+        Arrays of shape (rows, 2) with upstream and downstream levels (m)
+    """
+    with open(path) as log:
+        for _ in range(skip_header):
+            next(log)
+        while True:
+            lines = list(itertools.islice(log, chunk_size))
+            if not lines:
+                return
+            yield np.loadtxt(
+                lines, delimiter=delimiter, usecols=columns, ndmin=2
+            )
+
+
+def iter_binary_levels(
+    path, field_count=2, dtype=np.float32, chunk_size=2**20
+):
+    """
+    Read water levels from a binary log in chunks, with memory mapping.
+
+    Args:
+        path: A .npy file of shape (samples, field_count), or a raw file
+            of dtype records with field_count values per sample
+        field_count: Values per sample, upstream and downstream first
+        dtype: Data type of a raw file
+        chunk_size: Samples per chunk
+
+    Yields:
+        Arrays of shape (samples, 2) with upstream and downstream
+        levels (m)
+    """
+    if str(path).endswith(".npy"):
+        levels = np.load(path, mmap_mode="r")
+    else:
+        levels = np.memmap(path, dtype=dtype, mode="r").reshape(
+            -1, field_count
+        )
+    for start in range(0, len(levels), chunk_size):
+        yield np.asarray(levels[start : start + chunk_size, :2], dtype=float)
+
+
+# =============================================================================
+# STREAMING STATISTICS
+# =============================================================================
+
+
+def tide_gate_statistics(
+    chunks,
+    gate_width_m,
+    window_samples=86_400,
+    report_every=3_600,
+    thresholds_n=(),
+    histogram_edges_n=None,
+    density_kg_per_m3=SEAWATER_DENSITY_KG_PER_M3,
+):
+    """
+    Reduce a stream of water-level chunks to gate load statistics.
+
+    Args:
+        chunks: Iterable of (samples, 2) arrays of upstream and
+            downstream depths above the sill, e.g. from iter_csv_levels
+            or iter_binary_levels
+        gate_width_m: Gate width (m)
+        window_samples: Samples in the trailing rolling-maximum window
+            (86,400 = 1 day at 1 Hz)
+        report_every: Keep the rolling maximum every n samples, so the
+            output stays small however long the record is
+        thresholds_n: Net thrust thresholds for exceedance counts (N)
+        histogram_edges_n: Bin edges of the net thrust histogram (N)
+        density_kg_per_m3: Water density on both sides (kg/m³)
+
+    Returns:
+        Dictionary with:
+            sample_count: Samples read (including missing ones)
+            rolling_max_thrust_n: Maximum net thrust over the trailing
+                window, at every report_every-th sample (NaN while the
+                window holds only missing samples)
+            rolling_max_sample: Sample index of each of those values
+            exceedance_counts: Samples above each threshold
+            histogram_counts, histogram_edges_n: Net thrust histogram
+            max_thrust_n, max_thrust_sample: Peak net thrust and where
+            centre_of_pressure_at_max_m: Its height above the sill
+            min_thrust_n: Largest reverse (negative) net thrust
+    """
+    thresholds_n = np.asarray(thresholds_n, dtype=float)
+    if histogram_edges_n is None:
+        histogram_edges_n = np.linspace(-5e6, 15e6, 41)
+    histogram_edges_n = np.asarray(histogram_edges_n, dtype=float)
+
+    exceedance_counts = np.zeros(thresholds_n.size, dtype=np.int64)
+    histogram_counts = np.zeros(histogram_edges_n.size - 1, dtype=np.int64)
+    rolling_maxima, rolling_samples = [], []
+    # The last window_samples - 1 thrusts carry the window into the next
+    # chunk; -inf stands for "no sample" (before the record or missing)
+    carried = np.full(window_samples - 1, -np.inf)
+    max_thrust, max_sample, max_centre = -np.inf, -1, np.nan
+    min_thrust = np.inf
+    sample_count = 0
+
+    for levels in chunks:
+        loads = gate_thrust(
+            levels[:, 0], levels[:, 1], gate_width_m, density_kg_per_m3
+        )
+        thrust = loads["net_thrust_n"]
+        valid = ~np.isnan(thrust)
+
+        # Trailing rolling maximum: maximum_filter1d over the carried
+        # tail plus this chunk, shifted so each window ends at its sample
+        extended = np.concatenate([carried, np.where(valid, thrust, -np.inf)])
+        rolling = maximum_filter1d(
+            extended, window_samples, origin=(window_samples - 1) // 2
+        )[carried.size :]
+        carried = extended[extended.size - carried.size :]
+        sample = sample_count + np.arange(thrust.size)
+        reported = (sample + 1) % report_every == 0
+        rolling_maxima.append(rolling[reported])
+        rolling_samples.append(sample[reported])
+
+        exceedance_counts += (thrust[:, None] > thresholds_n).sum(axis=0)
+        histogram_counts += np.histogram(thrust[valid], histogram_edges_n)[0]
+
+        if valid.any():
+            peak = np.nanargmax(thrust)
+            if thrust[peak] > max_thrust:
+                max_thrust = thrust[peak]
+                max_sample = sample_count + peak
+                max_centre = loads["centre_of_pressure_m"][peak]
+            min_thrust = min(min_thrust, np.nanmin(thrust))
+        sample_count += thrust.size
+
+    rolling_maxima = np.concatenate([[]] + rolling_maxima)
+    return {
+        "sample_count": sample_count,
+        "rolling_max_thrust_n": np.where(
+            np.isneginf(rolling_maxima), np.nan, rolling_maxima
+        ),
+        "rolling_max_sample": np.concatenate(
+            [np.zeros(0, dtype=np.int64)] + rolling_samples
+        ),
+        "exceedance_counts": exceedance_counts,
+        "histogram_counts": histogram_counts,
+        "histogram_edges_n": histogram_edges_n,
+        "max_thrust_n": max_thrust,
+        "max_thrust_sample": max_sample,
+        "centre_of_pressure_at_max_m": max_centre,
+        "min_thrust_n": min_thrust,
+    }
+
+
+if __name__ == "__main__":
+    import os
+    import shutil
+    import tempfile
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    gate_width_m = 12.0  # Dock gate of ch3_hydrostatic_dock_gate.py (m)
+    dock_level_m = 9.0  # Impounded dock depth above the sill (m)
+    mean_tide_m = 5.0  # Mean tide depth above the sill (m)
+    tidal_amplitude_m = 3.5  # M2 tide amplitude (m)
+    m2_period_s = 12.42 * 3600  # M2 tidal period (s)
+    surge_std_m = 0.3  # Random surge / seiche standard deviation (m)
+
+    csv_days = 3  # Days of 1 Hz samples in the CSV log
+    binary_days = 90  # Days of 1 Hz samples in the binary log
+    thresholds_n = (2e6, 3e6, 4.5e6)  # Exceedance thresholds (N)
+
+    # =========================================================================
+    # SYNTHETIC 1 Hz GAUGE LOGS
+    # =========================================================================
+
+    def gauge_record(start_s, sample_count, rng):
+        time_s = start_s + np.arange(sample_count)
+        tide = mean_tide_m + tidal_amplitude_m * np.sin(
+            2 * np.pi * time_s / m2_period_s
+        )
+        tide += rng.normal(0, surge_std_m, sample_count)
+        dock = np.full(sample_count, dock_level_m)
+        return time_s, dock, tide
+
+    rng = np.random.default_rng(19)
+    log_dir = tempfile.mkdtemp(prefix="tide_logs_")
+    csv_path = os.path.join(log_dir, "gauge.csv")
+    binary_path = os.path.join(log_dir, "gauge.f32")
+
+    time_s, dock, tide = gauge_record(0, csv_days * 86_400, rng)
+    tide[rng.choice(tide.size, 100, replace=False)] = np.nan  # Dropouts
+    np.savetxt(
+        csv_path,
+        np.column_stack([time_s, dock, tide]),
+        fmt=("%d", "%.3f", "%.3f"),
+        delimiter=",",
+        header="time_s,dock_m,tide_m",
+        comments="",
+    )
+
+    # The binary log is written one day at a time, like a gauge would
+    with open(binary_path, "wb") as log:
+        for day in range(binary_days):
+            _, dock, tide = gauge_record(day * 86_400, 86_400, rng)
+            np.column_stack([dock, tide]).astype(np.float32).tofile(log)
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    start_time_s = time.perf_counter()
+    csv_stats = tide_gate_statistics(
+        iter_csv_levels(csv_path), gate_width_m, thresholds_n=thresholds_n
+    )
+    csv_time_s = time.perf_counter() - start_time_s
+
+    start_time_s = time.perf_counter()
+    binary_stats = tide_gate_statistics(
+        iter_binary_levels(binary_path),
+        gate_width_m,
+        thresholds_n=thresholds_n,
+    )
+    binary_time_s = time.perf_counter() - start_time_s
+    shutil.rmtree(log_dir)
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    for name, stats, elapsed_s in (
+        ("CSV", csv_stats, csv_time_s),
+        ("Binary", binary_stats, binary_time_s),
+    ):
+        print(
+            f"{name} log: {stats['sample_count']:,} samples in "
+            f"{elapsed_s:.2f} s"
+        )
+        print(
+            f"  Peak net thrust : {stats['max_thrust_n'] / 1e6:.3f} MN at "
+            f"sample {stats['max_thrust_sample']:,}, "
+            f"{stats['centre_of_pressure_at_max_m']:.3f} m above the sill"
+        )
+        print(
+            f"  24 h rolling max: "
+            + ", ".join(
+                f"{value / 1e6:.2f}"
+                for value in stats["rolling_max_thrust_n"][::6][:8]
+            )
+            + " MN ..."
+        )
+        print(
+            "  Exceedances     : "
+            + ", ".join(
+                f"> {threshold / 1e6:g} MN: {count:,}"
+                for threshold, count in zip(
+                    thresholds_n, stats["exceedance_counts"]
+                )
+            )
+        )
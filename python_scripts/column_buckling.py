@@ -0,0 +1,310 @@
+"""
+Column Buckling and Slenderness Checker
+
+Uses the radius of gyration k = (I_na / total_A) ** 0.5 of
+I-beam_calc.py and section_properties.py to check struts against the
+Euler and Rankine-Gordon buckling loads:
+
+    Euler:          P_e = π² E A / (Le / k)²
+    Rankine-Gordon: P_r = σ_c A / (1 + a (Le / k)²)
+
+with the effective length Le = K L set by the end conditions. Sections,
+lengths, end conditions and loads are broadcast against each other, so
+a whole catalogue can be checked against every strut length at once and
+the lightest adequate section picked for each strut.
+
+Units: A in mm², k in mm, lengths in m, E in GPa, stresses in MPa and
+loads in kN (compression positive).
+"""
+
+import numpy as np
+
+from section_properties import HEIGHT, SIGN, WIDTH, section_properties
+
+# Theoretical effective length factors K for the classic end conditions
+EFFECTIVE_LENGTH_FACTORS = {
+    "pinned_pinned": 1.0,
+    "fixed_free": 2.0,
+    "fixed_pinned": 0.7,
+    "fixed_fixed": 0.5,
+}
+
+# =============================================================================
+# LEAST RADIUS OF GYRATION
+# =============================================================================
+
+
+def least_radius_of_gyration(parts):
+    """
+    Least radius of gyration of sections built with section_properties.py.
+
+    The k_mm of section_properties is about the horizontal neutral axis;
+    I-sections usually buckle about the vertical axis instead. Every
+    rectangle is taken as centred on the vertical axis, as the plates
+    built by i_section_parts are.
+
+    Args:
+        parts: Parts array of shape (sections, parts, 4) or (parts, 4)
+
+    Returns:
+        Array of min(k_major, k_minor), one value per section (mm)
+    """
+    parts = np.asarray(parts, dtype=float)
+    width = parts[..., WIDTH]
+    height = parts[..., HEIGHT]
+    sign = parts[..., SIGN]
+
+    area = (sign * width * height).sum(axis=-1)
+    i_minor = (sign * height * width**3 / 12).sum(axis=-1)
+    k_major = section_properties(parts)["k_mm"]
+    return np.minimum(k_major, np.sqrt(i_minor / area))
+
+
+# =============================================================================
+# BUCKLING LOADS
+# =============================================================================
+
+
+def effective_length_factor(end_conditions):
+    """
+    Effective length factors for end-condition names or numbers.
+
+    Args:
+        end_conditions: A name from EFFECTIVE_LENGTH_FACTORS, a number,
+            or an array of either
+
+    Returns:
+        Array of K values with the shape of end_conditions
+    """
+    conditions = np.asarray(end_conditions)
+    if conditions.dtype.kind in "iuf":
+        return conditions.astype(float)
+
+    names, inverse = np.unique(conditions, return_inverse=True)
+    unknown = set(names.tolist()) - EFFECTIVE_LENGTH_FACTORS.keys()
+    if unknown:
+        raise ValueError(f"Unknown end condition(s): {sorted(unknown)}")
+    factors = np.array([EFFECTIVE_LENGTH_FACTORS[name] for name in names])
+    return factors[inverse].reshape(conditions.shape)
+
+
+def buckling_check(
+    area_mm2,
+    k_mm,
+    length_m,
+    end_condition="pinned_pinned",
+    axial_load_kn=0.0,
+    young_modulus_gpa=200.0,
+    crushing_stress_mpa=320.0,
+    rankine_constant=None,
+    safety_factor=1.0,
+):
+    """
+    Euler and Rankine-Gordon loads, slenderness and utilization.
+
+    All arguments are broadcast together, so (sections, 1) properties
+    with (1, lengths) lengths give a full sections × lengths grid.
+
+    Args:
+        area_mm2: Cross-sectional area (mm²)
+        k_mm: Least radius of gyration (mm)
+        length_m: Actual strut length (m)
+        end_condition: End-condition name(s) or K factor(s)
+        axial_load_kn: Applied compressive load (kN)
+        young_modulus_gpa: Young's modulus (GPa)
+        crushing_stress_mpa: Crushing (yield) stress σ_c (MPa)
+        rankine_constant: Rankine constant a; defaults to the theoretical
+            σ_c / (π² E), for which P_r = 1 / (1 / P_e + 1 / (σ_c A))
+        safety_factor: Factor applied to the applied load
+
+    Returns:
+        Dictionary of arrays:
+            effective_length_m: K L
+            slenderness: Le / k
+            euler_load_kn: Euler critical load
+            rankine_load_kn: Rankine-Gordon critical load
+            critical_load_kn: Lesser of the two
+            utilization: Factored load / critical load (≤ 1 passes)
+    """
+    area_mm2 = np.asarray(area_mm2, dtype=float)
+    young_modulus_mpa = np.asarray(young_modulus_gpa, dtype=float) * 1e3
+    if rankine_constant is None:
+        rankine_constant = crushing_stress_mpa / (np.pi**2 * young_modulus_mpa)
+
+    effective_length_m = effective_length_factor(end_condition) * length_m
+    slenderness = effective_length_m * 1e3 / np.asarray(k_mm, dtype=float)
+
+    # N/mm² × mm² = N, divided by 1000 for kN
+    euler_load_kn = (
+        np.pi**2 * young_modulus_mpa * area_mm2 / slenderness**2 / 1e3
+    )
+    rankine_load_kn = (
+        crushing_stress_mpa
+        * area_mm2
+        / (1 + rankine_constant * slenderness**2)
+        / 1e3
+    )
+    critical_load_kn = np.minimum(euler_load_kn, rankine_load_kn)
+
+    return {
+        "effective_length_m": effective_length_m,
+        "slenderness": slenderness,
+        "euler_load_kn": euler_load_kn,
+        "rankine_load_kn": rankine_load_kn,
+        "critical_load_kn": critical_load_kn,
+        "utilization": safety_factor * axial_load_kn / critical_load_kn,
+    }
+
+
+# =============================================================================
+# CATALOGUE SIZING
+# =============================================================================
+
+
+def lightest_adequate_sections(
+    properties,
+    length_m,
+    axial_load_kn,
+    end_condition="pinned_pinned",
+    max_slenderness=180.0,
+    **check_options,
+):
+    """
+    Pick the lightest catalogue section for every strut in one pass.
+
+    Args:
+        properties: Section records with area_mm2, k_mm and
+            mass_kg_per_m fields, shape (sections,), e.g. the
+            "properties" array of section_catalogue.py
+        length_m: Strut lengths, shape (struts,) (m)
+        axial_load_kn: Strut loads, shape (struts,) (kN)
+        end_condition: End condition(s), scalar or shape (struts,)
+        max_slenderness: Largest allowed Le / k
+        **check_options: Passed on to buckling_check
+
+    Returns:
+        Tuple (section_index, utilization, slenderness), each of shape
+        (struts,); section_index is -1 where no section is adequate
+    """
+    # Check every section against every strut with sections sorted by
+    # mass, so the first adequate row is the lightest
+    order = np.argsort(properties["mass_kg_per_m"], kind="stable")
+    grid = buckling_check(
+        np.asarray(properties["area_mm2"])[order, None],
+        np.asarray(properties["k_mm"])[order, None],
+        np.asarray(length_m, dtype=float)[None, :],
+        np.asarray(end_condition)[None, ...],
+        np.asarray(axial_load_kn, dtype=float)[None, :],
+        **check_options,
+    )
+    adequate = (grid["utilization"] <= 1.0) & (
+        grid["slenderness"] <= max_slenderness
+    )
+
+    first = np.argmax(adequate, axis=0)
+    struts = np.arange(first.size)
+    found = adequate[first, struts]
+    section_index = np.where(found, order[first], -1)
+    utilization = np.where(found, grid["utilization"][first, struts], np.nan)
+    slenderness = np.where(found, grid["slenderness"][first, struts], np.nan)
+    return section_index, utilization, slenderness
+
+
+if __name__ == "__main__":
+    import time
+
+    from section_catalogue import STEEL_DENSITY_KG_PER_M3
+    from section_catalogue import standard_plate_girders
+    from section_properties import i_section_parts
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Strut using the I-beam of I-beam_calc.py
+    strut_length_m = 6.0  # Strut length (m)
+    strut_load_kn = 1500.0  # Applied compressive load (kN)
+    young_modulus_gpa = 200.0  # Young's modulus of steel (GPa)
+    crushing_stress_mpa = 320.0  # Crushing stress of mild steel (MPa)
+    safety_factor = 2.0  # Factor on the applied load
+
+    # Struts of a structure to size from the catalogue
+    strut_count = 500
+    length_range_m = (2.0, 12.0)
+    load_range_kn = (50.0, 3000.0)
+
+    # =========================================================================
+    # SINGLE STRUT, ALL END CONDITIONS
+    # =========================================================================
+
+    beam_parts = i_section_parts(300, 20, 560, 12)
+    beam = section_properties(beam_parts)
+    beam_k_mm = least_radius_of_gyration(beam_parts)
+    single = buckling_check(
+        beam["area_mm2"],
+        beam_k_mm,
+        strut_length_m,
+        list(EFFECTIVE_LENGTH_FACTORS),
+        strut_load_kn,
+        young_modulus_gpa,
+        crushing_stress_mpa,
+        safety_factor=safety_factor,
+    )
+
+    # =========================================================================
+    # CATALOGUE × STRUT SIZING
+    # =========================================================================
+
+    names, parts = standard_plate_girders()
+    catalogue = section_properties(parts)
+    catalogue["k_mm"] = least_radius_of_gyration(parts)
+    catalogue["mass_kg_per_m"] = (
+        catalogue["area_mm2"] * 1e-6 * STEEL_DENSITY_KG_PER_M3
+    )
+
+    rng = np.random.default_rng(13)
+    lengths_m = rng.uniform(*length_range_m, strut_count)
+    loads_kn = rng.uniform(*load_range_kn, strut_count)
+    end_conditions = rng.choice(list(EFFECTIVE_LENGTH_FACTORS), strut_count)
+
+    start_time_s = time.perf_counter()
+    section_index, utilization, slenderness = lightest_adequate_sections(
+        catalogue,
+        lengths_m,
+        loads_kn,
+        end_conditions,
+        young_modulus_gpa=young_modulus_gpa,
+        crushing_stress_mpa=crushing_stress_mpa,
+        safety_factor=safety_factor,
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(
+        f"I-beam_calc section (least k = {beam_k_mm[0]:.1f} mm), "
+        f"L = {strut_length_m} m, P = {strut_load_kn:.0f} kN:"
+    )
+    for index, name in enumerate(EFFECTIVE_LENGTH_FACTORS):
+        print(
+            f"  {name:<14}: Le/k = {single['slenderness'][index]:6.1f}, "
+            f"Euler {single['euler_load_kn'][index]:8,.0f} kN, "
+            f"Rankine {single['rankine_load_kn'][index]:6,.0f} kN, "
+            f"utilization {single['utilization'][index]:.2f}"
+        )
+    print()
+    print(
+        f"{len(names):,} sections × {strut_count} struts sized in "
+        f"{elapsed_time_s * 1000:.1f} ms"
+    )
+    print(f"  Struts with no adequate section: {(section_index < 0).sum()}")
+    for strut in np.flatnonzero(section_index >= 0)[:3]:
+        print(
+            f"  Strut {strut}: L = {lengths_m[strut]:.2f} m, "
+            f"{end_conditions[strut]}, P = {loads_kn[strut]:,.0f} kN -> "
+            f"{names[section_index[strut]]} "
+            f"(utilization {utilization[strut]:.2f}, "
+            f"Le/k = {slenderness[strut]:.0f})"
+        )
@@ -0,0 +1,249 @@
+"""
+Continuous Beam Solver (Three-Moment Equation)
+
+Solves beams continuous over many supports, such as deck stringers and
+pipe racks, with Clapeyron's three-moment equation. For every interior
+support i, with span i on its left and span i + 1 on its right:
+
+    M(i-1) L(i)/EI(i) + 2 M(i) [L(i)/EI(i) + L(i+1)/EI(i+1)]
+        + M(i+1) L(i+1)/EI(i+1) = -6 A(i) a(i) / (L(i) EI(i))
+                                  - 6 A(i+1) b(i+1) / (L(i+1) EI(i+1))
+
+where A a / L and A b / L are the free bending moment diagram terms of
+each span. The equations form a tridiagonal system that is solved in
+O(n) with a banded solver, for many load cases at once. The span
+stiffness EI can come straight from section_properties.py.
+
+Units: lengths in m, loads in kN (UDLs in kN/m), moments in kN·m
+(sagging positive), EI in kN·m². Both end supports are simple supports.
+"""
+
+import numpy as np
+from scipy.linalg import solve_banded
+
+# =============================================================================
+# STIFFNESS FROM SECTION PROPERTIES
+# =============================================================================
+
+
+def flexural_rigidity(young_modulus_gpa, i_na_mm4):
+    """
+    Convert E (GPa) and I_na (mm⁴) from section_properties.py to EI.
+
+    Returns:
+        EI in kN·m²
+    """
+    return np.asarray(young_modulus_gpa) * 1e6 * np.asarray(i_na_mm4) * 1e-12
+
+
+# =============================================================================
+# THREE-MOMENT SOLVER
+# =============================================================================
+
+
+def solve_continuous_beam(
+    span_lengths,
+    span_rigidities,
+    udls=None,
+    point_loads=None,
+    stations_per_span=21,
+):
+    """
+    Support moments, reactions and span moments of a continuous beam.
+
+    Args:
+        span_lengths: Length of each span, shape (n,) (m)
+        span_rigidities: EI of each span, shape (n,) or scalar (kN·m²)
+        udls: Full-span UDL on each span, shape (n,) or (cases, n)
+            (kN/m)
+        point_loads: Tuple (span_index (k,), distance from the left
+            support of that span (k,), load (k,) or (cases, k)) (kN)
+        stations_per_span: Stations per span for the span moments
+
+    Returns:
+        Dictionary with arrays for every load case (the leading cases
+        axis is dropped when all loads are one-dimensional):
+            support_moment_kn_m: Moments over the n + 1 supports
+            reaction_kn: Reactions at the n + 1 supports
+            station_m: Stations measured from the first support
+            moment_kn_m: Bending moment at every station
+            max_span_moment_kn_m: Maximum moment in each span (negative,
+                i.e. hogging, where the span never sags)
+    """
+    lengths = np.asarray(span_lengths, dtype=float)
+    span_count = lengths.size
+    flexibility = lengths / np.broadcast_to(span_rigidities, span_count)
+
+    single_case = True
+    udl = np.zeros((1, span_count))
+    if udls is not None:
+        udl = np.asarray(udls, dtype=float)
+        single_case &= udl.ndim == 1
+        udl = np.atleast_2d(udl)
+
+    if point_loads is None:
+        point_span = np.zeros(0, dtype=int)
+        point_position = point_value = np.zeros((1, 0))
+    else:
+        point_span, point_position, point_value = point_loads
+        point_span = np.asarray(point_span, dtype=int)
+        point_position = np.asarray(point_position, dtype=float)[None, :]
+        point_value = np.asarray(point_value, dtype=float)
+        single_case &= point_value.ndim == 1
+        point_value = np.atleast_2d(point_value)
+
+    case_count = max(udl.shape[0], point_value.shape[0])
+    udl = np.broadcast_to(udl, (case_count, span_count))
+    point_value = np.broadcast_to(point_value, (case_count, point_span.size))
+
+    # Free bending moment terms 6 A a / L (right end) and 6 A b / L (left
+    # end) of every span: w L³ / 4 for a UDL and P a b (L ± a) / L for a
+    # point load a from the left and b from the right support
+    # (summed per span with a load-to-span incidence matrix)
+    incidence = np.zeros((point_span.size, span_count))
+    incidence[np.arange(point_span.size), point_span] = 1.0
+    span_of_load = lengths[point_span][None, :]
+    a = point_position
+    b = span_of_load - a
+    right_term = (
+        udl * lengths**3 / 4
+        + (point_value * a * b * (span_of_load + a) / span_of_load) @ incidence
+    )
+    left_term = (
+        udl * lengths**3 / 4
+        + (point_value * a * b * (span_of_load + b) / span_of_load) @ incidence
+    )
+
+    # Tridiagonal three-moment system for the interior supports
+    interior_count = span_count - 1
+    support_moment = np.zeros((case_count, span_count + 1))
+    if interior_count > 0:
+        banded = np.zeros((3, interior_count))
+        banded[0, 1:] = flexibility[1:-1]  # Super-diagonal
+        banded[1] = 2 * (flexibility[:-1] + flexibility[1:])  # Diagonal
+        banded[2, :-1] = flexibility[1:-1]  # Sub-diagonal
+        rhs = -(
+            right_term[:, :-1] * flexibility[:-1] / lengths[:-1]
+            + left_term[:, 1:] * flexibility[1:] / lengths[1:]
+        )
+        support_moment[:, 1:-1] = solve_banded((1, 1), banded, rhs.T).T
+
+    # End shears of every span: free reactions plus the moment gradient
+    total_udl = udl * lengths
+    free_left = total_udl / 2 + (point_value * b / span_of_load) @ incidence
+    free_right = total_udl / 2 + (point_value * a / span_of_load) @ incidence
+    moment_gradient = np.diff(support_moment, axis=1) / lengths
+    left_shear = free_left + moment_gradient
+    right_shear = free_right - moment_gradient
+
+    reaction = np.zeros((case_count, span_count + 1))
+    reaction[:, :-1] += left_shear
+    reaction[:, 1:] += right_shear
+
+    # Span moments: free moment plus the line joining the support moments
+    fraction = np.linspace(0, 1, stations_per_span)
+    x_local = lengths[:, None] * fraction[None, :]
+    moment = (
+        udl[:, :, None] * x_local * (lengths[:, None] - x_local) / 2
+        + support_moment[:, :-1, None] * (1 - fraction)
+        + support_moment[:, 1:, None] * fraction
+    )
+    for index in range(point_span.size):
+        span, position = point_span[index], a[0, index]
+        length = lengths[span]
+        free = np.where(
+            x_local[span] <= position,
+            x_local[span] * (length - position) / length,
+            position * (length - x_local[span]) / length,
+        )
+        moment[:, span] += point_value[:, index, None] * free
+
+    support_positions = np.concatenate([[0.0], np.cumsum(lengths)])
+    results = {
+        "support_moment_kn_m": support_moment,
+        "reaction_kn": reaction,
+        "station_m": (support_positions[:-1, None] + x_local).ravel(),
+        "moment_kn_m": moment.reshape(case_count, -1),
+        "max_span_moment_kn_m": moment.max(axis=2),
+    }
+    if single_case:
+        results = {
+            name: value if name == "station_m" else value[0]
+            for name, value in results.items()
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import time
+
+    from section_properties import i_section_parts, section_properties
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    span_count = 400  # Number of spans of the pipe rack stringer
+    span_length_m = 6.0  # Length of each span (m)
+    young_modulus_gpa = 200.0  # Young's modulus of steel (GPa)
+    dead_load_kn_per_m = 4.0  # Permanent load on every span (kN/m)
+    live_load_kn_per_m = 6.0  # Live load for pattern loading (kN/m)
+    pattern_count = 200  # Random live-load patterns
+
+    # =========================================================================
+    # SECTION STIFFNESS (I-beam of I-beam_calc.py)
+    # =========================================================================
+
+    section = section_properties(i_section_parts(300, 20, 560, 12))
+    stringer_ei = flexural_rigidity(young_modulus_gpa, section["i_na_mm4"][0])
+
+    # =========================================================================
+    # TWO-SPAN CHECK (M = -wL²/8, R = 3wL/8, 10wL/8, 3wL/8)
+    # =========================================================================
+
+    check = solve_continuous_beam(
+        [span_length_m, span_length_m],
+        stringer_ei,
+        udls=[dead_load_kn_per_m, dead_load_kn_per_m],
+    )
+
+    # =========================================================================
+    # MULTI-SPAN PATTERN LOADING
+    # =========================================================================
+
+    rng = np.random.default_rng(2)
+    lengths_m = np.full(span_count, span_length_m)
+    patterns = rng.random((pattern_count, span_count)) < 0.5
+    udls_kn_per_m = dead_load_kn_per_m + live_load_kn_per_m * patterns
+
+    start_time_s = time.perf_counter()
+    beam = solve_continuous_beam(lengths_m, stringer_ei, udls=udls_kn_per_m)
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(f"Stringer EI            : {stringer_ei:,.0f} kN·m²")
+    print("Two equal spans, UDL:")
+    print(
+        f"  Centre support moment: "
+        f"{check['support_moment_kn_m'][1]:.3f} kN·m "
+        f"(-wL²/8 = {-dead_load_kn_per_m * span_length_m**2 / 8:.3f})"
+    )
+    print(
+        "  Reactions            : "
+        + ", ".join(f"{value:.2f}" for value in check["reaction_kn"])
+        + " kN"
+    )
+    print()
+    print(
+        f"{span_count} spans × {pattern_count} load patterns solved in "
+        f"{elapsed_time_s * 1000:.1f} ms"
+    )
+    print(
+        f"  Worst support moment : "
+        f"{beam['support_moment_kn_m'].min():.2f} kN·m"
+    )
+    print(f"  Worst span moment    : {beam['moment_kn_m'].max():.2f} kN·m")
+    print(f"  Worst reaction       : {beam['reaction_kn'].max():.2f} kN")
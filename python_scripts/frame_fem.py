@@ -0,0 +1,413 @@
+"""
+2-D Frame Finite-Element Solver with Banded Storage
+
+Combines bending and axial stiffness in plane frames such as portal
+frames and crane booms. Each member is an Euler-Bernoulli beam element
+with three degrees of freedom per node (u, v, θ); the section area and
+second moment of area come from section_properties.py. The global
+stiffness matrix is assembled in sparse form, the nodes are renumbered
+with the reverse Cuthill-McKee algorithm to minimize the bandwidth, and
+the free degrees of freedom are factorized once with a banded Cholesky
+decomposition. Any number of load cases is then solved against that one
+factorization.
+
+Units: coordinates in m, E in GPa, A in mm², I in mm⁴, forces in kN,
+moments in kN·m; displacements in m and rotations in rad.
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.linalg import cho_solve_banded, cholesky_banded
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+DOF_PER_NODE = 3
+
+# =============================================================================
+# ELEMENT MATRICES
+# =============================================================================
+
+
+def element_matrices(nodes, elements, young_modulus_gpa, area_mm2, i_na_mm4):
+    """
+    Local stiffness and rotation matrices of every beam element.
+
+    Args:
+        nodes: Node coordinates, shape (n, 2) (m)
+        elements: Node index pairs, shape (e, 2)
+        young_modulus_gpa: E of each element, scalar or shape (e,)
+        area_mm2: Cross-sectional area of each element (mm²)
+        i_na_mm4: Second moment of area of each element (mm⁴)
+
+    Returns:
+        Tuple (local_stiffness, rotation), each of shape (e, 6, 6)
+    """
+    element_count = len(elements)
+    vectors = nodes[elements[:, 1]] - nodes[elements[:, 0]]
+    length = np.linalg.norm(vectors, axis=1)
+    cos, sin = vectors[:, 0] / length, vectors[:, 1] / length
+
+    # EA in kN and EI in kN·m² from GPa, mm² and mm⁴
+    ea = np.broadcast_to(
+        young_modulus_gpa * np.asarray(area_mm2), length.shape
+    )
+    ei = np.broadcast_to(
+        young_modulus_gpa * 1e-6 * np.asarray(i_na_mm4), length.shape
+    )
+
+    axial = ea / length
+    k1 = 12 * ei / length**3
+    k2 = 6 * ei / length**2
+    k3 = 4 * ei / length
+    k4 = 2 * ei / length
+
+    local = np.zeros((element_count, 6, 6))
+    local[:, 0, 0] = local[:, 3, 3] = axial
+    local[:, 0, 3] = local[:, 3, 0] = -axial
+    local[:, 1, 1] = local[:, 4, 4] = k1
+    local[:, 1, 4] = local[:, 4, 1] = -k1
+    local[:, 1, 2] = local[:, 2, 1] = local[:, 1, 5] = local[:, 5, 1] = k2
+    local[:, 2, 4] = local[:, 4, 2] = local[:, 4, 5] = local[:, 5, 4] = -k2
+    local[:, 2, 2] = local[:, 5, 5] = k3
+    local[:, 2, 5] = local[:, 5, 2] = k4
+
+    rotation = np.zeros((element_count, 6, 6))
+    for offset in (0, 3):
+        rotation[:, offset, offset] = cos
+        rotation[:, offset, offset + 1] = sin
+        rotation[:, offset + 1, offset] = -sin
+        rotation[:, offset + 1, offset + 1] = cos
+        rotation[:, offset + 2, offset + 2] = 1.0
+
+    return local, rotation
+
+
+# =============================================================================
+# ASSEMBLY AND FACTORIZATION
+# =============================================================================
+
+
+def _half_bandwidth(matrix):
+    """Largest |i - j| over the non-zero entries of a sparse matrix."""
+    coo = matrix.tocoo()
+    if coo.nnz == 0:
+        return 0
+    return int(np.abs(coo.row - coo.col).max())
+
+
+def factorize_frame(
+    nodes, elements, supports, young_modulus_gpa, area_mm2, i_na_mm4
+):
+    """
+    Assemble, renumber and factorize a plane frame.
+
+    Args:
+        nodes: Node coordinates, shape (n, 2) (m)
+        elements: Node index pairs, shape (e, 2)
+        supports: Restrained degrees of freedom, shape (r, 2), each row
+            (node index, dof) with dof 0 = u, 1 = v, 2 = θ
+        young_modulus_gpa: E of each element (GPa)
+        area_mm2: Area of each element (mm²)
+        i_na_mm4: Second moment of area of each element (mm⁴)
+
+    Returns:
+        Tuple (solve, half_bandwidth, original_half_bandwidth). solve
+        takes nodal loads of shape (n, 3) or (cases, n, 3) as (Fx, Fy, M)
+        and returns a dictionary with displacement (…, n, 3), reaction
+        (…, n, 3) and element_forces (…, e, 6) holding the local end
+        forces (N1, V1, M1, N2, V2, M2) of every element.
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    elements = np.asarray(elements, dtype=int)
+    supports = np.asarray(supports, dtype=int).reshape(-1, 2)
+    node_count = len(nodes)
+    dof_count = DOF_PER_NODE * node_count
+
+    local, rotation = element_matrices(
+        nodes, elements, young_modulus_gpa, area_mm2, i_na_mm4
+    )
+    global_stiffness = np.swapaxes(rotation, 1, 2) @ local @ rotation
+
+    # Renumber the nodes with reverse Cuthill-McKee on the node graph
+    adjacency = sparse.coo_matrix(
+        (np.ones(len(elements)), (elements[:, 0], elements[:, 1])),
+        shape=(node_count, node_count),
+    )
+    adjacency = (adjacency + adjacency.T).tocsr()
+    new_order = reverse_cuthill_mckee(adjacency, symmetric_mode=True)
+    new_node_number = np.empty(node_count, dtype=int)
+    new_node_number[new_order] = np.arange(node_count)
+
+    def element_dofs(node_numbers):
+        return (
+            DOF_PER_NODE * node_numbers[elements][:, :, None]
+            + np.arange(DOF_PER_NODE)
+        ).reshape(-1, 6)
+
+    # Sparse assembly with the renumbered degrees of freedom
+    dofs = element_dofs(new_node_number)
+    stiffness = sparse.coo_matrix(
+        (
+            global_stiffness.ravel(),
+            (
+                np.repeat(dofs, 6, axis=1).ravel(),
+                np.tile(dofs, (1, 6)).ravel(),
+            ),
+        ),
+        shape=(dof_count, dof_count),
+    ).tocsr()
+
+    original_dofs = element_dofs(np.arange(node_count))
+    original_half_bandwidth = int(
+        np.abs(original_dofs[:, :, None] - original_dofs[:, None, :]).max()
+    )
+
+    # Free degrees of freedom keep their renumbered (banded) order
+    restrained = np.zeros(dof_count, dtype=bool)
+    restrained[
+        DOF_PER_NODE * new_node_number[supports[:, 0]] + supports[:, 1]
+    ] = True
+    free = np.flatnonzero(~restrained)
+    free_stiffness = stiffness[free][:, free].tocoo()
+    half_bandwidth = _half_bandwidth(free_stiffness)
+
+    # Upper banded storage: ab[u + i - j, j] = K[i, j] for i ≤ j
+    upper = free_stiffness.row <= free_stiffness.col
+    banded = np.zeros((half_bandwidth + 1, free.size))
+    banded[
+        half_bandwidth + free_stiffness.row[upper] - free_stiffness.col[upper],
+        free_stiffness.col[upper],
+    ] = free_stiffness.data[upper]
+    try:
+        factor = cholesky_banded(banded)
+    except np.linalg.LinAlgError as error:
+        raise ValueError(
+            "Frame is a mechanism (matrix not positive definite)"
+        ) from error
+
+    # Map between original node-major dofs and renumbered dofs
+    renumbered = (
+        DOF_PER_NODE * new_node_number[:, None] + np.arange(DOF_PER_NODE)
+    ).ravel()
+
+    def solve(loads):
+        loads = np.asarray(loads, dtype=float)
+        single_case = loads.ndim == 2
+        loads = loads.reshape(-1, dof_count)
+        case_count = loads.shape[0]
+
+        load_vectors = np.zeros((dof_count, case_count))
+        load_vectors[renumbered] = loads.T
+
+        displacement = np.zeros((dof_count, case_count))
+        displacement[free] = cho_solve_banded(
+            (factor, False), load_vectors[free]
+        )
+
+        # Reactions: K u - F at every dof (zero away from the supports)
+        reaction = stiffness @ displacement - load_vectors
+        reaction[~restrained] = 0.0
+
+        displacement = displacement[renumbered].T.reshape(case_count, -1, 3)
+        reaction = reaction[renumbered].T.reshape(case_count, -1, 3)
+        element_displacement = displacement.reshape(case_count, -1)[
+            :, original_dofs
+        ]
+        element_forces = np.einsum(
+            "eij,ejk,cek->cei", local, rotation, element_displacement
+        )
+
+        results = {
+            "displacement": displacement,
+            "reaction": reaction,
+            "element_forces": element_forces,
+        }
+        if single_case:
+            results = {name: value[0] for name, value in results.items()}
+        return results
+
+    return solve, half_bandwidth, original_half_bandwidth
+
+
+def portal_frame_grid(
+    bay_count, storey_count, bay_width, storey_height, divisions
+):
+    """
+    Build a multi-bay, multi-storey rigid frame with fixed column bases.
+
+    Args:
+        bay_count: Number of bays
+        storey_count: Number of storeys
+        bay_width: Bay width (m)
+        storey_height: Storey height (m)
+        divisions: Elements along every column and beam
+
+    Returns:
+        Tuple (nodes, elements, supports, is_column) with is_column True
+        for column elements
+    """
+    columns = bay_count + 1
+    levels = storey_count + 1
+
+    # Joint nodes at the beam-column intersections
+    joint_x, joint_y = np.meshgrid(
+        np.arange(columns) * bay_width, np.arange(levels) * storey_height
+    )
+    joints = np.column_stack([joint_x.ravel(), joint_y.ravel()])
+    joint_index = np.arange(columns * levels).reshape(levels, columns)
+
+    node_list = [joints]
+    element_list = []
+    column_flags = []
+    next_node = len(joints)
+    fractions = np.arange(1, divisions) / divisions
+
+    def add_member(start, end, is_column):
+        nonlocal next_node
+        starts, ends = joints[start], joints[end]
+        interior = (
+            starts[:, None, :]
+            + fractions[None, :, None] * (ends - starts)[:, None, :]
+        )
+        interior_index = next_node + np.arange(
+            interior.shape[0] * (divisions - 1)
+        ).reshape(-1, divisions - 1)
+        next_node += interior_index.size
+        node_list.append(interior.reshape(-1, 2))
+        chain = np.column_stack([start, interior_index, end])
+        element_list.append(
+            np.stack([chain[:, :-1], chain[:, 1:]], axis=-1).reshape(-1, 2)
+        )
+        column_flags.append(np.full(chain.shape[0] * divisions, is_column))
+
+    add_member(joint_index[:-1].ravel(), joint_index[1:].ravel(), True)
+    add_member(
+        joint_index[1:, :-1].ravel(), joint_index[1:, 1:].ravel(), False
+    )
+
+    nodes = np.concatenate(node_list)
+    elements = np.concatenate(element_list)
+    base = joint_index[0]
+    supports = np.column_stack(
+        [np.repeat(base, 3), np.tile(np.arange(3), base.size)]
+    )
+    return nodes, elements, supports, np.concatenate(column_flags)
+
+
+if __name__ == "__main__":
+    import time
+
+    from section_properties import i_section_parts, section_properties
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    young_modulus_gpa = 200.0  # Young's modulus of steel (GPa)
+    column_height_m = 6.0  # Cantilever column check height (m)
+    tip_load_kn = 10.0  # Horizontal load at the column top (kN)
+
+    bay_count = 20  # Bays of the large frame
+    storey_count = 25  # Storeys of the large frame
+    bay_width_m = 6.0  # Bay width (m)
+    storey_height_m = 3.5  # Storey height (m)
+    divisions = 10  # Elements per member
+    floor_load_kn = 15.0  # Vertical load at every beam node (kN)
+    wind_load_kn = 20.0  # Horizontal load at every left-column joint (kN)
+
+    # =========================================================================
+    # SECTIONS (I-beam_calc.py beam, heavier column)
+    # =========================================================================
+
+    sections = section_properties(
+        i_section_parts([300, 350], [20, 25], [560, 350], [12, 15])
+    )
+    beam_area, column_area = sections["area_mm2"]
+    beam_i, column_i = sections["i_na_mm4"]
+
+    # =========================================================================
+    # CANTILEVER CHECK (tip deflection PL³ / 3EI)
+    # =========================================================================
+
+    check_nodes = np.column_stack(
+        [np.zeros(11), np.linspace(0, column_height_m, 11)]
+    )
+    check_elements = np.column_stack([np.arange(10), np.arange(1, 11)])
+    check_solve, _, _ = factorize_frame(
+        check_nodes,
+        check_elements,
+        [[0, 0], [0, 1], [0, 2]],
+        young_modulus_gpa,
+        column_area,
+        column_i,
+    )
+    check_loads = np.zeros((11, 3))
+    check_loads[-1, 0] = tip_load_kn
+    tip_deflection_m = check_solve(check_loads)["displacement"][-1, 0]
+    column_ei = young_modulus_gpa * 1e-6 * column_i
+    exact_deflection_m = tip_load_kn * column_height_m**3 / (3 * column_ei)
+
+    # =========================================================================
+    # LARGE MULTI-STOREY FRAME WITH SHUFFLED NODE NUMBERS
+    # =========================================================================
+
+    nodes, elements, supports, is_column = portal_frame_grid(
+        bay_count, storey_count, bay_width_m, storey_height_m, divisions
+    )
+    shuffle = np.random.default_rng(4).permutation(len(nodes))
+    inverse = np.argsort(shuffle)
+    nodes, elements = nodes[shuffle], inverse[elements]
+    supports[:, 0] = inverse[supports[:, 0]]
+
+    start_time_s = time.perf_counter()
+    solve, half_bandwidth, original_half_bandwidth = factorize_frame(
+        nodes,
+        elements,
+        supports,
+        young_modulus_gpa,
+        np.where(is_column, column_area, beam_area),
+        np.where(is_column, column_i, beam_i),
+    )
+    factor_time_s = time.perf_counter() - start_time_s
+
+    # Load cases: gravity, wind, and gravity plus wind
+    on_beam = np.isin(np.arange(len(nodes)), elements[~is_column])
+    on_beam &= nodes[:, 1] > 0
+    windward = (nodes[:, 0] == 0) & (nodes[:, 1] > 0)
+    windward &= np.isclose(nodes[:, 1] % storey_height_m, 0)
+    loads = np.zeros((3, len(nodes), 3))
+    loads[0, on_beam, 1] = -floor_load_kn
+    loads[1, windward, 0] = wind_load_kn
+    loads[2] = loads[0] + loads[1]
+
+    start_time_s = time.perf_counter()
+    results = solve(loads)
+    solve_time_s = time.perf_counter() - start_time_s
+
+    beam_end_moments = results["element_forces"][2][~is_column][:, [2, 5]]
+    max_beam_moment_kn_m = np.abs(beam_end_moments).max()
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print("Cantilever column check:")
+    print(f"  FE tip deflection   : {tip_deflection_m * 1000:.4f} mm")
+    print(f"  PL³/3EI             : {exact_deflection_m * 1000:.4f} mm")
+    print()
+    print(f"Frame: {len(nodes):,} nodes, {len(elements):,} elements")
+    print(
+        f"  Half-bandwidth      : {original_half_bandwidth:,} as numbered, "
+        f"{half_bandwidth:,} after reverse Cuthill-McKee"
+    )
+    print(f"  Factorization time  : {factor_time_s:.2f} s")
+    print(f"  Solve time (3 cases): {solve_time_s * 1000:.1f} ms")
+    print(
+        f"  Max sway (wind)     : "
+        f"{results['displacement'][1, :, 0].max() * 1000:.2f} mm"
+    )
+    print(
+        f"  Base reactions (Fy) : "
+        f"{results['reaction'][0, :, 1].sum():,.0f} kN for "
+        f"{-loads[0, :, 1].sum():,.0f} kN of gravity load"
+    )
+    print(f"  Max beam moment     : {max_beam_moment_kn_m:,.1f} kN·m")
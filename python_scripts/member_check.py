@@ -0,0 +1,145 @@
+"""
+Batch Member Check: Stress, Strain, Elongation and Factor of Safety
+
+Applies the "Stress and Strain", "Hooke's Law" and "Factor of Safety"
+formulas of Applied Mechanics Formulae.qmd to whole arrays of members:
+
+    σ = F / A,    ε = σ / E,    δ = ε L = F L / (A E),
+    FOS = breaking stress / working stress
+
+Member forces from the crane force solvers (ch1_crane_force_solver.py,
+ch1_crane_sweep.py, ch1_truss_solver.py) go straight in, together with
+areas, lengths and material properties, and every member is checked in
+one vectorized pass.
+
+Units: forces in kN (tension positive), areas in mm², lengths in m, E in
+GPa, stresses in MPa and elongations in mm.
+"""
+
+import numpy as np
+
+# =============================================================================
+# MEMBER CHECK
+# =============================================================================
+
+
+def member_check(
+    force_kn,
+    area_mm2,
+    length_m,
+    young_modulus_gpa=200.0,
+    breaking_stress_mpa=430.0,
+    target_fos=None,
+):
+    """
+    Stress, strain, elongation and factor of safety of many members.
+
+    All arguments are broadcast against each other, so one section or
+    material can be shared by every member, or forces of shape
+    (cases, members) checked against (members,) properties.
+
+    Args:
+        force_kn: Axial member force(s) (kN, tension positive)
+        area_mm2: Cross-sectional area(s) (mm²)
+        length_m: Member length(s) (m)
+        young_modulus_gpa: Young's modulus (GPa)
+        breaking_stress_mpa: Breaking (ultimate) stress (MPa)
+        target_fos: Smallest acceptable factor of safety, or None
+
+    Returns:
+        Dictionary of arrays:
+            stress_mpa: σ = F / A (tension positive)
+            strain: ε = σ / E
+            elongation_mm: δ = ε L (shortening negative)
+            fos: Breaking stress / |working stress| (inf when unloaded,
+                NaN for a NaN force, e.g. an invalid solver geometry)
+            below_target: True where fos is below target_fos or NaN
+                (only when target_fos is set)
+    """
+    force_kn, area_mm2, length_m, young_modulus_gpa = (
+        np.asarray(value, dtype=float)
+        for value in (force_kn, area_mm2, length_m, young_modulus_gpa)
+    )
+    if np.any(area_mm2 <= 0):
+        raise ValueError("Member areas must be positive")
+
+    # kN / mm² = 1000 N/mm² = 1000 MPa
+    stress_mpa = force_kn * 1e3 / area_mm2
+    strain = stress_mpa / (young_modulus_gpa * 1e3)
+    elongation_mm = strain * length_m * 1e3
+
+    with np.errstate(divide="ignore"):
+        fos = breaking_stress_mpa / np.abs(stress_mpa)
+
+    results = {
+        "stress_mpa": stress_mpa,
+        "strain": strain,
+        "elongation_mm": elongation_mm,
+        "fos": fos,
+    }
+    if target_fos is not None:
+        # A NaN force fails the check instead of slipping through
+        results["below_target"] = ~(fos >= target_fos)
+    return results
+
+
+if __name__ == "__main__":
+    import time
+
+    from ch1_crane_force_solver import calculate_forces
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Crane of example_jibs3.py with the tie length swept
+    post_length_m = 8.0  # Vertical post (m)
+    jib_length_m = 13.0  # Jib length (m)
+    load_force_kn = 20.0  # Applied load (kN)
+    tie_lengths_m = np.linspace(5, 20, 1_000_001)  # Tie lengths (m)
+
+    jib_area_mm2 = 1_200.0  # Jib tube area (mm²)
+    tie_area_mm2 = 300.0  # Tie rod area (mm²)
+    young_modulus_gpa = 200.0  # Young's modulus of steel (GPa)
+    breaking_stress_mpa = 430.0  # Ultimate tensile stress of steel (MPa)
+    target_fos = 4.0  # Required factor of safety
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    force_in_jib, force_in_tie, *_, valid = calculate_forces(
+        post_length_m, jib_length_m, tie_lengths_m, load_force_kn
+    )
+
+    # Jib in compression, tie in tension; both members in one batch
+    start_time_s = time.perf_counter()
+    check = member_check(
+        np.stack([-force_in_jib[valid], force_in_tie[valid]]),
+        np.array([[jib_area_mm2], [tie_area_mm2]]),
+        np.stack([np.full(valid.sum(), jib_length_m), tie_lengths_m[valid]]),
+        young_modulus_gpa,
+        breaking_stress_mpa,
+        target_fos,
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(
+        f"{2 * valid.sum():,} member checks in {elapsed_time_s * 1000:.1f} ms"
+    )
+    for index, member in enumerate(("Jib", "Tie")):
+        worst = np.argmin(check["fos"][index])
+        print(
+            f"{member}: lowest FOS {check['fos'][index, worst]:.2f} "
+            f"at tie length {tie_lengths_m[valid][worst]:.3f} m "
+            f"(σ = {check['stress_mpa'][index, worst]:.1f} MPa, "
+            f"δ = {check['elongation_mm'][index, worst]:.3f} mm)"
+        )
+        print(
+            f"     {check['below_target'][index].sum():,} geometries "
+            f"below FOS {target_fos}"
+        )
@@ -0,0 +1,279 @@
+"""
+Moving-Load Envelope for Crane Runway and Gantry Beams
+
+Steps a train of wheel loads across a simply supported beam and returns
+the maximum and minimum bending moment and shear at every station,
+following the beam formulas of Applied Mechanics Formulae.qmd.
+
+The influence lines of every station are sampled once on a grid with
+the same step as the train. Moving the train by one step then only
+shifts each wheel one grid point along the influence line, so the
+effect of the train at every position is a sum of shifted slices (one
+per wheel) of the same influence-line array, with no recomputation of
+the beam for each position.
+
+Units: positions in m, wheel loads in kN (downward positive), shear in
+kN and bending moment in kN·m (sagging positive). Shear is the value
+just to the right of the station, as in beam_shear_moment.py.
+"""
+
+import numpy as np
+
+# =============================================================================
+# INFLUENCE LINES
+# =============================================================================
+
+
+def influence_lines(stations, load_positions, span):
+    """
+    Moment and shear influence lines of a simply supported beam.
+
+    Args:
+        stations: Section positions, shape (s,) (m)
+        load_positions: Positions of the unit load, shape (p,) (m)
+        span: Beam length (m)
+
+    Returns:
+        Tuple (moment, shear) of arrays of shape (s, p): the bending
+        moment (kN·m) and shear (kN) at each station for a unit load
+        (kN) at each position
+    """
+    x = np.asarray(stations, dtype=float)[:, None]
+    p = np.asarray(load_positions, dtype=float)[None, :]
+    left = p <= x
+
+    moment = np.where(left, p * (span - x), x * (span - p)) / span
+    shear = np.where(left, -p, span - p) / span
+    return moment, shear
+
+
+# =============================================================================
+# MOVING-LOAD ENVELOPE
+# =============================================================================
+
+
+def _train_effects(influence, offsets, loads, pad):
+    """
+    Effect of the train at every lead position as shifted slices.
+
+    Args:
+        influence: Influence lines zero-padded by pad on both ends,
+            shape (s, pad + grid + pad)
+        offsets: Grid steps of each wheel behind the lead wheel, (k,)
+        loads: Wheel loads, shape (k,) (kN)
+        pad: Padding in grid steps
+
+    Returns:
+        Array of shape (s, grid + pad), one column per lead position
+    """
+    position_count = influence.shape[1] - pad
+    effect = np.zeros((influence.shape[0], position_count))
+    for offset, load in zip(offsets, loads):
+        start = pad - offset
+        effect += load * influence[:, start : start + position_count]
+    return effect
+
+
+def moving_load_envelope(
+    span,
+    axle_offsets,
+    axle_loads,
+    step=0.01,
+    stations=None,
+    both_directions=True,
+    chunk_size=256,
+):
+    """
+    Moment and shear envelopes of a wheel train crossing a beam.
+
+    Args:
+        span: Beam length (m)
+        axle_offsets: Distance of each wheel behind the lead wheel,
+            shape (k,) (m); rounded to the nearest step
+        axle_loads: Wheel loads, shape (k,) (kN)
+        step: Increment by which the train advances (m)
+        stations: Positions to report, shape (s,) (m); rounded to the
+            nearest step (default: every 1/100 of the span)
+        both_directions: Also run the train in the opposite direction
+        chunk_size: Stations processed at a time, to bound memory
+
+    Returns:
+        Dictionary with arrays of shape (s,):
+            station_m: Stations after rounding to the grid
+            max_moment_kn_m, min_moment_kn_m: Moment envelope
+            max_shear_kn, min_shear_kn: Shear envelope
+            max_moment_lead_m: Lead wheel position giving max moment
+        plus the absolute maximum moment:
+            absolute_max_moment_kn_m, absolute_max_moment_at_m
+    """
+    offsets = np.asarray(axle_offsets, dtype=float)
+    loads = np.asarray(axle_loads, dtype=float)
+    if offsets.shape != loads.shape:
+        raise ValueError("axle_offsets and axle_loads must match in shape")
+    if np.any(offsets < 0):
+        raise ValueError("axle_offsets must be measured behind the lead")
+
+    # Grid of load positions with a whole number of steps on the span
+    interval_count = max(1, int(round(span / step)))
+    step = span / interval_count
+    grid = np.arange(interval_count + 1) * step
+    if stations is None:
+        stations = np.linspace(0, span, 101)
+    station_index = np.clip(
+        np.round(np.asarray(stations, dtype=float) / step).astype(int),
+        0,
+        interval_count,
+    )
+
+    offset_steps = np.round(offsets / step).astype(int)
+    pad = int(offset_steps.max())
+    trains = [(offset_steps, loads)]
+    if both_directions:
+        trains.append((pad - offset_steps, loads))
+
+    # Lead wheel positions: from entering at x = 0 until the last wheel
+    # leaves at x = span
+    lead_m = np.arange(interval_count + 1 + pad) * step
+
+    envelope = {
+        name: np.empty(station_index.size)
+        for name in (
+            "max_moment_kn_m",
+            "min_moment_kn_m",
+            "max_shear_kn",
+            "min_shear_kn",
+            "max_moment_lead_m",
+        )
+    }
+
+    for start in range(0, station_index.size, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        moment_il, shear_il = influence_lines(
+            grid[station_index[chunk]], grid, span
+        )
+        moment_il = np.pad(moment_il, ((0, 0), (pad, pad)))
+        shear_il = np.pad(shear_il, ((0, 0), (pad, pad)))
+
+        max_moment = min_moment = max_shear = min_shear = None
+        for train_offsets, train_loads in trains:
+            moment = _train_effects(moment_il, train_offsets, train_loads, pad)
+            shear = _train_effects(shear_il, train_offsets, train_loads, pad)
+            lead = np.argmax(moment, axis=1)
+            peak = moment[np.arange(moment.shape[0]), lead]
+            if max_moment is None:
+                max_moment, max_lead = peak, lead
+                min_moment = moment.min(axis=1)
+                max_shear, min_shear = shear.max(axis=1), shear.min(axis=1)
+                continue
+            better = peak > max_moment
+            max_moment = np.where(better, peak, max_moment)
+            max_lead = np.where(better, lead, max_lead)
+            min_moment = np.minimum(min_moment, moment.min(axis=1))
+            max_shear = np.maximum(max_shear, shear.max(axis=1))
+            min_shear = np.minimum(min_shear, shear.min(axis=1))
+
+        envelope["max_moment_kn_m"][chunk] = max_moment
+        envelope["min_moment_kn_m"][chunk] = min_moment
+        envelope["max_shear_kn"][chunk] = max_shear
+        envelope["min_shear_kn"][chunk] = min_shear
+        envelope["max_moment_lead_m"][chunk] = lead_m[max_lead]
+
+    station_m = grid[station_index]
+    peak_index = np.argmax(envelope["max_moment_kn_m"])
+    return {
+        "station_m": station_m,
+        **envelope,
+        "absolute_max_moment_kn_m": envelope["max_moment_kn_m"][peak_index],
+        "absolute_max_moment_at_m": station_m[peak_index],
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    from beam_shear_moment import shear_moment_diagram
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    runway_span_m = 60.0  # Length of the runway beam (m)
+    step_m = 0.01  # Increment of the train position (m)
+    station_count = 601  # Stations for the envelopes
+
+    # Two overhead cranes in tandem, four wheels each on this runway. The
+    # wheel load is the 20 kN hoisted load of example_jibs3.py plus crane
+    # self weight, shared between the wheels
+    wheel_offsets_m = np.array([0.0, 1.5, 4.5, 6.0, 9.0, 10.5, 13.5, 15.0])
+    wheel_loads_kn = np.array([48.0, 48.0, 36.0, 36.0] * 2)
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    stations_m = np.linspace(0, runway_span_m, station_count)
+
+    start_time_s = time.perf_counter()
+    envelope = moving_load_envelope(
+        runway_span_m,
+        wheel_offsets_m,
+        wheel_loads_kn,
+        step=step_m,
+        stations=stations_m,
+    )
+    elapsed_time_s = time.perf_counter() - start_time_s
+    position_count = int(round(runway_span_m / step_m)) + int(
+        round(wheel_offsets_m.max() / step_m)
+    )
+
+    # Check the worst position by a direct calculation with the wheels
+    # placed on the beam
+    peak_at_m = envelope["absolute_max_moment_at_m"]
+    peak_station = np.flatnonzero(envelope["station_m"] == peak_at_m)[0]
+    lead_m = envelope["max_moment_lead_m"][peak_station]
+    train_length_m = wheel_offsets_m.max()
+    check_moments = []
+    for positions_m in (
+        lead_m - wheel_offsets_m,
+        lead_m - train_length_m + wheel_offsets_m,
+    ):
+        on_beam = (positions_m >= 0) & (positions_m <= runway_span_m)
+        check_moments.append(
+            np.interp(
+                peak_at_m,
+                stations_m,
+                shear_moment_diagram(
+                    stations_m,
+                    runway_span_m,
+                    point_loads=(
+                        positions_m[on_beam],
+                        wheel_loads_kn[on_beam],
+                    ),
+                )["moment_kn_m"],
+            )
+        )
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(
+        f"{wheel_loads_kn.size} wheels × {position_count:,} positions × "
+        f"{station_count} stations in {elapsed_time_s * 1000:.1f} ms"
+    )
+    print(
+        f"Absolute maximum moment : "
+        f"{envelope['absolute_max_moment_kn_m']:,.1f} kN·m "
+        f"at x = {peak_at_m:.2f} m (lead wheel at {lead_m:.2f} m)"
+    )
+    print(f"Direct check at that position: {max(check_moments):,.1f} kN·m")
+    print(
+        f"Maximum shear           : {envelope['max_shear_kn'].max():,.1f} kN"
+    )
+    print(
+        f"Minimum shear           : {envelope['min_shear_kn'].min():,.1f} kN"
+    )
+    print(
+        f"Midspan moment envelope : "
+        f"{envelope['max_moment_kn_m'][station_count // 2]:,.1f} kN·m"
+    )
@@ -0,0 +1,269 @@
+"""
+Indexed Steel-Section Catalogue
+
+Precomputes the properties of standard and user-defined I-sections with
+section_properties.py and stores them on disk as plain .npy files, so a
+catalogue opens instantly with memory mapping. Sections are sorted by
+depth and indexed with a merge-sort tree on I_na: every block of a
+power-of-two size keeps its sections sorted by I_na together with the
+running minimum area from the end of the block. A query such as
+"lightest section with I_na ≥ X and depth ≤ Y" then only visits
+O(log n) blocks with one binary search each, i.e. O(log² n) time.
+
+Dimensions are in millimetres and mass is in kg/m.
+"""
+
+import itertools
+import os
+
+import numpy as np
+
+from section_properties import i_section_parts, section_properties
+
+STEEL_DENSITY_KG_PER_M3 = 7850.0  # Density of structural steel
+
+# Fields stored for every section, in catalogue order (sorted by depth)
+PROPERTY_DTYPE = np.dtype(
+    [
+        ("name", "U32"),
+        ("depth_mm", "f8"),
+        ("area_mm2", "f8"),
+        ("mass_kg_per_m", "f8"),
+        ("y_bar_mm", "f8"),
+        ("i_na_mm4", "f8"),
+        ("k_mm", "f8"),
+        ("z_top_mm3", "f8"),
+        ("z_bottom_mm3", "f8"),
+    ]
+)
+
+# Files that make up a catalogue directory
+INDEX_FILES = ("properties", "tree_i_na", "tree_min_area", "tree_argmin")
+
+# =============================================================================
+# BUILDING A CATALOGUE
+# =============================================================================
+
+
+def standard_plate_girders():
+    """
+    Names and parts for welded plate girders made from standard plates.
+
+    Returns:
+        Tuple (names, parts) covering every combination of the stock
+        flange and web plate sizes below (symmetric flanges)
+    """
+    flange_widths = (150, 200, 250, 300, 350, 400, 450, 500)
+    flange_thicknesses = (10, 12, 15, 20, 25, 30, 35, 40)
+    web_heights = tuple(range(200, 1601, 50))
+    web_thicknesses = (6, 8, 10, 12, 15, 20)
+
+    combinations = np.array(
+        list(
+            itertools.product(
+                flange_widths, flange_thicknesses, web_heights, web_thicknesses
+            )
+        ),
+        dtype=float,
+    )
+    bf, tf, hw, tw = combinations.T
+    names = [
+        f"PG {h + 2 * t:.0f}x{b:.0f} {t:.0f}/{w:.0f}"
+        for b, t, h, w in combinations
+    ]
+
+    return names, i_section_parts(bf, tf, hw, tw)
+
+
+def build_catalogue(directory, names, parts):
+    """
+    Compute section properties and write an indexed catalogue to disk.
+
+    Args:
+        directory: Directory to write the catalogue files into
+        names: Section names, one per section
+        parts: Parts array of shape (sections, parts, 4), see
+            section_properties.py
+
+    Returns:
+        Number of sections written
+    """
+    results = section_properties(parts)
+    section_count = len(names)
+
+    # Properties record, sorted by depth so depth limits become prefixes
+    properties = np.empty(section_count, dtype=PROPERTY_DTYPE)
+    properties["name"] = names
+    for field in PROPERTY_DTYPE.names:
+        if field in results:
+            properties[field] = results[field]
+    properties["mass_kg_per_m"] = (
+        results["area_mm2"] * 1e-6 * STEEL_DENSITY_KG_PER_M3
+    )
+    properties = properties[
+        np.lexsort((properties["mass_kg_per_m"], properties["depth_mm"]))
+    ]
+
+    # Merge-sort tree: level L holds blocks of 2**L sections, each block
+    # sorted by I_na with the suffix minimum area (and where it occurs)
+    level_count = max(1, int(np.ceil(np.log2(section_count))) + 1)
+    tree_i_na = np.empty((level_count, section_count))
+    tree_min_area = np.empty((level_count, section_count))
+    tree_argmin = np.empty((level_count, section_count), dtype=np.int64)
+    positions = np.arange(section_count)
+    area_offset = 2 * properties["area_mm2"].max()
+
+    for level in range(level_count):
+        block = positions >> level
+        order = np.lexsort((properties["i_na_mm4"], block))
+        tree_i_na[level] = properties["i_na_mm4"][order]
+        area = properties["area_mm2"][order]
+
+        # Suffix minimum within each block: scan the reversed array with
+        # each later block offset below all earlier ones, so the running
+        # minimum restarts at every block boundary
+        reversed_block = block[::-1].max() - block[::-1]
+        key = area[::-1] - reversed_block * area_offset
+        running_min = np.minimum.accumulate(key)
+        last_min = np.maximum.accumulate(
+            np.where(key == running_min, positions, 0)
+        )
+        tree_argmin[level] = order[::-1][last_min][::-1]
+        tree_min_area[level] = properties["area_mm2"][tree_argmin[level]]
+
+    os.makedirs(directory, exist_ok=True)
+    for name, array in zip(
+        INDEX_FILES, (properties, tree_i_na, tree_min_area, tree_argmin)
+    ):
+        np.save(os.path.join(directory, f"{name}.npy"), array)
+
+    return section_count
+
+
+def load_catalogue(directory):
+    """
+    Open a catalogue with memory mapping (nothing is read until queried).
+
+    Args:
+        directory: Directory written by build_catalogue
+
+    Returns:
+        Dictionary of memory-mapped arrays keyed by INDEX_FILES names
+    """
+    return {
+        name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+        for name in INDEX_FILES
+    }
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+
+def lightest_section(catalogue, min_i_na, max_depth=np.inf):
+    """
+    Find the lightest section with I_na ≥ min_i_na and depth ≤ max_depth.
+
+    Args:
+        catalogue: Catalogue returned by load_catalogue
+        min_i_na: Required second moment of area (mm⁴)
+        max_depth: Largest allowed overall depth (mm)
+
+    Returns:
+        Properties record of the lightest section, or None if no section
+        meets both limits
+    """
+    properties = catalogue["properties"]
+    tree_i_na = catalogue["tree_i_na"]
+    tree_min_area = catalogue["tree_min_area"]
+    tree_argmin = catalogue["tree_argmin"]
+
+    # Sections allowed by the depth limit form the prefix [0, prefix)
+    prefix = int(
+        np.searchsorted(properties["depth_mm"], max_depth, side="right")
+    )
+
+    best_area = np.inf
+    best_index = -1
+    start = 0
+
+    # Split the prefix into aligned power-of-two blocks, largest first
+    for level in range(len(tree_i_na) - 1, -1, -1):
+        size = 1 << level
+        if prefix - start < size:
+            continue
+        stop = start + size
+        block_i_na = tree_i_na[level, start:stop]
+        position = start + int(np.searchsorted(block_i_na, min_i_na))
+        if position < stop and tree_min_area[level, position] < best_area:
+            best_area = tree_min_area[level, position]
+            best_index = int(tree_argmin[level, position])
+        start = stop
+
+    if best_index < 0:
+        return None
+    return properties[best_index]
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    required_i_na_mm4 = 1185e6  # Required I about neutral axis (mm⁴)
+    max_depth_mm = 700.0  # Headroom limit on overall depth (mm)
+    query_count = 10_000  # Queries for the timing check
+
+    # User-defined section: the I-beam of I-beam_calc.py
+    user_names = ["I-beam_calc 600x300"]
+    user_parts = i_section_parts(300, 20, 560, 12)
+
+    # =========================================================================
+    # BUILD AND QUERY THE CATALOGUE
+    # =========================================================================
+
+    names, parts = standard_plate_girders()
+    catalogue_dir = os.path.join(tempfile.gettempdir(), "section_catalogue")
+    section_count = build_catalogue(
+        catalogue_dir,
+        names + user_names,
+        np.concatenate([parts, user_parts]),
+    )
+
+    start_time_s = time.perf_counter()
+    catalogue = load_catalogue(catalogue_dir)
+    load_time_s = time.perf_counter() - start_time_s
+
+    best = lightest_section(catalogue, required_i_na_mm4, max_depth_mm)
+
+    rng = np.random.default_rng(3)
+    start_time_s = time.perf_counter()
+    for i_na, depth in zip(
+        rng.uniform(1e7, 1e10, query_count),
+        rng.uniform(300, 1700, query_count),
+    ):
+        lightest_section(catalogue, i_na, depth)
+    query_time_s = (time.perf_counter() - start_time_s) / query_count
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    print(f"Sections in catalogue : {section_count:,}")
+    print(f"Catalogue open time   : {load_time_s * 1000:.2f} ms")
+    print(f"Average query time    : {query_time_s * 1e6:.1f} µs")
+    print()
+    print(
+        f"Lightest section with I_na ≥ "
+        f"{required_i_na_mm4 / 1e6:.0f} × 10⁶ mm⁴ "
+        f"and depth ≤ {max_depth_mm:.0f} mm:"
+    )
+    print(f"  Section     : {best['name']}")
+    print(f"  Depth       : {best['depth_mm']:.0f} mm")
+    print(f"  Mass        : {best['mass_kg_per_m']:.1f} kg/m")
+    print(f"  I_na        : {best['i_na_mm4'] / 1e6:.1f} × 10⁶ mm⁴")
+    print(f"  k           : {best['k_mm']:.1f} mm")
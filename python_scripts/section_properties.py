@@ -0,0 +1,241 @@
+"""
+Composite Section Property Engine
+
+Array-backed version of the part-by-part table in I-beam_calc.py and
+I-beam_7_9.py. A built-up section is stored as a block of rectangles,
+each row holding (width, height, y of bottom edge, sign) with sign +1
+for plate and -1 for a hole. Many sections are stacked into one array of
+shape (sections, parts, 4) and their area, neutral axis, second moment
+of area and radius of gyration are evaluated in one vectorized pass.
+
+All dimensions are in millimetres, measured from the bottom face.
+"""
+
+import numpy as np
+
+# Column order of every rectangle row in a parts array
+WIDTH, HEIGHT, Y_BOTTOM, SIGN = range(4)
+
+# =============================================================================
+# SECTION BUILDERS
+# =============================================================================
+
+
+def i_section_parts(
+    top_flange_width,
+    top_flange_thickness,
+    web_height,
+    web_thickness,
+    bottom_flange_width=None,
+    bottom_flange_thickness=None,
+):
+    """
+    Build the parts arrays for symmetric or asymmetric I-sections.
+
+    Args:
+        top_flange_width: Top flange width(s) (mm)
+        top_flange_thickness: Top flange thickness(es) (mm)
+        web_height: Clear web height(s) between flanges (mm)
+        web_thickness: Web thickness(es) (mm)
+        bottom_flange_width: Bottom flange width(s) (mm), defaults to the
+            top flange
+        bottom_flange_thickness: Bottom flange thickness(es) (mm),
+            defaults to the top flange
+
+    Scalars and arrays are broadcast together, one section per element.
+
+    Returns:
+        Parts array of shape (sections, 3, 4) ordered bottom flange, web,
+        top flange
+    """
+    if bottom_flange_width is None:
+        bottom_flange_width = top_flange_width
+    if bottom_flange_thickness is None:
+        bottom_flange_thickness = top_flange_thickness
+
+    bf_w, bf_t, h_web, tw, tf_w, tf_t = (
+        np.ravel(value).astype(float)
+        for value in np.broadcast_arrays(
+            bottom_flange_width,
+            bottom_flange_thickness,
+            web_height,
+            web_thickness,
+            top_flange_width,
+            top_flange_thickness,
+        )
+    )
+
+    parts = np.ones((bf_w.size, 3, 4))
+    parts[:, 0, :SIGN] = np.column_stack([bf_w, bf_t, np.zeros_like(bf_t)])
+    parts[:, 1, :SIGN] = np.column_stack([tw, h_web, bf_t])
+    parts[:, 2, :SIGN] = np.column_stack([tf_w, tf_t, bf_t + h_web])
+
+    return parts
+
+
+def add_rectangles(parts, width, height, y_bottom, hole=False):
+    """
+    Append one plate or hole rectangle to every section.
+
+    Args:
+        parts: Parts array of shape (sections, parts, 4)
+        width: Rectangle width(s) (mm), zero to leave a section unchanged
+        height: Rectangle height(s) (mm)
+        y_bottom: Height(s) of the rectangle bottom edge (mm)
+        hole: True to subtract the rectangle (bolt holes, cut-outs)
+
+    Returns:
+        New parts array with one more part per section
+    """
+    sections = parts.shape[0]
+    rectangle = np.empty((sections, 1, 4))
+    rectangle[:, 0, WIDTH] = np.broadcast_to(width, sections)
+    rectangle[:, 0, HEIGHT] = np.broadcast_to(height, sections)
+    rectangle[:, 0, Y_BOTTOM] = np.broadcast_to(y_bottom, sections)
+    rectangle[:, 0, SIGN] = -1.0 if hole else 1.0
+
+    return np.concatenate([parts, rectangle], axis=1)
+
+
+# =============================================================================
+# SECTION PROPERTIES
+# =============================================================================
+
+
+def section_properties(parts):
+    """
+    Evaluate the properties of many built-up sections at once.
+
+    Args:
+        parts: Parts array of shape (sections, parts, 4) or (parts, 4)
+
+    Returns:
+        Dictionary of arrays, one value per section:
+            area_mm2: Net cross-sectional area
+            y_bar_mm: Neutral axis height above the bottom face
+            i_bottom_mm4: Second moment of area about the bottom face
+            i_na_mm4: Second moment of area about the neutral axis
+            k_mm: Radius of gyration
+            depth_mm: Overall depth
+            z_top_mm3: Elastic section modulus for the top fibre
+            z_bottom_mm3: Elastic section modulus for the bottom fibre
+    """
+    parts = np.asarray(parts, dtype=float)
+    width = parts[..., WIDTH]
+    height = parts[..., HEIGHT]
+    y_bottom = parts[..., Y_BOTTOM]
+    sign = parts[..., SIGN]
+
+    # Same columns as the table in I-beam_calc.py: A, y, A·y, A·y², Iown
+    area = sign * width * height
+    y_centroid = y_bottom + height / 2
+    sum_a = area.sum(axis=-1)
+    sum_ay = (area * y_centroid).sum(axis=-1)
+    sum_ay2 = (area * y_centroid**2).sum(axis=-1)
+    sum_i_own = (sign * width * height**3 / 12).sum(axis=-1)
+
+    y_bar = sum_ay / sum_a
+    i_bottom = sum_i_own + sum_ay2
+    i_na = i_bottom - sum_a * y_bar**2
+    depth = np.where(sign > 0, y_bottom + height, 0.0).max(axis=-1)
+
+    return {
+        "area_mm2": sum_a,
+        "y_bar_mm": y_bar,
+        "i_bottom_mm4": i_bottom,
+        "i_na_mm4": i_na,
+        "k_mm": np.sqrt(i_na / sum_a),
+        "depth_mm": depth,
+        "z_top_mm3": i_na / (depth - y_bar),
+        "z_bottom_mm3": i_na / y_bar,
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    # =========================================================================
+    # INPUT PARAMETERS
+    # =========================================================================
+
+    # Symmetric I-beam of I-beam_calc.py (mm)
+    flange_width_mm = 300
+    flange_thickness_mm = 20
+    web_height_mm = 560
+    web_thickness_mm = 12
+
+    # Asymmetric girder of I-beam_7_9.py (mm)
+    girder_top = (120, 20)  # Top flange width, thickness
+    girder_web = (180, 15)  # Web height, thickness
+    girder_bottom = (160, 30)  # Bottom flange width, thickness
+
+    catalogue_size = 100_000  # Random plate girders for the timing check
+
+    # =========================================================================
+    # CALCULATIONS
+    # =========================================================================
+
+    beam = section_properties(
+        i_section_parts(
+            flange_width_mm,
+            flange_thickness_mm,
+            web_height_mm,
+            web_thickness_mm,
+        )
+    )
+    girder = section_properties(
+        i_section_parts(*girder_top, *girder_web, *girder_bottom)
+    )
+
+    # Same beam with two 22 mm bolt holes through the bottom flange
+    holed_parts = add_rectangles(
+        i_section_parts(
+            flange_width_mm,
+            flange_thickness_mm,
+            web_height_mm,
+            web_thickness_mm,
+        ),
+        2 * 22,
+        flange_thickness_mm,
+        0,
+        hole=True,
+    )
+    holed = section_properties(holed_parts)
+
+    # Catalogue of random plate girders evaluated in one pass
+    rng = np.random.default_rng(7)
+    catalogue_parts = i_section_parts(
+        rng.uniform(150, 500, catalogue_size),
+        rng.uniform(10, 40, catalogue_size),
+        rng.uniform(300, 1500, catalogue_size),
+        rng.uniform(8, 20, catalogue_size),
+        rng.uniform(150, 500, catalogue_size),
+        rng.uniform(10, 40, catalogue_size),
+    )
+    start_time_s = time.perf_counter()
+    catalogue = section_properties(catalogue_parts)
+    elapsed_time_s = time.perf_counter() - start_time_s
+
+    # =========================================================================
+    # OUTPUT RESULTS
+    # =========================================================================
+
+    for name, result in (
+        ("I-beam_calc.py section", beam),
+        ("I-beam_7_9.py girder", girder),
+        ("I-beam with bolt holes", holed),
+    ):
+        print(name)
+        print(f"  Total area               : {result['area_mm2'][0]:8.0f} mm²")
+        print(f"  Neutral axis from bottom : {result['y_bar_mm'][0]:8.2f} mm")
+        print(
+            f"  I about neutral axis     : "
+            f"{result['i_na_mm4'][0] / 1e6:8.2f} × 10⁶ mm⁴"
+        )
+        print(f"  Radius of gyration k     : {result['k_mm'][0]:8.1f} mm")
+        print()
+
+    print(
+        f"Evaluated {catalogue_size:,} sections in "
+        f"{elapsed_time_s * 1000:.1f} ms"
+    )